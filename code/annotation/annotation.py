@@ -21,6 +21,9 @@ DEFAULT_ZONE_ALPHA = 0  # transparency for fill (0 = transparent)
 # Resize handle constants
 HANDLE_SIZE = 1  # Size of corner handles in pixels
 
+_ARROW_HEAD_RAD = math.radians(ANNOTATION_ARROW_HEAD_ANGLE)
+_NO_PEN = QPen(Qt.PenStyle.NoPen)
+
 
 class ResizeHandle(QGraphicsRectItem):
     """Small square handle for resizing objects at corners.
@@ -221,7 +224,7 @@ class ArrowAnnotationManager:
         
         length = ANNOTATION_ARROW_HEAD_LENGTH * width_scale
         
-        angle_rad = math.radians(ANNOTATION_ARROW_HEAD_ANGLE)
+        angle_rad = _ARROW_HEAD_RAD
         angle1 = angle + angle_rad
         angle2 = angle - angle_rad
         
@@ -625,7 +628,7 @@ class CustomArrowItem(QGraphicsItemGroup):
         # Create head item
         head_path = self._draw_arrow_head_triangle(start, end, head_length)
         self._head_item = QGraphicsPathItem(head_path)
-        self._head_item.setPen(QPen(Qt.PenStyle.NoPen))
+        self._head_item.setPen(_NO_PEN)
         self._head_item.setBrush(QBrush(QColor(self.arrow_color)))
         self.addToGroup(self._head_item)
 
@@ -686,7 +689,7 @@ class CustomArrowItem(QGraphicsItemGroup):
     def _draw_arrow_head_triangle(self, start, end, length):
         dx, dy = end.x() - start.x(), end.y() - start.y()
         angle = math.atan2(dy, dx)
-        angle_rad = math.radians(ANNOTATION_ARROW_HEAD_ANGLE)
+        angle_rad = _ARROW_HEAD_RAD
         angle1 = angle + angle_rad
         angle2 = angle - angle_rad
         p1 = QPointF(end.x() - length * math.cos(angle1), end.y() - length * math.sin(angle1))
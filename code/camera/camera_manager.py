@@ -328,10 +328,10 @@ class CameraManager:
         current_center = self.view.mapToScene(self.view.rect().center())
         target_center = QPointF(self.current_ball_pos[0], self.current_ball_pos[1])
         
-        distance = np.sqrt((current_center.x() - target_center.x())**2 + 
-                          (current_center.y() - target_center.y())**2)
+        distance_sq = ((current_center.x() - target_center.x())**2 +
+                       (current_center.y() - target_center.y())**2)
         
-        if distance > 1.5:
+        if distance_sq > 1.5 * 1.5:
             new_center = QPointF(
                 current_center.x() + (target_center.x() - current_center.x()) * 0.15,
                 current_center.y() + (target_center.y() - current_center.y()) * 0.15
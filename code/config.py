@@ -33,6 +33,9 @@ LEFT_PANEL_SIZE = 1200
 # Display
 SCENE_EXTRA_GRASS = 48
 LINE_WIDTH = 0.25
+PITCH_PIXMAP_MAX_SIZE = 4096  # px, longest side of the cached pitch background
+USE_OPENGL_VIEWPORT = True    # render the pitch view through QOpenGLWidget when available
+OPENGL_SAMPLES = 4            # MSAA samples for the OpenGL viewport
 
 # Zones
 GOAL_DEPTH = 2.44
@@ -44,6 +47,7 @@ GOAL_AREA_WIDTH = 18.32
 CENTER_CIRCLE_RADIUS = 9.15
 POINT_RADIUS = 0.5
 PENALTY_SPOT_DIST = 11
+PENALTY_ARC_RADIUS = 9.15
 
 
 
@@ -163,6 +167,7 @@ TIMELINE_SLIDER_HEIGHT = 24
 TIMELINE_GROOVE_HEIGHT = TIMELINE_SLIDER_HEIGHT - TIMELINE_SLIDER_HEIGHT//3
 TIMELINE_HANDLE_WIDTH = TIMELINE_GROOVE_HEIGHT // 2
 TIMELINE_HANDLE_HEIGHT = TIMELINE_GROOVE_HEIGHT + TIMELINE_GROOVE_HEIGHT//2
+TIMELINE_HOVER_INTERVAL_MS = 16  # hover preview refresh cap (~60 Hz)
 NAV_BUTTON_WIDTH = 35
 NAV_BUTTON_HEIGHT = 30
 
@@ -176,4 +181,5 @@ LENGTH_EXTRA_TIME = 2 * LENGTH_OVERTIME_HALF
 
 # Players and ball trajectories
 TRAJECTORY_STYLE = Qt.PenStyle.DotLine
-TRAJECTORY_SAMPLE_RATE = 5
\ No newline at end of file
+TRAJECTORY_SAMPLE_RATE = 5
+TRAJECTORY_ALPHA_LEVELS = 10  # fade steps when a trail is drawn as a few polylines
@@ -10,6 +10,8 @@ Responsibilities:
 - Provide time formatting helpers used in the UI
 """
 import os
+import bisect
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 from scipy.special import expit  
@@ -45,42 +47,48 @@ def get_player_color_dict(df):
 def compute_orientations(xy_data, player_ids, window_length=100, polyorder=2):
     """
     Compute and smooth player orientation (per frame).
-    Returns dict: pid -> list[angle_in_radians] across both halves.
+    Returns dict: pid -> float32 array of angles (radians) across both halves.
     """
     orientations = {pid: [] for pid in player_ids['Home'] + player_ids['Away']}
     for half in ["firstHalf", "secondHalf"]:
         for team in ["Home", "Away"]:
             xy = xy_data[half][team].xy  # shape (frames, n_players*2)
-            n_frames = xy.shape[0]
             ids = player_ids[team]
+            # raw frame-to-frame (nan-safe) differences, one column per player
+            x, y = xy[:, 0:2*len(ids):2], xy[:, 1:2*len(ids):2]
+            dx = np.diff(x, axis=0, prepend=x[:1])
+            dy = np.diff(y, axis=0, prepend=y[:1])
+            angles = np.arctan2(dy, dx)
+            # If the series is too short, skip smoothing
+            if len(angles) < window_length:
+                angles_smooth = angles
+            else:
+                # smooth cos/sin (handles wrap-around), all players in one pass
+                cos_a = savgol_filter(np.cos(angles), window_length, polyorder, axis=0, mode='nearest')
+                sin_a = savgol_filter(np.sin(angles), window_length, polyorder, axis=0, mode='nearest')
+                angles_smooth = np.arctan2(sin_a, cos_a)
+            angles_smooth = angles_smooth.astype(np.float32)
             for j, pid in enumerate(ids):
-                traj = xy[:, 2*j:2*j+2]
-                # raw frame-to-frame (nan-safe) differences
-                dx = np.diff(traj[:, 0], prepend=traj[0,0])
-                dy = np.diff(traj[:, 1], prepend=traj[0,1])
-                angles = np.arctan2(dy, dx)
-                # convert to cos/sin for smoothing angles across wrap-around
-                cos_a = np.cos(angles)
-                sin_a = np.sin(angles)
-                # If the series is too short, skip smoothing
-                if len(cos_a) < window_length:
-                    angles_smooth = angles
-                else:
-                    cos_a = savgol_filter(cos_a, window_length, polyorder, mode='nearest')
-                    sin_a = savgol_filter(sin_a, window_length, polyorder, mode='nearest')
-                    angles_smooth = np.arctan2(sin_a, cos_a)
-                orientations[pid] += list(angles_smooth)
-    return orientations
+                orientations[pid].append(angles_smooth[:, j])
+    # join the halves once per player
+    return {pid: np.concatenate(parts) for pid, parts in orientations.items()}
+
 
+def _xml_float(value):
+    """Parse an optional XML attribute as float, NaN when missing or malformed."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
 
 def extract_dsam_from_xml(file_pos, player_ids, teamid_map, n_frames_per_half):
     """
     Extract D, S, A, M per player and per half from the positions XML.
     Missing values are filled with NaN and arrays are sized to the half length.
+
+    The file is streamed with `iterparse`: each `FrameSet` is cleared once
+    consumed, so the full document tree is never held in memory.
     """
-    import xml.etree.ElementTree as ET
-    tree_pos = ET.parse(file_pos)
-    root_pos = tree_pos.getroot()
     dsam = {'Home': {}, 'Away': {}}
 
     # Initialize all entries with NaNs
@@ -88,41 +96,32 @@ def extract_dsam_from_xml(file_pos, player_ids, teamid_map, n_frames_per_half):
         for pid in player_ids[side]:
             dsam[side][pid] = {}
             for segment, n_frames in n_frames_per_half.items():
-                dsam[side][pid][segment] = {k: [np.nan]*n_frames for k in ['D', 'S', 'A', 'M']}
-
-    # Walk through the XML
-    for frameset in root_pos.findall('.//FrameSet'):
-        team_id = frameset.get('TeamId')
-        person_id = frameset.get('PersonId')
-        segment = frameset.get('GameSection', 'unknown')
-        # Determine the side (Home/Away)
-        side = None
-        for k, tid in teamid_map.items():
-            if team_id == tid:
-                side = k
-                break
-        if side is None or person_id not in player_ids[side]:
+                dsam[side][pid][segment] = {k: np.full(n_frames, np.nan) for k in ['D', 'S', 'A', 'M']}
+
+    side_by_team = {tid: side for side, tid in teamid_map.items()}
+    target, idx = None, 0
+    for event, elem in ET.iterparse(file_pos, events=('start', 'end')):
+        if event == 'start':
+            if elem.tag == 'FrameSet':
+                # Determine the side (Home/Away); frames of other sets are skipped
+                side = side_by_team.get(elem.get('TeamId'))
+                person_id = elem.get('PersonId')
+                target = None
+                if side is not None and person_id in player_ids[side]:
+                    target = dsam[side][person_id][elem.get('GameSection', 'unknown')]
+                idx = 0
             continue
-        frames = frameset.findall('Frame')
-        n_frames = len(frames)
-        for idx, fr in enumerate(frames):
-            try:
-                dsam[side][person_id][segment]['D'][idx] = float(fr.get('D', 'nan'))
-            except Exception:
-                dsam[side][person_id][segment]['D'][idx] = np.nan
-            try:
-                s_kmh = float(fr.get('S', 'nan'))
-                dsam[side][person_id][segment]['S'][idx] = s_kmh / 3.6
-            except Exception:
-                dsam[side][person_id][segment]['S'][idx] = np.nan
-            try:
-                dsam[side][person_id][segment]['A'][idx] = float(fr.get('A', 'nan'))
-            except Exception:
-                dsam[side][person_id][segment]['A'][idx] = np.nan
-            try:
-                dsam[side][person_id][segment]['M'][idx] = float(fr.get('M', 'nan'))
-            except Exception:
-                dsam[side][person_id][segment]['M'][idx] = np.nan
+        if elem.tag == 'Frame':
+            if target is not None:
+                target['D'][idx] = _xml_float(elem.get('D'))
+                target['S'][idx] = _xml_float(elem.get('S')) / 3.6  # km/h -> m/s
+                target['A'][idx] = _xml_float(elem.get('A'))
+                target['M'][idx] = _xml_float(elem.get('M'))
+            idx += 1
+            elem.clear()
+        elif elem.tag == 'FrameSet':
+            elem.clear()
+            target = None
 
     return dsam
 
@@ -141,16 +140,24 @@ def extract_match_actions_from_events(events, FPS=25, n_frames_firstHalf=0):
         for team in events[segment]:
             df = events[segment][team].events
             
-            for _, row in df.iterrows():
-                eid = row.get('eID', None)
+            # Plain column arrays instead of one Series per row
+            eids, qualifiers = (
+                df[name].to_numpy() if name in df.columns else [default] * len(df)
+                for name, default in (('eID', None), ('qualifier', ''))
+            )
+            # Times coerced to integers once per table (missing values as 0)
+            minutes, seconds = (
+                pd.to_numeric(df[name], errors="coerce").fillna(0).to_numpy().astype(int)
+                if name in df.columns else np.zeros(len(df), dtype=int)
+                for name in ('minute', 'second')
+            )
+            # Frame with half-dependent offset
+            frames = ((minutes * 60 + seconds) * FPS).astype(int) + frame_offset
+            
+            for eid, minute, second, frame, qualifier in zip(
+                eids, minutes.tolist(), seconds.tolist(), frames.tolist(), qualifiers
+            ):
                 eid_str = str(eid) if eid is not None else ""
-                minute = int(row.get("minute", 0) or 0)
-                second = int(row.get("second", 0) or 0)
-                
-                # Frame with half-dependent offset
-                frame = int((minute * 60 + second) * FPS) + frame_offset
-                
-                qualifier = row.get('qualifier', '')
                 
                 # Event mapping to curated action labels/emojis
                 action_map = {
@@ -245,6 +252,21 @@ def format_display_time(minute, second, segment):
     
 
 
+def _compact_possession_codes(codes):
+    """Return possession codes as int8 when they are all small integers, else unchanged.
+
+    Floodlight fills the code arrays as floats; values are only 0/1/2 but NaN
+    marks unknown frames, and those arrays are left as they are.
+    """
+    codes = np.asarray(codes)
+    if codes.dtype == np.int8 or codes.size == 0:
+        return codes
+    if np.issubdtype(codes.dtype, np.floating) and not (np.isfinite(codes).all() and (codes == np.round(codes)).all()):
+        return codes
+    if codes.min() < np.iinfo(np.int8).min or codes.max() > np.iinfo(np.int8).max:
+        return codes
+    return codes.astype(np.int8)
+
 def load_data(path, file_pos, file_info, file_events):
     """Load all Floodlight data and compute derived structures used by the app."""
 
@@ -253,6 +275,9 @@ def load_data(path, file_pos, file_info, file_events):
         os.path.join(path, file_pos),
         os.path.join(path, file_info)
     )
+    # Possession codes are only 0/1/2: keep them as int8 for the per-half stats
+    for code in possession.values():
+        code.code = _compact_possession_codes(code.code)
     # 2. Events
     events, _, _ = read_event_data_xml(
         os.path.join(path, file_events),
@@ -316,15 +341,13 @@ def load_data(path, file_pos, file_info, file_events):
 
 
    
-def format_match_time(
-    frame_idx,
-    n_frames_firstHalf,
-    n_frames_secondHalf,
-    n_frames_overtime_firstHalf=None,
-    n_frames_overtime_secondHalf=None,
-    fps=FPS
-):
-    """Format global frame index into a match time string across periods."""
+@lru_cache(maxsize=16)
+def _match_periods(n_frames_firstHalf, n_frames_secondHalf, n_frames_overtime_firstHalf, n_frames_overtime_secondHalf):
+    """Return the period table used by `format_match_time`.
+
+    Built once per match layout: a tuple of period start frames (for
+    bisecting) and the matching (label, start_f, end_f, min_start, min_end) rows.
+    """
     periods = [
         ("FirstHalf", 0, n_frames_firstHalf, 0, LENGTH_FIRST_HALF),
         ("SecondHalf", n_frames_firstHalf, n_frames_firstHalf + n_frames_secondHalf, LENGTH_FIRST_HALF, LENGTH_FULL_TIME),
@@ -340,20 +363,38 @@ def format_match_time(
         periods.append(("OvertimeSecondHalf", curr_start, curr_start + n_frames_overtime_secondHalf, min_start, min_start + LENGTH_OVERTIME_HALF))
         curr_start += n_frames_overtime_secondHalf
         min_start += LENGTH_OVERTIME_HALF
+    return tuple(p[1] for p in periods), tuple(periods)
 
-    # Find which period this frame belongs to
-    for label, start_f, end_f, min_start, min_end in periods:
-        if start_f <= frame_idx < end_f:
-            rel_frame = frame_idx - start_f
-            tot_sec = rel_frame / fps
-            min_ = int(tot_sec // 60) + min_start
-            sec_ = int(tot_sec % 60)
-            if min_ < min_end:
-                return f"{min_:02d}:{sec_:02d}"
-            else:
-                # Added time for this period
-                over = tot_sec - ((min_end - min_start) * 60)
-                return f"{min_end}:00 + {int(over // 60):02d}:{int(over % 60):02d}"
+@lru_cache(maxsize=4096)
+def format_match_time(
+    frame_idx,
+    n_frames_firstHalf,
+    n_frames_secondHalf,
+    n_frames_overtime_firstHalf=None,
+    n_frames_overtime_secondHalf=None,
+    fps=FPS
+):
+    """Format global frame index into a match time string across periods.
+
+    Memoized: the timeline and scene redraws ask for the same frames repeatedly.
+    """
+    starts, periods = _match_periods(n_frames_firstHalf, n_frames_secondHalf,
+                                     n_frames_overtime_firstHalf, n_frames_overtime_secondHalf)
+
+    # Find which period this frame belongs to (periods are contiguous)
+    i = bisect.bisect_right(starts, frame_idx) - 1
+    if i >= 0 and frame_idx < periods[i][2]:
+        label, start_f, end_f, min_start, min_end = periods[i]
+        rel_frame = frame_idx - start_f
+        tot_sec = rel_frame / fps
+        min_ = int(tot_sec // 60) + min_start
+        sec_ = int(tot_sec % 60)
+        if min_ < min_end:
+            return f"{min_:02d}:{sec_:02d}"
+        else:
+            # Added time for this period
+            over = tot_sec - ((min_end - min_start) * 60)
+            return f"{min_end}:00 + {int(over // 60):02d}:{int(over % 60):02d}"
     # Beyond extra time
     rel_frame = frame_idx - periods[-1][2]
     tot_sec = rel_frame / fps
@@ -363,6 +404,46 @@ def format_match_time(
 
 
 
+def format_match_time_array(
+    frame_idxs,
+    n_frames_firstHalf,
+    n_frames_secondHalf,
+    n_frames_overtime_firstHalf=None,
+    n_frames_overtime_secondHalf=None,
+    fps=FPS
+):
+    """Format many global frame indices at once; same strings as `format_match_time`.
+
+    Period lookup and minute/second arithmetic run as array operations; only
+    the final string formatting is per frame.
+    """
+    starts, periods = _match_periods(n_frames_firstHalf, n_frames_secondHalf,
+                                     n_frames_overtime_firstHalf, n_frames_overtime_secondHalf)
+    frames = np.asarray(frame_idxs, dtype=np.int64).ravel()
+    start_f, end_f, min_start, min_end = (np.array([p[k] for p in periods]) for k in (1, 2, 3, 4))
+
+    # Period of each frame; frames outside every period count from the end of the last one
+    i = np.searchsorted(starts, frames, side='right') - 1
+    j = np.maximum(i, 0)
+    inside = (i >= 0) & (frames < end_f[j])
+    origin = np.where(inside, start_f[j], end_f[-1])
+    tot_sec = (frames - origin) / fps
+    mins = (tot_sec // 60).astype(np.int64) + np.where(inside, min_start[j], 0)
+    secs = (tot_sec % 60).astype(np.int64)
+    ends = np.where(inside, min_end[j], min_end[-1])
+
+    # Added time: past the period's nominal end, or beyond the last period
+    added = ~inside | (mins >= ends)
+    over = tot_sec - np.where(inside, (min_end[j] - min_start[j]) * 60, 0)
+    over_mins = (over // 60).astype(np.int64)
+    over_secs = (over % 60).astype(np.int64)
+
+    return [
+        f"{e}:00 + {om:02d}:{os_:02d}" if a else f"{m:02d}:{s_:02d}"
+        for a, m, s_, e, om, os_ in zip(added.tolist(), mins.tolist(), secs.tolist(), ends.tolist(),
+                                        over_mins.tolist(), over_secs.tolist())
+    ]
+
 def build_ball_carrier_array(
     home_ids, away_ids, n_frames, possession, xy_objects, distance_threshold=3.5
 ):
@@ -395,31 +476,21 @@ def build_ball_carrier_array(
         xy_objects['secondHalf']['Ball'].xy
     ])
 
-    frame_carrier = []
-    for i in range(n_frames):
-        poss = possession_flat[i]
-        if poss == 1:
-            ids, side = home_ids, "Home"
-        elif poss == 2:
-            ids, side = away_ids, "Away"
-        else:
-            frame_carrier.append((None, None))
+    # Compare squared distances, one team and all its possession frames at a time
+    frame_carrier = [(None, None)] * n_frames
+    max_d2 = distance_threshold * distance_threshold
+    for code, side, ids in ((1, "Home", home_ids), (2, "Away", away_ids)):
+        frames = np.flatnonzero(possession_flat[:n_frames] == code)
+        if not len(frames) or not ids:
             continue
-
-        bx, by = ball_xy[i]
-        min_dist = np.inf
-        pid_proche = None
-        for pid in ids:
-            px, py = player_xy[pid][i]
-            dist = np.sqrt((bx - px)**2 + (by - py)**2)
-            if dist < min_dist:
-                min_dist = dist
-                pid_proche = pid
+        team_xy = np.stack([player_xy[pid][frames] for pid in ids], axis=1)  # (F, P, 2)
+        d2 = ((team_xy - ball_xy[frames, None, :])**2).sum(axis=2)
+        d2[np.isnan(d2)] = np.inf
+        nearest = d2.argmin(axis=1)
         # If too far, there is no ball carrier
-        if pid_proche is not None and min_dist < distance_threshold:
-            frame_carrier.append((pid_proche, side))
-        else:
-            frame_carrier.append((None, None))
+        within = d2[np.arange(len(frames)), nearest] < max_d2
+        for f, j in zip(frames[within].tolist(), nearest[within].tolist()):
+            frame_carrier[f] = (ids[j], side)
     return frame_carrier
 
 
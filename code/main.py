@@ -21,7 +21,7 @@ from pitch import PitchWidget
 from annotation.annotation import ArrowAnnotationManager, RectangleZoneManager, EllipseZoneManager
 from annotation.arrow.arrow_properties import ArrowProperties
 from annotation.zone_properties import ZoneProperties
-from data_processing import load_data, extract_match_actions_from_events, format_match_time, compute_pressure
+from data_processing import load_data, extract_match_actions_from_events, compute_pressure
 from trajectory import TrajectoryManager
 from match_actions import ActionFilterBar, create_nav_button
 from utils.frame_utils import FrameManager, PossessionTracker
@@ -253,6 +253,7 @@ class MainWindow(QWidget):
 
         # Managers
         self.frame_manager = FrameManager(n_frames_firstHalf, n_frames_secondHalf, n_frames)
+        self.frame_manager.build_clock_labels()
         self.trajectory_manager = None  # Initialized after pitch_widget
         self.annotation_manager = None
         self.tactical_manager = None  # Tactical simulation manager
@@ -350,6 +351,7 @@ class MainWindow(QWidget):
         
         # Pitch
         self.pitch_widget = PitchWidget(X_MIN, X_MAX, Y_MIN, Y_MAX)
+        self.pitch_widget.set_rosters(home_ids, away_ids)
         left_panel.addWidget(self.pitch_widget)
         
         # Action filtering bar
@@ -418,6 +420,7 @@ class MainWindow(QWidget):
         self.timeline_widget = TimelineWidget(n_frames, n_frames_firstHalf, n_frames_secondHalf)
         self.timeline_widget.frameChanged.connect(self.update_scene)
         self.timeline_widget.set_actions(self.actions_data)
+        self.timeline_widget.set_clock_labels(self.frame_manager.clock_label)
         nav_layout.addWidget(self.timeline_widget)
         nav_layout.addWidget(create_nav_button("5s >", NAV_BUTTON_WIDTH, NAV_BUTTON_HEIGHT, 5 * FPS, "Forward 5 seconds", self.jump_frames))
         nav_layout.addWidget(create_nav_button("1m >", NAV_BUTTON_WIDTH, NAV_BUTTON_HEIGHT, 60 * FPS, "Forward 1 minute", self.jump_frames))
@@ -723,8 +726,8 @@ class MainWindow(QWidget):
 
     def _update_loop_times_display(self):
         """Update the small label that shows the loop start and end times."""
-        start_time = format_match_time(self.simulation_start_frame, n_frames_firstHalf, n_frames_secondHalf, 0, 0, fps=FPS)
-        end_time = format_match_time(self.simulation_end_frame, n_frames_firstHalf, n_frames_secondHalf, 0, 0, fps=FPS)
+        start_time = self.frame_manager.clock_label(self.simulation_start_frame)
+        end_time = self.frame_manager.clock_label(self.simulation_end_frame)
         self.loop_times_label.setText(f"Loop: {start_time} → {end_time}")
 
     def update_simulation_interval(self, value):
@@ -825,8 +828,7 @@ class MainWindow(QWidget):
 
     
         # Info
-        match_time = format_match_time(frame_number, n_frames_firstHalf, 
-                                    n_frames_secondHalf, 0, 0, fps=FPS)
+        match_time = self.frame_manager.clock_label(frame_number)
         
 
         self.info_label.setText(f"{halftime} \n{match_time}  \nFrame {get_frame_data(frame_number)[1]}")
@@ -858,7 +860,8 @@ class MainWindow(QWidget):
                             velocity=dsam[side][pid][half]['S'][idx],
                             display_orientation=self.orientation_action.isChecked(),
                             z_offset=(10 if side == "Home" else 50) + i,
-                            arrow_color=self.settings_manager.arrow_color
+                            arrow_color=self.settings_manager.arrow_color,
+                            player_id=pid
                         )
                 except IndexError:
                     continue
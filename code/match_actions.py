@@ -9,6 +9,7 @@ Provides:
 - `create_nav_button`: helper for standardized navigation buttons
 """
 
+import heapq
 from PyQt6.QtWidgets import (
     QPushButton, QHBoxLayout, QVBoxLayout, QLabel, 
     QDialog, QListWidget, QListWidgetItem, QCheckBox,
@@ -28,14 +29,16 @@ class ActionFilterBar:
         self.available_types = {}
         self.selected_action_types = []  # None selected by default
         self.active_button_states = {}  # Remember button states
+        self._indices_by_label = {}  # label -> positions in actions_data, in order
         
         self._analyze_actions()
         self._create_ui()
         
     def _analyze_actions(self):
         """Scan actions and build the set of available types with counts."""
-        for act in self.actions_data:
+        for i, act in enumerate(self.actions_data):
             label = act['label']
+            self._indices_by_label.setdefault(label, []).append(i)
             if label not in self.available_types:
                 self.available_types[label] = {
                     'emoji': act['emoji'],
@@ -168,9 +171,11 @@ class ActionFilterBar:
         return [t for t, btn in self.action_buttons.items() if btn.isChecked()]
     
     def get_filtered_actions(self):
-        """Return actions matching the active types."""
-        active_types = self.get_active_types()
-        return [a for a in self.actions_data if a['label'] in active_types]
+        """Return actions matching the active types, in their original order."""
+        # Only the active types' actions are visited; merging their sorted
+        # position lists keeps the chronological order of `actions_data`
+        runs = [self._indices_by_label.get(t, []) for t in self.get_active_types()]
+        return [self.actions_data[i] for i in heapq.merge(*runs)]
 
 class ActionSelectionDialog(QDialog):
     """Dialog to select up to a maximum number of action types."""
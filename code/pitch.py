@@ -2,24 +2,189 @@
 """
 Pitch rendering with PyQt GraphicsScene.
 
-`PitchWidget` draws the static field once and re-renders dynamic items
-(players, ball, overlays) every frame. It relies on size constants exposed via
+`PitchWidget` draws the static field once into a cached pixmap (blitted as the
+scene background) and re-renders dynamic items (players, ball, overlays) every
+frame. It relies on size constants exposed via
 `CONFIG` so that visual scale can be adjusted globally.
 """
 import numpy as np
 import math
 from PyQt6.QtWidgets import (
     QWidget, QGraphicsScene, QGraphicsView, QVBoxLayout, QGraphicsEllipseItem, QGraphicsPathItem,
-    QGraphicsTextItem, QGraphicsRectItem, QGraphicsItemGroup
+    QGraphicsRectItem, QGraphicsPixmapItem, QGraphicsLineItem, QGraphicsItem
 )
-from PyQt6.QtGui import QPen, QBrush, QColor, QFont, QPainterPath, QTransform
-from PyQt6.QtCore import QRectF, Qt
+from PyQt6.QtGui import QPen, QBrush, QColor, QFont, QPainterPath, QTransform, QPixmap, QPainter, QSurfaceFormat, QOpenGLContext, QStaticText
+from PyQt6.QtCore import QPointF, QRectF, Qt
+from PyQt6 import sip
 from config import CONFIG
 
+try:
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # Qt built without OpenGL support
+    QOpenGLWidget = None
+
 
 from data_processing import get_pressure_color, build_ball_carrier_array
 from config import *
 
+def _opengl_available():
+    """Return True if Qt can create an OpenGL context on this platform."""
+    if QOpenGLWidget is None:
+        return False
+    return QOpenGLContext().create()
+
+_CHEVRON_RAD = math.radians(PLAYER_CHEVRON_ANGLE_DEG)
+_CHEVRON_COS = math.cos(_CHEVRON_RAD)
+_CHEVRON_SIN = math.sin(_CHEVRON_RAD)
+_RAD2DEG = 180.0 / math.pi
+_NO_PEN = QPen(Qt.PenStyle.NoPen)
+_PRESSURE_SPRITE_PX = 128  # sprite resolution, scaled to the disc size in scene units
+_PLAYERS_LAYER_Z = 10      # z of the batched players layer (orientation arrows sit just below)
+_ATLAS_COLUMNS = 8         # sprite cells per atlas row
+
+class PitchScene(QGraphicsScene):
+    """Graphics scene that blits a cached pitch pixmap as its background.
+
+    Parameters
+    ----------
+    parent : QObject, optional
+        Parent object.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pitch_pixmap = None
+        self.pitch_rect = QRectF()
+        self.pitch_source = None        # offscreen scene the pixmap is rendered from
+        self.resolution_callback = None
+
+    def drawBackground(self, painter, rect):
+        """Draw the cached pitch pixmap, asking for a sharper one when zoomed in.
+
+        Past `PITCH_PIXMAP_MAX_SIZE` the exposed part of the static scene is
+        painted as vectors instead, so close-up camera presets stay sharp.
+        """
+        if self.pitch_pixmap is None or self.pitch_pixmap.isNull():
+            super().drawBackground(painter, rect)
+            return
+        px_per_unit = abs(painter.worldTransform().m11()) * painter.device().devicePixelRatioF()
+        current = self.pitch_pixmap.width() / self.pitch_rect.width()
+        if px_per_unit > current * 1.25:
+            if max(self.pitch_pixmap.width(), self.pitch_pixmap.height()) < PITCH_PIXMAP_MAX_SIZE:
+                if self.resolution_callback is not None:
+                    self.resolution_callback(px_per_unit)
+            elif self.pitch_source is not None:
+                self.pitch_source.render(painter, rect, rect)
+                return
+        painter.drawPixmap(self.pitch_rect, self.pitch_pixmap, QRectF(self.pitch_pixmap.rect()))
+
+
+class SpriteAtlas:
+    """Pack equally sized sprites into one pixmap, addressed by source rects.
+
+    Parameters
+    ----------
+    cell_px : int
+        Side length of a square cell in pixels.
+    """
+    def __init__(self, cell_px):
+        self.cell_px = cell_px
+        self.pixmap = QPixmap()
+        self._rects = {}
+
+    def rect_for(self, key, render):
+        """Return the source rect of `key`, copying `render()` into a new cell on first use.
+
+        Parameters
+        ----------
+        key : hashable
+            Sprite identity.
+        render : callable
+            Returns the QPixmap to store (``cell_px`` square).
+
+        Returns
+        -------
+        QRectF
+            Source rect of the sprite inside `pixmap`.
+        """
+        rect = self._rects.get(key)
+        if rect is not None:
+            return rect
+        index = len(self._rects)
+        row, col = divmod(index, _ATLAS_COLUMNS)
+        rows_needed = row + 1
+        if self.pixmap.isNull() or self.pixmap.height() < rows_needed * self.cell_px:
+            self._grow(max(1, 2 * rows_needed - 1))
+        rect = QRectF(col * self.cell_px, row * self.cell_px, self.cell_px, self.cell_px)
+        painter = QPainter(self.pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.drawPixmap(rect, render(), QRectF(0, 0, self.cell_px, self.cell_px))
+        painter.end()
+        self._rects[key] = rect
+        return rect
+
+    def _grow(self, rows):
+        """Reallocate the atlas with `rows` rows, keeping existing cells."""
+        grown = QPixmap(_ATLAS_COLUMNS * self.cell_px, rows * self.cell_px)
+        grown.fill(Qt.GlobalColor.transparent)
+        if not self.pixmap.isNull():
+            painter = QPainter(grown)
+            painter.drawPixmap(0, 0, self.pixmap)
+            painter.end()
+        self.pixmap = grown
+
+
+class PlayersLayerItem(QGraphicsItem):
+    """Single scene item drawing every player with one `drawPixmapFragments` call.
+
+    Parameters
+    ----------
+    rect : QRectF
+        Bounding rect (the whole scene).
+    """
+    def __init__(self, rect):
+        super().__init__()
+        self._rect = QRectF(rect)
+        self.atlas = None
+        self._fragments = []  # (z, x, y, source rect, scale, rotation)
+
+    def boundingRect(self):
+        return self._rect
+
+    def clear(self):
+        """Drop all players queued for the current frame."""
+        if self._fragments:
+            self._fragments.clear()
+            self.update()
+
+    def add(self, source, x, y, scale, rotation, z):
+        """Queue one player sprite for the current frame.
+
+        Parameters
+        ----------
+        source : QRectF
+            Sprite rect in `atlas.pixmap`.
+        x, y : float
+            Sprite center in scene coordinates.
+        scale : float
+            Scene units per atlas pixel.
+        rotation : float
+            Rotation in degrees.
+        z : float
+            Stacking order among players.
+        """
+        self._fragments.append((z, x, y, source, scale, rotation))
+        self.update()
+
+    def paint(self, painter, option, widget=None):
+        if not self._fragments or self.atlas is None:
+            return
+        self._fragments.sort(key=lambda f: f[0])
+        fragments = sip.array(QPainter.PixmapFragment, len(self._fragments))
+        for i, (_z, x, y, source, scale, rotation) in enumerate(self._fragments):
+            fragments[i] = QPainter.PixmapFragment.create(QPointF(x, y), source, scale, scale, rotation, 1)
+        painter.drawPixmapFragments(fragments, self.atlas.pixmap)
+
+
 class PitchWidget(QWidget):
     """Graphics widget to display a soccer pitch and dynamic overlays.
 
@@ -41,30 +206,116 @@ class PitchWidget(QWidget):
         self.theme = {}
 
 
-        self.pitch_items = []         # Static pitch objects
+        self.pitch_items = []         # Static pitch objects (offscreen, rasterized into the background)
         self.dynamic_items = []       # Dynamic objects (players, ball, lines, etc)
         self.annotation_items = []    # Annotations/arrows, managed elsewhere
-
-        self.scene = QGraphicsScene(self)
+        self._home_ix = {}            # Player ID -> column index in the Home xy array
+        self._away_ix = {}            # Player ID -> column index in the Away xy array
+        self._roster_key = None       # (home ids, away ids) the indices above were built from
+        self._pressure_pixmap_cache = {}  # (color name, opacity) -> pre-rendered disc
+        self._player_atlas = {}       # (colors, number, radii, px size) -> pre-rendered player disc
+        self._number_text_cache = {}  # (number, point size) -> (QFont, QStaticText)
+        self._half_disc_cache = {}    # radius -> (bottom, top) QPainterPath
+        self._arrow_path_cache = {}   # rounded length -> QPainterPath, for _arrow_path_dims only
+        self._arrow_path_dims = None  # (radius, chevron) the cached arrow paths were built for
+        self._pen_cache = {}          # (color, width, style) -> QPen
+        self._brush_cache = {}        # color -> QBrush
+        self._persistent_items = {}   # key -> item reused across frames (moved, not rebuilt)
+        self._shown_keys = set()      # persistent keys drawn since the last clear_dynamic
+
+        self._pitch_scene = QGraphicsScene(self)  # offscreen scene holding static items
+        self._pitch_key = None
+        self._left_arc_path, self._right_arc_path = self._build_arc_paths()
+        self.scene = PitchScene(self)
+        self.scene.resolution_callback = self._rebuild_pitch_pixmap
+        self.scene.pitch_source = self._pitch_scene
+        # Fixed scene rect: Qt never has to grow it from the items' bounding rect
+        self._scene_rect = self._full_scene_rect()
+        self.scene.setSceneRect(self._scene_rect)
+        # Few items that all move every frame: a BSP index costs more to maintain than it saves
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.view = QGraphicsView(self.scene)
-        self.view.setRenderHints(self.view.renderHints() | self.view.renderHints())
+        self.view.setRenderHints(
+            QPainter.RenderHint.Antialiasing
+            | QPainter.RenderHint.SmoothPixmapTransform
+            | QPainter.RenderHint.TextAntialiasing
+        )
+        if USE_OPENGL_VIEWPORT and _opengl_available():
+            fmt = QSurfaceFormat()
+            fmt.setSamples(OPENGL_SAMPLES)
+            gl_viewport = QOpenGLWidget()
+            gl_viewport.setFormat(fmt)
+            self.view.setViewport(gl_viewport)
+        self.view.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing, True)
+        self.view.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
+        self.view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.BoundingRectViewportUpdate)
         self.view.scale(1, -1)
         layout = QVBoxLayout(self)
         layout.addWidget(self.view)
         self.setLayout(layout)
         self.draw_pitch()
-        
-    
-        
+
+        # Single offside line, moved (never recreated) every frame
+        self._offside_line = QGraphicsLineItem()
+        self._offside_line.setZValue(199)
+        self._offside_line.setVisible(False)
+        self.scene.addItem(self._offside_line)
+        self._persistent_items["offside"] = self._offside_line
+
+        # All players drawn with an ID go through one batched layer item
+        self._players_layer = PlayersLayerItem(self._scene_rect)
+        self._players_layer.setZValue(_PLAYERS_LAYER_Z)
+        self.scene.addItem(self._players_layer)
+
+
+    def set_rosters(self, home_ids, away_ids):
+        """Index player IDs so xy columns can be looked up in constant time.
+
+        Parameters
+        ----------
+        home_ids, away_ids : list[str]
+            Player IDs in the column order of the Floodlight xy arrays.
+        """
+        self._roster_key = (tuple(home_ids), tuple(away_ids))
+        self._home_ix = {pid: i for i, pid in enumerate(home_ids)}
+        self._away_ix = {pid: i for i, pid in enumerate(away_ids)}
+
+    def _pen(self, color, width, style=Qt.PenStyle.SolidLine):
+        """Return a shared QPen for (color, width, style), creating it on first use."""
+        key = (color, width, style)
+        pen = self._pen_cache.get(key)
+        if pen is None:
+            pen = QPen(QColor(color), width)
+            pen.setStyle(style)
+            self._pen_cache[key] = pen
+        return pen
+
+    def _brush(self, color):
+        """Return a shared solid QBrush for `color`, creating it on first use."""
+        brush = self._brush_cache.get(color)
+        if brush is None:
+            brush = self._brush_cache[color] = QBrush(QColor(color))
+        return brush
+
+    def _hide_persistent(self, key):
+        """Hide the persistent item for `key` (if any) until it is drawn again."""
+        item = self._persistent_items.get(key)
+        if item is not None:
+            item.setVisible(False)
+        self._shown_keys.discard(key)
 
     def clear_pitch(self):
-        """Remove static field items from the scene."""
+        """Remove static field items from the offscreen pitch scene."""
         for item in self.pitch_items:
-            self.scene.removeItem(item)
+            self._pitch_scene.removeItem(item)
         self.pitch_items.clear()
 
     def clear_dynamic(self):
-        """Remove dynamic items (players, ball, lines, overlays)."""
+        """Remove dynamic items (players, ball, lines, overlays).
+
+        Persistent items (players drawn with an ID, ball, offside line,
+        pressure disc) are only hidden; the next frame moves and re-shows them.
+        """
         for item in self.dynamic_items:
             try:
                 scene = item.scene()
@@ -73,187 +324,210 @@ class PitchWidget(QWidget):
             except Exception:
                 pass
         self.dynamic_items.clear()
+        for key in self._shown_keys:
+            self._persistent_items[key].setVisible(False)
+        self._shown_keys.clear()
+        self._players_layer.clear()
+
+    def persistent_item(self, key, factory):
+        """Return the persistent item for `key`, creating it on first use.
+
+        Also used by the trajectory manager for overlays it keeps across frames.
+
+        Parameters
+        ----------
+        key : hashable
+            Identity of the item across frames (e.g. ``("player", pid)``).
+        factory : callable
+            Builds the item when it does not exist yet.
+
+        Returns
+        -------
+        QGraphicsItem
+            The item, added to the scene and visible for the current frame.
+        """
+        item = self._persistent_items.get(key)
+        if item is None:
+            item = factory()
+            self.scene.addItem(item)
+            self._persistent_items[key] = item
+        item.setVisible(True)
+        self._shown_keys.add(key)
+        return item
 
         
     def draw_pitch(self):
-        """Draw the field using current theme colors (grass and lines)."""
-        self.clear_pitch()
+        """Draw the field using current theme colors (grass and lines).
+
+        Static items live in an offscreen scene and are rasterized once into
+        the background pixmap; nothing is rebuilt while the colors are unchanged.
+        """
         # Grab theme colors (fallback if key is missing)
         grass_color = self.theme.get("grass", "#08711a")
         line_color    = self.theme.get("line",    "#FFFFFF")
+        if self._pitch_key == (grass_color, line_color) and self.scene.pitch_pixmap is not None:
+            return
+        self._pitch_key = (grass_color, line_color)
+        self.clear_pitch()
+        scene = self._pitch_scene
 
         brush = QBrush(QColor(grass_color))
         pen   = QPen(QColor(line_color), LINE_WIDTH)
-
-        # Grass + main field rectangle
+        spot_brush = QBrush(QColor(line_color))
+
+        # Pitch geometry, computed once
+        xmin, xmax = self.X_MIN, self.X_MAX
+        ymin, ymax = self.Y_MIN, self.Y_MAX
+        L, W = self.PITCH_LENGTH, self.PITCH_WIDTH
+        center_x = xmin + L*0.5
+        center_y = ymin + W*0.5
+        pa_y = ymin + (W - PENALTY_AREA_WIDTH)*0.5
+        ga_y = ymin + (W - GOAL_AREA_WIDTH)*0.5
+        goal_y = ymin + (W - GOAL_WIDTH)*0.5
+
+        # Grass
         grass = QGraphicsRectItem(
-            self.X_MIN - 2*SCENE_EXTRA_GRASS,
-            self.Y_MIN - SCENE_EXTRA_GRASS,
-            self.PITCH_LENGTH + 4*SCENE_EXTRA_GRASS,
-            self.PITCH_WIDTH  + 2*SCENE_EXTRA_GRASS
+            xmin - 2*SCENE_EXTRA_GRASS,
+            ymin - SCENE_EXTRA_GRASS,
+            L + 4*SCENE_EXTRA_GRASS,
+            W + 2*SCENE_EXTRA_GRASS
         )
         grass.setBrush(brush)
-        grass.setPen(QPen(Qt.PenStyle.NoPen))
-        self.scene.addItem(grass)
+        grass.setPen(_NO_PEN)
+        scene.addItem(grass)
         self.pitch_items.append(grass)
 
-        field = self.scene.addRect(
-            self.X_MIN, self.Y_MIN, self.PITCH_LENGTH, self.PITCH_WIDTH,
-            pen, brush
-        )
-        field.setZValue(-10)
-        self.pitch_items.append(field)
-
-        # Outer lines and halfway line
-        self.pitch_items.append(self.scene.addLine(self.X_MIN, self.Y_MIN, self.X_MIN, self.Y_MAX, pen))
-        self.pitch_items.append(self.scene.addLine(self.X_MAX, self.Y_MIN, self.X_MAX, self.Y_MAX, pen))
-        self.pitch_items.append(self.scene.addLine(self.X_MIN, self.Y_MIN, self.X_MAX, self.Y_MIN, pen))
-        self.pitch_items.append(self.scene.addLine(self.X_MIN, self.Y_MAX, self.X_MAX, self.Y_MAX, pen))
-        self.pitch_items.append(self.scene.addLine(
-            self.X_MIN + self.PITCH_LENGTH/2, self.Y_MIN,
-            self.X_MIN + self.PITCH_LENGTH/2, self.Y_MAX,
-            pen
-        ))
+        # Outer lines and halfway line as a single path item
+        outline_path = QPainterPath()
+        outline_path.addRect(xmin, ymin, L, W)
+        outline_path.moveTo(center_x, ymin)
+        outline_path.lineTo(center_x, ymax)
+        outline = QGraphicsPathItem(outline_path)
+        outline.setPen(pen)
+        outline.setBrush(QBrush(Qt.BrushStyle.NoBrush))
+        scene.addItem(outline)
+        self.pitch_items.append(outline)
 
         # Center circle
-        center_x = self.X_MIN + self.PITCH_LENGTH/2
-        center_y = self.Y_MIN + self.PITCH_WIDTH/2
-        self.pitch_items.append(self.scene.addEllipse(
+        self.pitch_items.append(scene.addEllipse(
             center_x - CENTER_CIRCLE_RADIUS,
             center_y - CENTER_CIRCLE_RADIUS,
             CENTER_CIRCLE_RADIUS*2, CENTER_CIRCLE_RADIUS*2,
             pen
         ))
 
-        # Center spot
-        dot = self.scene.addEllipse(
-            center_x - POINT_RADIUS,
-            center_y - POINT_RADIUS,
-            POINT_RADIUS*2, POINT_RADIUS*2,
-            QPen(Qt.PenStyle.NoPen), QBrush(QColor(line_color))
-        )
-        self.pitch_items.append(dot)
-
-        # Penalty spots
-        left_spot = self.scene.addEllipse(
-            self.X_MIN + PENALTY_SPOT_DIST - POINT_RADIUS,
-            center_y - POINT_RADIUS,
-            POINT_RADIUS*2, POINT_RADIUS*2,
-            QPen(Qt.PenStyle.NoPen), QBrush(QColor(line_color))
-        )
-        right_spot = self.scene.addEllipse(
-            self.X_MAX - PENALTY_SPOT_DIST - POINT_RADIUS,
-            center_y - POINT_RADIUS,
-            POINT_RADIUS*2, POINT_RADIUS*2,
-            QPen(Qt.PenStyle.NoPen), QBrush(QColor(line_color))
-        )
-        self.pitch_items.extend([left_spot, right_spot])
+        # Center spot and penalty spots
+        for spot_x in (center_x, xmin + PENALTY_SPOT_DIST, xmax - PENALTY_SPOT_DIST):
+            self.pitch_items.append(scene.addEllipse(
+                spot_x - POINT_RADIUS,
+                center_y - POINT_RADIUS,
+                POINT_RADIUS*2, POINT_RADIUS*2,
+                _NO_PEN, spot_brush
+            ))
 
         # Penalty areas and goal areas
-        self.pitch_items.append(self.scene.addRect(
-            self.X_MIN,
-            self.Y_MIN + (self.PITCH_WIDTH - PENALTY_AREA_WIDTH)/2,
-            PENALTY_AREA_LENGTH,
-            PENALTY_AREA_WIDTH,
-            pen
+        self.pitch_items.append(scene.addRect(
+            xmin, pa_y, PENALTY_AREA_LENGTH, PENALTY_AREA_WIDTH, pen
         ))
-        self.pitch_items.append(self.scene.addRect(
-            self.X_MAX - PENALTY_AREA_LENGTH,
-            self.Y_MIN + (self.PITCH_WIDTH - PENALTY_AREA_WIDTH)/2,
-            PENALTY_AREA_LENGTH,
-            PENALTY_AREA_WIDTH,
-            pen
+        self.pitch_items.append(scene.addRect(
+            xmax - PENALTY_AREA_LENGTH, pa_y, PENALTY_AREA_LENGTH, PENALTY_AREA_WIDTH, pen
         ))
-        self.pitch_items.append(self.scene.addRect(
-            self.X_MIN,
-            self.Y_MIN + (self.PITCH_WIDTH - GOAL_AREA_WIDTH)/2,
-            GOAL_AREA_LENGTH,
-            GOAL_AREA_WIDTH,
-            pen
+        self.pitch_items.append(scene.addRect(
+            xmin, ga_y, GOAL_AREA_LENGTH, GOAL_AREA_WIDTH, pen
         ))
-        self.pitch_items.append(self.scene.addRect(
-            self.X_MAX - GOAL_AREA_LENGTH,
-            self.Y_MIN + (self.PITCH_WIDTH - GOAL_AREA_WIDTH)/2,
-            GOAL_AREA_LENGTH,
-            GOAL_AREA_WIDTH,
-            pen
+        self.pitch_items.append(scene.addRect(
+            xmax - GOAL_AREA_LENGTH, ga_y, GOAL_AREA_LENGTH, GOAL_AREA_WIDTH, pen
         ))
 
         # Goals (posts area)
-        self.pitch_items.append(self.scene.addRect(
-            self.X_MIN - GOAL_DEPTH,
-            self.Y_MIN + (self.PITCH_WIDTH - GOAL_WIDTH)/2,
-            GOAL_DEPTH, GOAL_WIDTH,
-            pen
+        self.pitch_items.append(scene.addRect(
+            xmin - GOAL_DEPTH, goal_y, GOAL_DEPTH, GOAL_WIDTH, pen
         ))
-        self.pitch_items.append(self.scene.addRect(
-            self.X_MAX,
-            self.Y_MIN + (self.PITCH_WIDTH - GOAL_WIDTH)/2,
-            GOAL_DEPTH, GOAL_WIDTH,
-            pen
+        self.pitch_items.append(scene.addRect(
+            xmax, goal_y, GOAL_DEPTH, GOAL_WIDTH, pen
         ))
 
         # Penalty arcs
-        arc_radius = 9.15
+        for arc_path in (self._left_arc_path, self._right_arc_path):
+            arc = QGraphicsPathItem(arc_path)
+            arc.setPen(pen)
+            scene.addItem(arc)
+            self.pitch_items.append(arc)
+
+        self._rebuild_pitch_pixmap()
+
+    def _build_arc_paths(self):
+        """Build the penalty arc paths, which only depend on pitch constants.
+
+        Returns
+        -------
+        tuple[QPainterPath, QPainterPath]
+            Left and right penalty arcs.
+        """
+        arc_y = self.Y_MIN + self.PITCH_WIDTH*0.5 - PENALTY_ARC_RADIUS
+        arc_d = 2*PENALTY_ARC_RADIUS
 
-        # Left arc
-        left_arc = QGraphicsPathItem()
         path_l = QPainterPath()
-        path_l.arcMoveTo(
-            self.X_MIN + PENALTY_SPOT_DIST - arc_radius,
-            center_y           - arc_radius,
-            2*arc_radius, 2*arc_radius,
-            308
-        )
-        path_l.arcTo(
-            self.X_MIN + PENALTY_SPOT_DIST - arc_radius,
-            center_y           - arc_radius,
-            2*arc_radius, 2*arc_radius,
-            308, 104
-        )
-        left_arc.setPath(path_l)
-        left_arc.setPen(pen)
-        self.scene.addItem(left_arc)
-        self.pitch_items.append(left_arc)
+        left_arc_x = self.X_MIN + PENALTY_SPOT_DIST - PENALTY_ARC_RADIUS
+        path_l.arcMoveTo(left_arc_x, arc_y, arc_d, arc_d, 308)
+        path_l.arcTo(left_arc_x, arc_y, arc_d, arc_d, 308, 104)
 
-        # Right arc
-        right_arc = QGraphicsPathItem()
         path_r = QPainterPath()
-        path_r.arcMoveTo(
-            self.X_MAX - PENALTY_SPOT_DIST - arc_radius,
-            center_y           - arc_radius,
-            2*arc_radius, 2*arc_radius,
-            128
+        right_arc_x = self.X_MAX - PENALTY_SPOT_DIST - PENALTY_ARC_RADIUS
+        path_r.arcMoveTo(right_arc_x, arc_y, arc_d, arc_d, 128)
+        path_r.arcTo(right_arc_x, arc_y, arc_d, arc_d, 128, 104)
+        return path_l, path_r
+
+    def _full_scene_rect(self):
+        """Return the full pitch rect including the extra grass margin."""
+        MARGIN = SCENE_EXTRA_GRASS
+        return QRectF(
+            self.X_MIN - 2*MARGIN,
+            self.Y_MIN - MARGIN,
+            self.PITCH_LENGTH + 4*MARGIN,
+            self.PITCH_WIDTH + 2*MARGIN
         )
-        path_r.arcTo(
-            self.X_MAX - PENALTY_SPOT_DIST - arc_radius,
-            center_y           - arc_radius,
-            2*arc_radius, 2*arc_radius,
-            128, 104
-        )
-        right_arc.setPath(path_r)
-        right_arc.setPen(pen)
-        self.scene.addItem(right_arc)
-        self.pitch_items.append(right_arc)
+
+    def _rebuild_pitch_pixmap(self, px_per_unit=None):
+        """Rasterize the static pitch items into the scene background pixmap.
+
+        Parameters
+        ----------
+        px_per_unit : float | None
+            Device pixels per scene unit; defaults to the current view scale.
+        """
+        rect = self._scene_rect
+        if px_per_unit is None:
+            px_per_unit = abs(self.view.transform().m11()) * self.view.devicePixelRatioF()
+        px_per_unit = min(px_per_unit, PITCH_PIXMAP_MAX_SIZE / max(rect.width(), rect.height()))
+        w = max(1, int(math.ceil(rect.width() * px_per_unit)))
+        h = max(1, int(math.ceil(rect.height() * px_per_unit)))
+
+        pixmap = QPixmap(w, h)
+        pixmap.fill(QColor(self.theme.get("grass", "#08711a")))
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._pitch_scene.render(painter, QRectF(0, 0, w, h), rect, Qt.AspectRatioMode.IgnoreAspectRatio)
+        painter.end()
+
+        self.scene.pitch_pixmap = pixmap
+        self.scene.pitch_rect = rect
+        self.scene.invalidate(rect, QGraphicsScene.SceneLayer.BackgroundLayer)
 
     def resizeEvent(self, event):
             """Fit the entire pitch rect on widget resize (keeps aspect ratio)."""
             super().resizeEvent(event)
-            MARGIN = SCENE_EXTRA_GRASS
-            rect = QRectF(
-                self.X_MIN - 2*MARGIN,
-                self.Y_MIN - MARGIN,
-                self.PITCH_LENGTH + 4*MARGIN,
-                self.PITCH_WIDTH + 2*MARGIN
-            )
-            self.view.setSceneRect(rect)
-            self.view.fitInView(rect, Qt.AspectRatioMode.KeepAspectRatio)
+            self.view.fitInView(self._scene_rect, Qt.AspectRatioMode.KeepAspectRatio)
+            self._rebuild_pitch_pixmap()
 
     def draw_player(self, x, y, main_color, sec_color, num_color, number, 
                 angle=0, velocity=0, display_orientation=False, z_offset=10, 
-                arrow_color=None):
+                arrow_color=None, player_id=None):
         """Draw a bi-color player disc with optional orientation arrow.
 
+        The disc itself is a cached sprite per (colors, number); players with
+        an ID are drawn together by one `PlayersLayerItem`.
+
         Parameters
         ----------
         x, y : float
@@ -272,8 +546,17 @@ class PitchWidget(QWidget):
             Z stacking base.
         arrow_color : str | None
             Hex color for orientation arrow (defaults to theme arrow color).
+        player_id : str | None
+            If given, the disc is queued on the batched players layer and the
+            arrow item persists across frames; otherwise standalone items are
+            created and removed by `clear_dynamic`.
         """
-    
+        # Skip players far outside the visible grass (e.g. substitutes parked off-field)
+        margin = SCENE_EXTRA_GRASS + CONFIG.PLAYER_OUTER_RADIUS
+        if not (self.X_MIN - margin <= x <= self.X_MAX + margin
+                and self.Y_MIN - margin <= y <= self.Y_MAX + margin):
+            return
+
         # Use theme color if arrow_color is not provided
         if arrow_color is None:
             arrow_color = self.theme.get("arrow", "#000000")
@@ -286,87 +569,105 @@ class PitchWidget(QWidget):
         
         # Draw a player with orientation
         min_velocity = 0.01 # m/s to avoid display bugs
-        if display_orientation and angle is not None and velocity is not None:
+        # NaN speeds (e.g. past the end of a player's DSAM frames) draw no arrow
+        if display_orientation and angle is not None and velocity is not None and math.isfinite(velocity):
             velocity = max(velocity, min_velocity)
             arrow_length = velocity * VELOCITY_ARROW_SCALE
-            arrow_x_start = x + radius * math.cos(angle)
-            arrow_y_start = y + radius * math.sin(angle)
-            arrow_x_end = x + (radius + arrow_length) * math.cos(angle)
-            arrow_y_end = y + (radius + arrow_length) * math.sin(angle)
-            arrow = self.scene.addLine(
-                arrow_x_start, arrow_y_start, arrow_x_end, arrow_y_end, 
-                QPen(QColor(arrow_color), arrow_thickness)
-            )
-            arrow.setZValue(z_offset - 2)
-            self.dynamic_items.append(arrow)
-            
-            left_chevron_angle = angle + math.radians(PLAYER_CHEVRON_ANGLE_DEG)
-            right_chevron_angle = angle - math.radians(PLAYER_CHEVRON_ANGLE_DEG)
-            left_x = arrow_x_end + chevron_size * math.cos(left_chevron_angle)
-            left_y = arrow_y_end + chevron_size * math.sin(left_chevron_angle)
-            right_x = arrow_x_end + chevron_size * math.cos(right_chevron_angle)
-            right_y = arrow_y_end + chevron_size * math.sin(right_chevron_angle)
-            left_line = self.scene.addLine(arrow_x_end, arrow_y_end, left_x, left_y, 
-                                        QPen(QColor(arrow_color), arrow_thickness))
-            right_line = self.scene.addLine(arrow_x_end, arrow_y_end, right_x, right_y, 
-                                        QPen(QColor(arrow_color), arrow_thickness))
-            left_line.setZValue(z_offset - 2)
-            right_line.setZValue(z_offset - 2)
-            self.dynamic_items.append(left_line)
-            self.dynamic_items.append(right_line)
-
-        group = QGraphicsItemGroup()
-        path_bottom = QPainterPath()
-        cx, cy = 0, 0
-        path_bottom.moveTo(cx, cy)
-        path_bottom.arcMoveTo(cx - radius, cy - radius, 2*radius, 2*radius, 0)
-        path_bottom.arcTo(cx - radius, cy - radius, 2*radius, 2*radius, 0, 180)
-        path_bottom.lineTo(cx, cy)
-        path_bottom.closeSubpath()
-        bottom_half = QGraphicsPathItem(path_bottom)
-        bottom_half.setPen(QPen(Qt.GlobalColor.transparent, 0))
-        bottom_half.setBrush(QBrush(QColor(sec_color)))
-        bottom_half.setZValue(z_offset + 1)
-        group.addToGroup(bottom_half)
-        
-        path_top = QPainterPath()
-        path_top.moveTo(cx, cy)
-        path_top.arcMoveTo(cx - radius, cy - radius, 2*radius, 2*radius, 180)
-        path_top.arcTo(cx - radius, cy - radius, 2*radius, 2*radius, 180, 180)
-        path_top.lineTo(cx, cy)
-        path_top.closeSubpath()
-        top_half = QGraphicsPathItem(path_top)
-        top_half.setPen(QPen(Qt.GlobalColor.transparent, 0))
-        top_half.setBrush(QBrush(QColor(main_color)))
-        top_half.setZValue(z_offset + 2)
-        group.addToGroup(top_half)
-        
-        inner = QGraphicsEllipseItem(-inner_radius, -inner_radius, inner_radius*2, inner_radius*2)
-        inner.setPen(QPen(Qt.GlobalColor.transparent, 0))
-        inner.setBrush(QBrush(QColor(main_color)))
-        inner.setZValue(z_offset + 3)
-        group.addToGroup(inner)
-        
-        # Adjust font size based on scale
-        font = QFont("Arial")
-        font.setBold(True)
-        font.setPointSize(int(inner_radius * 1.8))
-        text = QGraphicsTextItem(str(number))
-        text.setDefaultTextColor(QColor(num_color))
-        text.setFont(font)
-        bounding = text.boundingRect()
-        text.setZValue(z_offset + 4)
-        text.setTransformOriginPoint(bounding.width()/2, bounding.height()/2)
-        text.setTransform(QTransform().scale(1, -1), True)
-        text_rect = text.boundingRect()
-        text.setPos(-text_rect.width()/2, +text_rect.height()/2)
-        group.addToGroup(text)
-        group.setPos(x, y)
-        deg = np.degrees(angle) + PLAYER_ROTATION_OFFSET_DEG if display_orientation else PLAYER_ROTATION_DEFAULT_DEG + PLAYER_ROTATION_OFFSET_DEG
-        group.setRotation(deg)
-        group.setZValue(z_offset)
-        self.scene.addItem(group)
-        self.dynamic_items.append(group)
+            if player_id is None:
+                arrow = QGraphicsPathItem()
+                self.scene.addItem(arrow)
+                self.dynamic_items.append(arrow)
+            else:
+                arrow = self.persistent_item(("arrow", player_id), QGraphicsPathItem)
+            # Shape is built along +x once per length; placement is a per-item transform
+            arrow.setPath(self._arrow_path(radius, arrow_length, chevron_size))
+            arrow.setPos(x, y)
+            arrow.setRotation(angle * _RAD2DEG)
+            arrow.setPen(self._pen(arrow_color, arrow_thickness))
+            arrow.setZValue(z_offset - 2 if player_id is None else _PLAYERS_LAYER_Z - 1)
+
+        deg = angle * _RAD2DEG + PLAYER_ROTATION_OFFSET_DEG if display_orientation else PLAYER_ROTATION_DEFAULT_DEG + PLAYER_ROTATION_OFFSET_DEG
+        pixmap = self._player_pixmap(main_color, sec_color, num_color, number, radius, inner_radius)
+        if player_id is not None:
+            layer = self._players_layer
+            if layer.atlas is None or layer.atlas.cell_px != pixmap.width():
+                layer.atlas = SpriteAtlas(pixmap.width())
+            source = layer.atlas.rect_for(pixmap.cacheKey(), lambda: pixmap)
+            layer.add(source, x, y, 2 * radius / pixmap.width(), deg, z_offset)
+            return
+
+        sprite = QGraphicsPixmapItem(pixmap)
+        sprite.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+        sprite.setOffset(-pixmap.width() / 2, -pixmap.height() / 2)
+        sprite.setScale(2 * radius / pixmap.width())
+        sprite.setPos(x, y)
+        sprite.setRotation(deg)
+        sprite.setZValue(z_offset)
+        self.scene.addItem(sprite)
+        self.dynamic_items.append(sprite)
+
+    @staticmethod
+    def _new_sprite():
+        """Create an empty, smoothly scaled pixmap item."""
+        sprite = QGraphicsPixmapItem()
+        sprite.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+        return sprite
+
+    def _player_pixmap(self, main_color, sec_color, num_color, number, radius, inner_radius):
+        """Return the cached disc sprite for a player look, rendering it on first use.
+
+        The resolution follows the current view zoom (rounded up to a power of
+        two) so sprites stay sharp in close-up camera modes.
+
+        Parameters
+        ----------
+        main_color, sec_color, num_color : str
+            Hex colors for top half, bottom half, and number.
+        number : int | str
+            Shirt number.
+        radius, inner_radius : float
+            Outer and inner disc radii in scene units.
+
+        Returns
+        -------
+        QPixmap
+            Square sprite covering the outer disc.
+        """
+        px_per_unit = abs(self.view.transform().m11()) * self.view.devicePixelRatioF()
+        size = 2 ** max(5, min(9, math.ceil(math.log2(max(1.0, 2 * radius * px_per_unit)))))
+        key = (main_color, sec_color, num_color, str(number), radius, inner_radius, size)
+        pixmap = self._player_atlas.get(key)
+        if pixmap is not None:
+            return pixmap
+
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.TextAntialiasing)
+        # Paint in scene units, centered on the disc
+        painter.scale(size / (2 * radius), size / (2 * radius))
+        painter.translate(radius, radius)
+        painter.setPen(Qt.PenStyle.NoPen)
+
+        path_bottom, path_top = self._half_disc_paths(radius)
+        painter.setBrush(self._brush(sec_color))
+        painter.drawPath(path_bottom)
+        painter.setBrush(self._brush(main_color))
+        painter.drawPath(path_top)
+
+        painter.drawEllipse(QRectF(-inner_radius, -inner_radius, inner_radius*2, inner_radius*2))
+
+        # Number, flipped so it reads upright in the y-up view
+        font, static_text = self._number_glyphs(str(number), int(inner_radius * 1.8))
+        text_size = static_text.size()
+        painter.setFont(font)
+        painter.setPen(QColor(num_color))
+        painter.scale(1, -1)
+        painter.drawStaticText(QPointF(-text_size.width() / 2, -text_size.height() / 2), static_text)
+        painter.end()
+
+        self._player_atlas[key] = pixmap
+        return pixmap
 
 
     def draw_ball(self, x, y, color=None):
@@ -389,13 +690,14 @@ class PitchWidget(QWidget):
         
         ball_radius = CONFIG.BALL_RADIUS
         
-        ball = self.scene.addEllipse(
+        ball = self.persistent_item("ball", QGraphicsEllipseItem)
+        ball.setRect(
             x - ball_radius, y - ball_radius,
-            ball_radius * 2, ball_radius * 2,
-            QPen(QColor(color), 0.3), QBrush(QColor(color))
+            ball_radius * 2, ball_radius * 2
         )
+        ball.setPen(self._pen(color, 0.3))
+        ball.setBrush(self._brush(color))
         ball.setZValue(100)
-        self.dynamic_items.append(ball)
         return ball
 
 
@@ -416,24 +718,25 @@ class PitchWidget(QWidget):
         QGraphicsLineItem | None
             The created line or None.
         """
-        if not visible:
+        if not visible or x_offside is None:
+            self._hide_persistent("offside")
             return None
         
         if color is None:
             color = self.theme.get("offside", "#FF40FF")
         
-        if visible and x_offside is not None:
-            pen = QPen(QColor(color), CONFIG.OFFSIDE_LINE_WIDTH)
-            pen.setStyle(Qt.PenStyle.DotLine)
-            line = self.scene.addLine(x_offside, self.Y_MIN, x_offside, self.Y_MAX+1, pen)
-            line.setZValue(199)
-            self.dynamic_items.append(line)
-            return line
+        line = self.persistent_item("offside", QGraphicsLineItem)
+        line.setLine(x_offside, self.Y_MIN, x_offside, self.Y_MAX+1)
+        line.setPen(self._pen(color, CONFIG.OFFSIDE_LINE_WIDTH, Qt.PenStyle.DotLine))
+        return line
 
 
     def draw_pressure(self, x, y, color, opacity=0.5):
         """Draw a translucent circle to represent local pressure.
 
+        The disc is a cached pixmap sprite per color, so repeated frames only
+        blit instead of rasterizing a translucent ellipse.
+
         Parameters
         ----------
         x, y : float
@@ -445,20 +748,117 @@ class PitchWidget(QWidget):
 
         Returns
         -------
-        QGraphicsEllipseItem
+        QGraphicsPixmapItem
             The created pressure disk.
         """
 
-        ellipse = QGraphicsEllipseItem(
-            x - CONFIG.PLAYER_OUTER_RADIUS * 2, y - CONFIG.PLAYER_OUTER_RADIUS * 2, 2*CONFIG.PLAYER_OUTER_RADIUS * 2, 2*CONFIG.PLAYER_OUTER_RADIUS * 2
-        )
-        ellipse.setBrush(QBrush(QColor(color)))
-        ellipse.setOpacity(opacity)
-        ellipse.setPen(QPen(Qt.PenStyle.NoPen))
-        ellipse.setZValue(110)
-        self.scene.addItem(ellipse)
-        self.dynamic_items.append(ellipse)
-        return ellipse
+        diameter = 4 * CONFIG.PLAYER_OUTER_RADIUS
+        sprite = self.persistent_item("pressure", self._new_sprite)
+        pixmap = self._pressure_pixmap(QColor(color), opacity)
+        if sprite.pixmap().cacheKey() != pixmap.cacheKey():
+            sprite.setPixmap(pixmap)
+        sprite.setScale(diameter / _PRESSURE_SPRITE_PX)
+        sprite.setPos(x - diameter / 2, y - diameter / 2)
+        sprite.setZValue(110)
+        return sprite
+
+    def _arrow_path(self, radius, arrow_length, chevron_size):
+        """
+        Return the shaft + chevron path pointing along +x in item coordinates.
+
+        Lengths are rounded to the centimetre so the cache stays small while
+        velocities vary continuously; it only holds paths for the current
+        player scale and is dropped when that changes.
+        """
+        if self._arrow_path_dims != (radius, chevron_size):
+            self._arrow_path_cache.clear()
+            self._arrow_path_dims = (radius, chevron_size)
+        key = round(arrow_length, 2)
+        path = self._arrow_path_cache.get(key)
+        if path is None:
+            end_x = radius + key
+            path = QPainterPath()
+            path.moveTo(radius, 0)
+            path.lineTo(end_x, 0)
+            path.moveTo(end_x + chevron_size * _CHEVRON_COS, chevron_size * _CHEVRON_SIN)
+            path.lineTo(end_x, 0)
+            path.lineTo(end_x + chevron_size * _CHEVRON_COS, -chevron_size * _CHEVRON_SIN)
+            path = self._arrow_path_cache[key] = path
+        return path
+
+    def _half_disc_paths(self, radius):
+        """Return the (bottom, top) half-disc paths for `radius`, built once per radius."""
+        paths = self._half_disc_cache.get(radius)
+        if paths is None:
+            disc = QRectF(-radius, -radius, 2*radius, 2*radius)
+            path_bottom = QPainterPath()
+            path_bottom.moveTo(0, 0)
+            path_bottom.arcTo(disc, 0, 180)
+            path_bottom.closeSubpath()
+            path_top = QPainterPath()
+            path_top.moveTo(0, 0)
+            path_top.arcTo(disc, 180, 180)
+            path_top.closeSubpath()
+            paths = self._half_disc_cache[radius] = (path_bottom, path_top)
+        return paths
+
+    def _number_glyphs(self, number, point_size):
+        """Return the shirt-number font and a pre-laid-out QStaticText.
+
+        Parameters
+        ----------
+        number : str
+            Shirt number text.
+        point_size : int
+            Font point size.
+
+        Returns
+        -------
+        tuple[QFont, QStaticText]
+            Bold Arial font and the laid-out number.
+        """
+        key = (number, point_size)
+        glyphs = self._number_text_cache.get(key)
+        if glyphs is None:
+            font = QFont("Arial")
+            font.setBold(True)
+            font.setPointSize(point_size)
+            static_text = QStaticText(number)
+            static_text.setTextFormat(Qt.TextFormat.PlainText)
+            static_text.prepare(QTransform(), font)
+            glyphs = self._number_text_cache[key] = (font, static_text)
+        return glyphs
+
+    def _pressure_pixmap(self, color, opacity):
+        """Return a cached translucent disc sprite for the given color.
+
+        Parameters
+        ----------
+        color : QColor
+            Fill color.
+        opacity : float
+            Opacity in [0, 1], baked into the sprite alpha.
+
+        Returns
+        -------
+        QPixmap
+            Square pixmap of `_PRESSURE_SPRITE_PX` pixels.
+        """
+        key = (color.name(), opacity)
+        pixmap = self._pressure_pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(_PRESSURE_SPRITE_PX, _PRESSURE_SPRITE_PX)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            fill = QColor(color)
+            fill.setAlphaF(opacity)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QBrush(fill))
+            painter.drawEllipse(0, 0, _PRESSURE_SPRITE_PX, _PRESSURE_SPRITE_PX)
+            painter.end()
+            self._pressure_pixmap_cache[key] = pixmap
+        return pixmap
         
 
     def draw_pressure_for_ball_carrier(
@@ -557,7 +957,10 @@ class PitchWidget(QWidget):
 
         # Center on the carrier (not the ball)
         xy = xy_objects[half][carrier_side].xy[idx]
-        i = (home_ids if carrier_side=="Home" else away_ids).index(carrier_pid)
+        # Index the rosters passed in; rebuilt only when they differ from the cached ones
+        if self._roster_key != (tuple(home_ids), tuple(away_ids)):
+            self.set_rosters(home_ids, away_ids)
+        i = self._home_ix[carrier_pid] if carrier_side == "Home" else self._away_ix[carrier_pid]
         x, y = xy[2*i], xy[2*i+1]
 
         self.draw_pressure(x, y, color=color)
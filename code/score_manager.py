@@ -4,6 +4,8 @@
 Score extraction from events to display running score by frame.
 """
 
+import numpy as np
+import pandas as pd
 from config import *
 
 class ScoreManager:
@@ -26,12 +28,32 @@ class ScoreManager:
         self.away_team_name = away_team_name
         self.n_frames_firstHalf = n_frames_firstHalf
         self.fps = fps
-        self.goals = []
-        
-        self._extract_goals(events)
+        self._goals = []
+        # Event tables are keyed by side ("Home"/"Away") or by team name
+        self._home_keys = frozenset(("Home", home_team_name))
+        self._away_keys = frozenset(("Away", away_team_name))
+        # Goals are extracted on first use so construction stays cheap at startup
+        self._pending_events = events
+    
+    @property
+    def goals(self):
+        """list[dict]: Parsed goals sorted by frame."""
+        self._ensure_goals()
+        return self._goals
+    
+    def _ensure_goals(self):
+        """Run the deferred goal extraction once."""
+        if self._pending_events is not None:
+            events, self._pending_events = self._pending_events, None
+            self._extract_goals(events)
     
     def _extract_goals(self, events):
-        """Extract goals from events and store them with computed frame indices."""
+        """Extract goals from events and store them with computed frame indices.
+
+        All (segment, team) event tables are stacked into one DataFrame so the
+        goal mask and frame computation run as a single vectorized pass.
+        """
+        parts = []
         for segment in events:
             # Compute frame offset based on the half
             frame_offset = 0
@@ -39,38 +61,93 @@ class ScoreManager:
                 frame_offset = self.n_frames_firstHalf
             
             for team_key in events[segment]:  # "Home"/"Away" or actual team name
+                # Resolve the side once per team table; goals of unknown teams never count
+                if team_key in self._home_keys:
+                    is_home = True
+                elif team_key in self._away_keys:
+                    is_home = False
+                else:
+                    continue
                 df = events[segment][team_key].events
-                
-                # Detect goals (mirror extract_match_actions_from_events logic)
-                for _, row in df.iterrows():
-                    eid = row.get('eID', None)
-                    eid_str = str(eid) if eid is not None else ""
-                    
-                    # Check if it's a goal (same logic as in data_processing.py)
-                    is_goal = (eid_str == "ShotAtGoal_SuccessfulShot" or 
-                              eid_str == "1" or 
-                              eid == 1)
-                    
-                    if is_goal:
-                        minute = int(row.get("minute", 0) or 0)
-                        second = int(row.get("second", 0) or 0)
-                        frame = int((minute * 60 + second) * self.fps) + frame_offset
-                        
-                        self.goals.append({
-                            'frame': frame,
-                            'team_key': team_key,
-                            'minute': minute,
-                            'second': second,
-                            'segment': segment,
-                            'eid': eid
-                        })
-        
-        # Sort by frame
-        self.goals.sort(key=lambda x: x['frame'])
-        
+                if 'eID' not in df.columns or df.empty:
+                    continue
+                part = df.reindex(columns=['eID', 'minute', 'second'])
+                part['team_key'] = team_key
+                part['is_home'] = is_home
+                part['segment'] = segment
+                part['frame_offset'] = frame_offset
+                parts.append(part)
+
+        if parts:
+            big = pd.concat(parts, ignore_index=True)
+
+            # Detect goals (mirror extract_match_actions_from_events logic)
+            # Compare the raw column to each form of the goal ID instead of
+            # stringifying every event first
+            eids = big['eID']
+            is_goal = (
+                (eids == "ShotAtGoal_SuccessfulShot").to_numpy()
+                | (eids == "1").to_numpy()
+                | (eids == 1).to_numpy()
+            )
+            goals = big.loc[is_goal]
+            minutes = self._time_column(goals['minute'])
+            seconds = self._time_column(goals['second'])
+            frames = ((minutes * 60 + seconds) * self.fps).astype(int) + goals['frame_offset'].to_numpy()
+
+            # Order goals by frame on the arrays, then materialize the records once
+            order = np.argsort(frames, kind='stable')
+            self._goals = [
+                {
+                    'frame': int(frame),
+                    'team_key': team_key,
+                    'is_home': bool(is_home),
+                    'minute': int(minute),
+                    'second': int(second),
+                    'segment': segment,
+                    'eid': goal_eid
+                }
+                for frame, minute, second, team_key, is_home, segment, goal_eid in zip(
+                    frames[order], minutes[order], seconds[order],
+                    goals['team_key'].to_numpy()[order], goals['is_home'].to_numpy()[order],
+                    goals['segment'].to_numpy()[order], goals['eID'].to_numpy()[order]
+                )
+            ]
+
+        self._build_goal_arrays()
+
+    def _build_goal_arrays(self):
+        """Build per-frame running score tables up to the last goal.
+
+        Each table holds the score at every frame from 0 to the last goal
+        frame, so a score query is a single array index; later frames use
+        the final score.
+        """
+        frames = np.array([g['frame'] for g in self._goals], dtype=np.int64)
+        is_home = np.array([g['is_home'] for g in self._goals], dtype=bool)
+        n = int(frames.max()) + 1 if len(frames) else 0
+        frames = np.clip(frames, 0, None)
+        # Read-only arrays are shared with consumers that slice whole ranges
+        self._home_arr = np.bincount(frames[is_home], minlength=n).cumsum()
+        self._away_arr = np.bincount(frames[~is_home], minlength=n).cumsum()
+        self._home_arr.setflags(write=False)
+        self._away_arr.setflags(write=False)
+        # Scalar reads of a list skip NumPy's per-call dispatch and int() boxing
+        self._home_tbl = self._home_arr.tolist()
+        self._away_tbl = self._away_arr.tolist()
+        n_home = int(np.count_nonzero(is_home))
+        self._final_score = (n_home, len(is_home) - n_home)
+
+    @staticmethod
+    def _time_column(column):
+        """Return an integer time column (missing values as 0) as a NumPy array."""
+        return pd.to_numeric(column, errors="coerce").fillna(0).to_numpy().astype(int)
+
     def get_score_at_frame(self, frame):
         """Return (home_score, away_score) at the provided global frame index.
 
+        A constant-time lookup into the per-frame score tables.
+
         Parameters
         ----------
         frame : int
@@ -81,30 +158,28 @@ class ScoreManager:
         tuple[int, int]
             Home and Away scores at or before the given frame.
         """
-        home_score = 0
-        away_score = 0
-        
-        for goal in self.goals:
-            if goal['frame'] <= frame:
-                team_key = goal['team_key']
-                
-                # Try different matches for team names vs Home/Away keys
-                is_home_goal = (
-                    team_key == "Home" or 
-                    team_key == self.home_team_name
-                )
-                
-                is_away_goal = (
-                    team_key == "Away" or 
-                    team_key == self.away_team_name
-                )
-                
-                if is_home_goal:
-                    home_score += 1
-                elif is_away_goal:
-                    away_score += 1
-        
-        return home_score, away_score
+        if self._pending_events is not None:
+            self._ensure_goals()
+        if frame < 0:
+            return 0, 0
+        if frame >= len(self._home_tbl):
+            return self._final_score
+        return self._home_tbl[frame], self._away_tbl[frame]
+    
+    def get_score_arrays(self):
+        """Return the shared per-frame (home, away) score tables.
+
+        The arrays are read-only and end at the last goal frame; later frames
+        hold the final score. Use them to slice a frame range in one call
+        instead of querying `get_score_at_frame` per frame.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Home and Away running scores indexed by global frame.
+        """
+        self._ensure_goals()
+        return self._home_arr, self._away_arr
     
     def get_all_goals(self):
         """Return all parsed goals (for debugging/inspection).
@@ -112,6 +187,6 @@ class ScoreManager:
         Returns
         -------
         list[dict]
-            Goal entries with 'frame', 'team_key', and raw fields.
+            Goal entries with 'frame', 'team_key', 'is_home', and raw fields.
         """
         return self.goals
\ No newline at end of file
@@ -8,15 +8,22 @@ Provides:
 - `SettingsDialog`: non-modal dialog to adjust player scale and colors
 """
 
+from contextlib import contextmanager
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QSlider, 
     QPushButton, QColorDialog, QGroupBox, QGridLayout
 )
-from PyQt6.QtCore import pyqtSignal, QObject, Qt
+from PyQt6.QtCore import pyqtSignal, QObject, Qt, QTimer
 from PyQt6.QtGui import QColor
 from config import BALL_COLOR, CONFIG
 
 
+def _canonical_color(color):
+    """Return `color` as Qt's lowercase '#rrggbb' name so equal colors compare equal."""
+    return QColor(color).name()
+
+
 class SettingsManager(QObject):
     """Central store for visual settings with Qt signals.
 
@@ -38,12 +45,16 @@ class SettingsManager(QObject):
         
         # Defaults
         self._player_scale = 1.0
-        self._ball_color = BALL_COLOR
-        self._offside_color = "#FF40FF"  # default magenta
-        self._arrow_color = "#000000"    # default black
+        self._ball_color = _canonical_color(BALL_COLOR)
+        self._offside_color = _canonical_color("#FF40FF")  # default magenta
+        self._arrow_color = _canonical_color("#000000")    # default black
         self._custom_arrow_color = False
         self._custom_offside_color = False
         
+        # Batching: settingsChanged is held back while > 0
+        self._batching = 0
+        self._dirty = False
+        
         # Bounds
         self.MIN_PLAYER_SCALE = 0.5
         self.MAX_PLAYER_SCALE = 2.0
@@ -59,7 +70,7 @@ class SettingsManager(QObject):
             self._player_scale = value
             CONFIG.scale = value  # update global dynamic config
             self.playerScaleChanged.emit(value)
-            self.settingsChanged.emit()
+            self._emit_changed()
     
     @property
     def ball_color(self):
@@ -67,10 +78,11 @@ class SettingsManager(QObject):
     
     @ball_color.setter
     def ball_color(self, color):
+        color = _canonical_color(color)
         if self._ball_color != color:
             self._ball_color = color
             self.ballColorChanged.emit(color)
-            self.settingsChanged.emit()
+            self._emit_changed()
     
     @property
     def offside_color(self):
@@ -78,11 +90,12 @@ class SettingsManager(QObject):
     
     @offside_color.setter
     def offside_color(self, color):
+        color = _canonical_color(color)
         if self._offside_color != color:
             self._offside_color = color
             self._custom_offside_color = True
             self.offsideColorChanged.emit(color)
-            self.settingsChanged.emit()
+            self._emit_changed()
     
     @property
     def arrow_color(self):
@@ -90,20 +103,42 @@ class SettingsManager(QObject):
     
     @arrow_color.setter
     def arrow_color(self, color):
+        color = _canonical_color(color)
         if self._arrow_color != color:
             self._arrow_color = color
             self._custom_arrow_color = True
             self.arrowColorChanged.emit(color)
+            self._emit_changed()
+    
+    def _emit_changed(self):
+        """Emit ``settingsChanged`` now, or once at the end of a batch."""
+        if self._batching:
+            self._dirty = True
+        else:
             self.settingsChanged.emit()
     
+    @contextmanager
+    def batch(self):
+        """Group several updates so ``settingsChanged`` fires at most once."""
+        self._batching += 1
+        try:
+            yield self
+        finally:
+            self._batching -= 1
+            if not self._batching and self._dirty:
+                self._dirty = False
+                self.settingsChanged.emit()
+    
     def reset_theme_colors(self, theme):
         self._custom_arrow_color = False
         self._custom_offside_color = False
-        # Set without re-emitting settingsChanged (avoid double update)
-        self._ball_color = BALL_COLOR
-        self._arrow_color = theme.get("arrow", "#000000")
-        self._offside_color = theme.get("offside", "#FF40FF")
-        self.settingsChanged.emit()
+        # Set without re-emitting per-color signals (avoid double update)
+        colors = tuple(map(_canonical_color, (
+            BALL_COLOR, theme.get("arrow", "#000000"), theme.get("offside", "#FF40FF")
+        )))
+        if colors != (self._ball_color, self._arrow_color, self._offside_color):
+            self._ball_color, self._arrow_color, self._offside_color = colors
+            self._emit_changed()
     
     def get_all_settings(self):
         """Return dictionary with all settings.
@@ -133,10 +168,11 @@ class ColorButton(QPushButton):
     """
     
     colorChanged = pyqtSignal(str)
+    _STYLE_CACHE = {}  # hex color -> style sheet
     
     def __init__(self, color="#FFFFFF", parent=None):
         super().__init__(parent)
-        self._color = color
+        self._color = None
         self.setFixedSize(60, 30)
         self.update_color(color)
         self.clicked.connect(self._on_clicked)
@@ -157,8 +193,13 @@ class ColorButton(QPushButton):
         color : str
             Hex color string.
         """
+        # setStyleSheet re-parses and re-polishes; skip it when nothing changed
+        if color == self._color:
+            return
         self._color = color
-        self.setStyleSheet(f"""
+        style = ColorButton._STYLE_CACHE.get(color)
+        if style is None:
+            style = ColorButton._STYLE_CACHE[color] = f"""
             QPushButton {{
                 background-color: {color};
                 border: 2px solid #333;
@@ -167,7 +208,8 @@ class ColorButton(QPushButton):
             QPushButton:hover {{
                 border: 2px solid #666;
             }}
-        """)
+        """
+        self.setStyleSheet(style)
     
     def get_color(self):
         """Return current color string."""
@@ -194,6 +236,12 @@ class SettingsDialog(QDialog):
         self.setFixedSize(350, 400)
         
         self._current_theme = getattr(parent, 'current_theme', None)
+        # Slider drags fire on every tick; only the last value in 20 ms is applied
+        self._pending_scale = None
+        self._commit_timer = QTimer(self)
+        self._commit_timer.setSingleShot(True)
+        self._commit_timer.setInterval(20)
+        self._commit_timer.timeout.connect(self._commit_scale)
         self._setup_ui()
         self._load_current_settings()
         self._connect_signals()
@@ -278,12 +326,13 @@ class SettingsDialog(QDialog):
         """Load current settings into the widgets."""
         settings = self.settings_manager.get_all_settings()
         
-        # Player size
+        # Player size (only touch widgets whose value differs)
         scale_value = int(settings['player_scale'] * 100)
-        self.size_slider.setValue(scale_value)
+        if self.size_slider.value() != scale_value:
+            self.size_slider.setValue(scale_value)
         self._update_size_label(scale_value)
         
-        # Colors
+        # Colors (update_color is a no-op for an unchanged color)
         self.ball_color_btn.update_color(settings['ball_color'])
         self.offside_color_btn.update_color(settings['offside_color'])
         self.arrow_color_btn.update_color(settings['arrow_color'])
@@ -306,9 +355,15 @@ class SettingsDialog(QDialog):
     
     def _on_size_changed(self, value):
         """Handle player size slider change and propagate to settings manager."""
-        scale = value / 100.0
         self._update_size_label(value)
-        self.settings_manager.player_scale = scale
+        self._pending_scale = value / 100.0
+        self._commit_timer.start()
+    
+    def _commit_scale(self):
+        """Apply the last pending slider scale to the settings manager."""
+        if self._pending_scale is not None:
+            self.settings_manager.player_scale = self._pending_scale
+            self._pending_scale = None
     
     def _update_size_label(self, value):
         """Update the size label text."""
@@ -317,10 +372,19 @@ class SettingsDialog(QDialog):
     
     def _on_reset(self):
         """Reset everything to current theme values and scale 1."""
-        # reset colors (current theme)
-        if self._current_theme is not None:
-            self.settings_manager.reset_theme_colors(self._current_theme)
-        # reset player size
-        self.settings_manager.player_scale = 1.0
+        with self.settings_manager.batch():
+            # reset colors (current theme)
+            if self._current_theme is not None:
+                self.settings_manager.reset_theme_colors(self._current_theme)
+            # reset player size
+            self._commit_timer.stop()
+            self._pending_scale = None
+            self.settings_manager.player_scale = 1.0
         # reload widgets
-        self._load_current_settings()
\ No newline at end of file
+        self._load_current_settings()
+    
+    def closeEvent(self, event):
+        """Flush a pending slider value before the dialog is destroyed."""
+        self._commit_timer.stop()
+        self._commit_scale()
+        super().closeEvent(event)
\ No newline at end of file
@@ -4,153 +4,343 @@ Timeline widgets: slider with hover preview and action markers.
 
 Contains:
 - `TimelineSlider`: QSlider with hover frame/time preview
-- `ActionMarker`: clickable emoji marker for an action
+- `MarkerStrip`: single painted bar of clickable emoji action markers
 - `TimelineWidget`: slider + markers + zoomed overlay with action context
 - `ZoomedMarkersWidget`: floating strip showing nearby actions
 """
 
-from PyQt6.QtWidgets import QSlider, QToolTip, QWidget, QVBoxLayout, QLabel, QFrame, QApplication, QHBoxLayout
-from PyQt6.QtCore import QEvent, pyqtSignal, QRect, QTimer, Qt
-from PyQt6.QtGui import QPainter, QPen, QColor, QFont, QCursor, QBrush
+from PyQt6.QtWidgets import QSlider, QStyle, QToolTip, QWidget, QVBoxLayout, QLabel, QFrame, QApplication, QHBoxLayout
+from PyQt6.QtCore import pyqtSignal, QRect, QTimer, QElapsedTimer, Qt
+from PyQt6.QtGui import QPainter, QPen, QColor, QFont, QFontMetrics, QBrush, QPixmap
 from data_processing import format_match_time
-from config import *
+from config import (
+    FPS, MAX_TIMELINE_WIDTH, MIN_TIMELINE_WIDTH, TIMELINE_GROOVE_HEIGHT, TIMELINE_HANDLE_HEIGHT,
+    TIMELINE_HANDLE_WIDTH, TIMELINE_HOVER_INTERVAL_MS, TIMELINE_SLIDER_HEIGHT,
+)
 import sys
+from bisect import bisect_right
+from functools import lru_cache
+import numpy as np
+
+# Paint resources shared by every paintEvent (fonts need a QApplication and are built per widget)
+_PREVIEW_BRUSH = QBrush(QColor(33, 150, 243, 60))
+_PREVIEW_PEN = QPen(QColor(33, 150, 243, 120), 1)
+_TOOLTIP_BRUSH = QBrush(QColor(30, 30, 30, 200))
+_TOOLTIP_PEN = QPen(QColor(33, 150, 243), 1)
+_TEXT_COLOR = QColor(255, 255, 255)
+_SELECTED_BRUSH = QBrush(QColor(33, 150, 243, 50))
+_SELECTED_PEN = QPen(QColor(33, 150, 243), 2)
+_CLOSE_PEN_COLOR = QColor(255, 80, 80)
+_CLOSE_BRUSH = QBrush(QColor(255, 80, 80, 100))
+_SUBTITLE_COLOR = QColor(200, 200, 200, 200)
+_GROOVE_BRUSH = QBrush(QColor(255, 255, 255, 26))   # rgba(255, 255, 255, 0.1)
+_SUB_PAGE_BRUSH = QBrush(QColor("#2196F3"))
+_HANDLE_BRUSH = QBrush(QColor("#2196F3"))
+_HANDLE_HOVER_BRUSH = QBrush(QColor("#42A5F5"))
+
+
+
+@lru_cache(maxsize=None)
+def _resolve_font(family, point_size, fallback=None):
+    """Return a QFont for `family`, or `fallback` if it is not installed.
+
+    Resolved once per process: exactMatch() walks the font database. Called
+    lazily because fonts need a QApplication.
+    """
+    font = QFont(family, point_size)
+    if fallback is not None and not font.exactMatch():
+        font = QFont(fallback, point_size)
+    return font
 
 
 class TimelineSlider(QSlider):
-    """Slider that shows a hover preview line and time tooltip."""
+    """Slider that shows a hover preview line and time tooltip.
+
+    The tooltip is painted by the widget itself; QToolTip is never used here.
+    """
     hoverFrameChanged = pyqtSignal(int, str)  # frame, time_str
     def __init__(self, n_frames_firstHalf, n_frames_secondHalf, parent=None):
         super().__init__(Qt.Orientation.Horizontal, parent)
         self.n_frames_firstHalf = n_frames_firstHalf
         self.n_frames_secondHalf = n_frames_secondHalf
+        self.clock_label = self._format_clock  # frame -> match clock string, see TimelineWidget.set_clock_labels
         self.setMouseTracking(True)
         self.hover_pos = None
         self.hover_time_str = ""
         self.hover_frame = None
+        # Hover preview is coalesced to TIMELINE_HOVER_INTERVAL_MS; drags are not
+        self._pending_hover_x = None
+        self._last_hover_ms = -TIMELINE_HOVER_INTERVAL_MS
+        self._hover_clock = QElapsedTimer()
+        self._hover_clock.start()
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.timeout.connect(self._flush_hover)
+        # Area covered by the last painted overlay (preview bar, line, tooltip)
+        self._last_overlay_rect = QRect()
+        self._tooltip_font = QFont("Arial", 11)  # same size as the bottom-left time label
+        self._tooltip_fm = QFontMetrics(self._tooltip_font)
+        self._groove_pix = None  # groove rendered once per widget size
+        # Width/maximum cached for the pixel <-> frame math on the mouse-move path
+        self._w = self.width()
+        self._max = self.maximum()
+        self.rangeChanged.connect(self._on_range_changed)
+
+    def _on_range_changed(self, minimum, maximum):
+        self._max = maximum
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._w = self.width()
+
+    def _format_clock(self, frame):
+        """Default match clock: format the frame on demand."""
+        return format_match_time(frame, self.n_frames_firstHalf, self.n_frames_secondHalf, fps=FPS)
+
+    def _frame_at(self, x):
+        """Return the frame under widget x-coordinate `x`, clamped to the range."""
+        frame = int(x / self._w * self._max)
+        return max(0, min(frame, self._max))
 
     def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton and self.width() > 0:
-            ratio = event.position().x() / self.width()
-            frame = int(ratio * self.maximum())
-            frame = max(0, min(frame, self.maximum()))
-            self.setValue(frame)
+        if event.button() == Qt.MouseButton.LeftButton and self._w > 0:
+            self.setValue(self._frame_at(event.position().x()))
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
         super().mouseMoveEvent(event)
-        if self.width() > 0:
-            ratio = event.position().x() / self.width()
-            frame = int(ratio * self.maximum())
-            frame = max(0, min(frame, self.maximum()))
+        if self._w > 0:
+            x = event.position().x()
             if event.buttons() & Qt.MouseButton.LeftButton:
-                self.setValue(frame)
-            time_str = format_match_time(frame, self.n_frames_firstHalf, self.n_frames_secondHalf, fps=FPS)
-            self.hover_pos = int(event.position().x())
-            self.hover_time_str = time_str
-            self.hover_frame = frame
-            self.hoverFrameChanged.emit(frame, time_str)
-            self.update()
+                self.setValue(self._frame_at(x))
+            self._pending_hover_x = x
+            elapsed = self._hover_clock.elapsed() - self._last_hover_ms
+            if elapsed >= TIMELINE_HOVER_INTERVAL_MS:
+                self._flush_hover()
+            elif not self._hover_timer.isActive():
+                self._hover_timer.start(TIMELINE_HOVER_INTERVAL_MS - elapsed)
+
+    def _flush_hover(self):
+        """Apply the latest pending hover position (preview, signal, repaint)."""
+        x = self._pending_hover_x
+        if x is None or self._w <= 0:
+            return
+        self._pending_hover_x = None
+        self._last_hover_ms = self._hover_clock.elapsed()
+        frame = self._frame_at(x)
+        # Sub-pixel motion: same pixel and frame, nothing to emit or repaint
+        if frame == self.hover_frame and int(x) == self.hover_pos:
+            return
+        time_str = self.clock_label(frame)
+        self.hover_pos = int(x)
+        self.hover_time_str = time_str
+        self.hover_frame = frame
+        self.hoverFrameChanged.emit(frame, time_str)
+        self._update_overlay()
+
+    def _update_overlay(self):
+        """Repaint only the union of the previous and the current overlay areas."""
+        new_rect = self._overlay_rect()
+        self.update(self._last_overlay_rect.united(new_rect))
+        self._last_overlay_rect = new_rect
+
+    def _tooltip_geometry(self):
+        """Return (x, y, text_width, text_height) of the hover time tooltip text."""
+        text_width = self._tooltip_fm.horizontalAdvance(self.hover_time_str)
+        text_height = self._tooltip_fm.height()
+        # Next to the hover cursor, same height as real time label
+        tooltip_x = self.hover_pos + 10  # 10px to the right of the cursor
+        tooltip_y = 15
+        # Keep the tooltip inside the widget bounds
+        if tooltip_x + text_width > self._w - 5:
+            tooltip_x = self.hover_pos - text_width - 10  # to the left of the cursor
+        return tooltip_x, tooltip_y, text_width, text_height
+
+    def _real_pos(self):
+        """Return the x-coordinate of the current slider value."""
+        return (self.value() / self._max) * self._w if self._max > 0 else 0
+
+    def _overlay_rect(self):
+        """Return the widget area painted by the hover overlay (empty when not hovering)."""
+        if self.hover_pos is None or self.hover_frame is None:
+            return QRect()
+        real_pos = int(self._real_pos())
+        tooltip_x, _, text_width, _ = self._tooltip_geometry()
+        # Padding covers the tooltip border/padding and antialiasing
+        left = min(real_pos, self.hover_pos, tooltip_x) - 6
+        right = max(real_pos, self.hover_pos, tooltip_x + text_width) + 6
+        return QRect(left, 0, right - left, self.height())
 
     def leaveEvent(self, event):
         super().leaveEvent(event)
-        QToolTip.hideText()
+        self._hover_timer.stop()
+        self._pending_hover_x = None
         self.hover_pos = None
         self.hover_time_str = ""
         self.hover_frame = None
-        self.update()
+        self.update(self._last_overlay_rect)
+        self._last_overlay_rect = QRect()
+
+    def _paint_slider(self, painter):
+        """Paint groove, filled part and handle without going through the style sheet.
+
+        The style sheet set by TimelineWidget still defines the geometry used
+        for mouse interaction; painting it is replaced by a cached groove
+        pixmap plus two rounded rects.
+        """
+        w, h = self._w, self.height()
+        groove_y = (h - TIMELINE_GROOVE_HEIGHT) // 2
+        dpr = self.devicePixelRatioF()
+        if (self._groove_pix is None or self._groove_pix.devicePixelRatio() != dpr
+                or self._groove_pix.width() != int(w * dpr) or self._groove_pix.height() != int(h * dpr)):
+            self._groove_pix = QPixmap(int(w * dpr), int(h * dpr))
+            self._groove_pix.setDevicePixelRatio(dpr)
+            self._groove_pix.fill(Qt.GlobalColor.transparent)
+            pix_painter = QPainter(self._groove_pix)
+            pix_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            pix_painter.setPen(Qt.PenStyle.NoPen)
+            pix_painter.setBrush(_GROOVE_BRUSH)
+            pix_painter.drawRoundedRect(0, groove_y, w, TIMELINE_GROOVE_HEIGHT, 3, 3)
+            pix_painter.end()
+        painter.drawPixmap(0, 0, self._groove_pix)
+
+        handle_x = QStyle.sliderPositionFromValue(
+            self.minimum(), self._max, self.value(), max(0, w - TIMELINE_HANDLE_WIDTH)
+        )
+        handle_y = (h - TIMELINE_HANDLE_HEIGHT) // 2
+        painter.setPen(Qt.PenStyle.NoPen)
+        # Filled part up to the handle centre
+        painter.setBrush(_SUB_PAGE_BRUSH)
+        painter.drawRoundedRect(0, groove_y, handle_x + TIMELINE_HANDLE_WIDTH // 2, TIMELINE_GROOVE_HEIGHT, 3, 3)
+        hovered = self.hover_pos is not None and handle_x <= self.hover_pos < handle_x + TIMELINE_HANDLE_WIDTH
+        painter.setBrush(_HANDLE_HOVER_BRUSH if hovered else _HANDLE_BRUSH)
+        painter.drawRoundedRect(handle_x, handle_y, TIMELINE_HANDLE_WIDTH, TIMELINE_HANDLE_HEIGHT, 2, 2)
 
     def paintEvent(self, event):
-        super().paintEvent(event)
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._paint_slider(painter)
+        if self.hover_pos is None or self.hover_frame is None:
+            return
+        # Remember what this paint covers so the next hover move clears it exactly
+        self._last_overlay_rect = self._overlay_rect()
+        if not event.region().intersects(self._last_overlay_rect):
+            return
         
-        if self.hover_pos is not None and self.hover_frame is not None:
-            current_value = self.value()
-            
-            # Preview bar between real cursor and hover cursor
-            real_pos = (current_value / self.maximum()) * self.width() if self.maximum() > 0 else 0
-            hover_pos = self.hover_pos
-            
-            if abs(hover_pos - real_pos) > 2:
-                start_x = min(real_pos, hover_pos)
-                end_x = max(real_pos, hover_pos)
-                y_center = self.height() // 2
-                bar_y = y_center - TIMELINE_GROOVE_HEIGHT // 2
-                
-                preview_brush = QBrush(QColor(33, 150, 243, 60))
-                painter.setBrush(preview_brush)
-                painter.setPen(QPen(Qt.PenStyle.NoPen))
-                painter.drawRect(int(start_x), bar_y, int(end_x - start_x), TIMELINE_GROOVE_HEIGHT)
-            
-            # Imaginary cursor line at hover position
-            preview_pen = QPen(QColor(33, 150, 243, 120), 1)
-            painter.setPen(preview_pen)
-            painter.drawLine(self.hover_pos, 0, self.hover_pos, self.height())
-            
-            # Tooltip at the same height as the time label in the bottom-left
-            current_hover_time = format_match_time(self.hover_frame, self.n_frames_firstHalf, self.n_frames_secondHalf, fps=FPS)
-            
-            font = QFont("Arial", 11)  # same size as the bottom-left time label
-            painter.setFont(font)
-            fm = painter.fontMetrics()
-            text_width = fm.horizontalAdvance(current_hover_time)
-            text_height = fm.height()
-            
-            # Next to the hover cursor, same height as real time label
-            tooltip_x = self.hover_pos + 10  # 10px to the right of the cursor
-            tooltip_y = 15
-            
-            # Keep the tooltip inside the widget bounds
-            if tooltip_x + text_width > self.width() - 5:
-                tooltip_x = self.hover_pos - text_width - 10  # to the left of the cursor
-            
-            # Tooltip background
-            padding = 3
-            painter.setBrush(QBrush(QColor(30, 30, 30, 200)))
-            painter.setPen(QPen(QColor(33, 150, 243), 1))
-            painter.drawRoundedRect(tooltip_x - padding, tooltip_y - text_height - padding + 3, 
-                                text_width + 2*padding, text_height + 2*padding, 3, 3)
+        # Preview bar between real cursor and hover cursor
+        real_pos = self._real_pos()
+        hover_pos = self.hover_pos
+        
+        if abs(hover_pos - real_pos) > 2:
+            start_x = min(real_pos, hover_pos)
+            end_x = max(real_pos, hover_pos)
+            y_center = self.height() // 2
+            bar_y = y_center - TIMELINE_GROOVE_HEIGHT // 2
             
-            # Tooltip text
-            painter.setPen(QColor(255, 255, 255))
-            painter.drawText(tooltip_x, tooltip_y, current_hover_time)
+            painter.setBrush(_PREVIEW_BRUSH)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRect(int(start_x), bar_y, int(end_x - start_x), TIMELINE_GROOVE_HEIGHT)
+        
+        # Imaginary cursor line at hover position
+        painter.setPen(_PREVIEW_PEN)
+        painter.drawLine(self.hover_pos, 0, self.hover_pos, self.height())
+        
+        # Tooltip at the same height as the time label in the bottom-left
+        painter.setFont(self._tooltip_font)
+        tooltip_x, tooltip_y, text_width, text_height = self._tooltip_geometry()
+        
+        # Tooltip background
+        padding = 3
+        painter.setBrush(_TOOLTIP_BRUSH)
+        painter.setPen(_TOOLTIP_PEN)
+        painter.drawRoundedRect(tooltip_x - padding, tooltip_y - text_height - padding + 3, 
+                            text_width + 2*padding, text_height + 2*padding, 3, 3)
+        
+        # Tooltip text
+        painter.setPen(_TEXT_COLOR)
+        painter.drawText(tooltip_x, tooltip_y, self.hover_time_str)
 
-class ActionMarker(QWidget):
-    """Small clickable widget that draws an emoji for an action."""
+class MarkerStrip(QWidget):
+    """Bar that paints all action emojis in one pass and hit-tests clicks."""
     clicked = pyqtSignal(int)
-    def __init__(self, action_data, parent=None):
+    MARKER_SIZE = 20
+    def __init__(self, n_frames, parent=None):
         super().__init__(parent)
-        self.action = action_data
-        self.setFixedSize(20, 20)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.n_frames = n_frames
+        self.selected_frame = None
+        self.setMouseTracking(True)
+        self._font = _resolve_font("Segoe UI Emoji", 14, "Arial")
+        self._actions = []     # visible actions sorted by x
+        self._frames = np.empty(0, dtype=np.int64)
+        self._marker_xs = []   # left x of each marker, ascending
+
+    def set_actions(self, actions):
+        """Show markers for `actions` (list of action dicts sorted by frame)."""
+        self._actions = list(actions)
+        self._frames = np.fromiter((a['frame'] for a in self._actions), dtype=np.int64, count=len(self._actions))
+        self._layout_markers()
+
+    def set_selected_frame(self, frame):
+        """Highlight the marker(s) at `frame`, repainting only the affected markers."""
+        changed = {self.selected_frame, frame}
+        self.selected_frame = frame
+        for x_pos, action in zip(self._marker_xs, self._actions):
+            if action['frame'] in changed:
+                self.update(x_pos, 0, self.MARKER_SIZE + 1, self.MARKER_SIZE + 1)
+
+    def _layout_markers(self):
+        """Compute marker x-positions for the current width and repaint."""
+        span = max(1, self.width()) - 1
+        last = max(1, self.n_frames - 1)
+        # Kept as a list: bisect and the paint loop read single elements
+        self._marker_xs = np.rint(self._frames * (span / last)).astype(int).tolist()
+        self.update()
+
+    def _action_at(self, pos):
+        """Return the action whose marker contains `pos`, or None (last drawn wins)."""
+        if not 0 <= pos.y() < self.MARKER_SIZE:
+            return None
+        x = int(pos.x())
+        i = bisect_right(self._marker_xs, x) - 1
+        if i >= 0 and x < self._marker_xs[i] + self.MARKER_SIZE:
+            return self._actions[i]
+        return None
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # Marker x-positions depend on the width only
+        if event.size().width() != event.oldSize().width():
+            self._layout_markers()
 
     def paintEvent(self, event):
+        if not self._actions:
+            return
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        font = QFont("Segoe UI Emoji", 14)
-        if not font.exactMatch():
-            font = QFont("Arial", 14)
-        painter.setFont(font)
-
-        # Highlight if selected
-        parent = self.parentWidget()
-        selected = False
-        if parent is not None and hasattr(parent.parentWidget(), "selected_frame"):
-            selected = self.action['frame'] == parent.parentWidget().selected_frame
-        if selected:
-            size = self.width()  # full-size square highlight
-            painter.setBrush(QColor(33, 150, 243, 50))  # semi-transparent blue
-            painter.setPen(QPen(QColor(33, 150, 243), 2))  # thin blue outline
-            painter.drawRect(0, 0, size, size)
-        else:
-            painter.setPen(QColor(0, 0, 0, 50))
-        painter.setPen(QColor(255, 255, 255))
-        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self.action['emoji'])
-        
+        painter.setFont(self._font)
+        size = self.MARKER_SIZE
+        for x_pos, action in zip(self._marker_xs, self._actions):
+            rect = QRect(x_pos, 0, size, size)
+            # Highlight if selected: full-size square, semi-transparent blue, thin outline
+            if action['frame'] == self.selected_frame:
+                painter.setBrush(_SELECTED_BRUSH)
+                painter.setPen(_SELECTED_PEN)
+                painter.drawRect(rect)
+            painter.setPen(_TEXT_COLOR)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, action['emoji'])
+
+    def mouseMoveEvent(self, event):
+        hit = self._action_at(event.position())
+        self.setCursor(Qt.CursorShape.PointingHandCursor if hit else Qt.CursorShape.ArrowCursor)
+        super().mouseMoveEvent(event)
+
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
-            self.clicked.emit(self.action['frame'])
+            action = self._action_at(event.position())
+            if action is not None:
+                self.clicked.emit(action['frame'])
+                return
+        super().mousePressEvent(event)
 
 
 class TimelineWidget(QWidget):
@@ -161,11 +351,13 @@ class TimelineWidget(QWidget):
         self.n_frames = n_frames
         self.n_frames_firstHalf = n_frames_firstHalf
         self.n_frames_secondHalf = n_frames_secondHalf
-        self.action_markers = []
         self.actions_data = []
         self.filtered_types = []
         self.filtered_actions = []
+        self._sorted_filtered = []
+        self._frame_to_idx = {}
         self.zoom_widget = None
+        self._last_marker_width = None
         self.selected_frame = None
         self.has_selected_types = False  # NEW: flag to know if types have been selected
 
@@ -182,12 +374,11 @@ class TimelineWidget(QWidget):
         self.setFixedWidth(timeline_width)
 
         # Emoji bar
-        self.markers_container = QWidget(self)
+        self.markers_container = MarkerStrip(self.n_frames, self)
         self.markers_container.setMinimumHeight(50)
         self.markers_container.setMaximumHeight(50)
+        self.markers_container.clicked.connect(self.handle_marker_click)
         layout.addWidget(self.markers_container)
-        self.markers_container.setMouseTracking(True)
-        self.markers_container.installEventFilter(self)
 
         # Slider
         self.slider = TimelineSlider(self.n_frames_firstHalf, self.n_frames_secondHalf)
@@ -251,16 +442,22 @@ class TimelineWidget(QWidget):
 
     def _update_time_label_on_value(self, frame):
         """Update ONLY the real cursor time (bottom left)"""
-        time_str = format_match_time(
-            frame, self.n_frames_firstHalf, self.n_frames_secondHalf, fps=FPS
-        )
+        time_str = self.slider.clock_label(frame)
         self.time_label.setText(time_str)
 
+    def set_clock_labels(self, clock_label):
+        """Use `clock_label` (frame -> match clock string) for the time labels.
+
+        Typically `FrameManager.clock_label`, which serves precomputed strings.
+        """
+        self.slider.clock_label = clock_label
+        self._update_time_label_on_value(self.slider.value())
+
 
     def show_zoomed_markers(self, center_frame, max_actions=10):
-        # Sort by chronological frame
-        all_actions = sorted(self.filtered_actions, key=lambda a: a['frame'])
-        idx = next((i for i, a in enumerate(all_actions) if a['frame'] == center_frame), None)
+        # Chronological order and frame lookup are maintained by update_markers
+        all_actions = self._sorted_filtered
+        idx = self._frame_to_idx.get(center_frame)
         if idx is None:
             self.hide_zoomed_markers()
             return
@@ -274,14 +471,14 @@ class TimelineWidget(QWidget):
             self.hide_zoomed_markers()
             return
 
-        # Always clean up previous zoom widget
-        self.hide_zoomed_markers()
-
-        self.zoom_widget = ZoomedMarkersWidget(actions_zoom, center_frame, self.n_frames, self)
+        # Reuse the zoom widget across clicks instead of tearing it down
+        if self.zoom_widget is None:
+            self.zoom_widget = ZoomedMarkersWidget(actions_zoom, center_frame, self.n_frames, self)
+            self.zoom_widget.emojiClicked.connect(self.setValue)
+            self.zoom_widget.closeRequested.connect(self.hide_zoomed_markers)
+        else:
+            self.zoom_widget.set_actions(actions_zoom, center_frame)  # also selects center_frame
         self.zoom_widget.setFixedWidth(self.markers_container.width())
-        self.zoom_widget.emojiClicked.connect(self.setValue)
-        self.zoom_widget.closeRequested.connect(self.hide_zoomed_markers)
-        self.zoom_widget.selected_frame = center_frame  # <- for highlighting
 
         pos = self.markers_container.mapToGlobal(self.markers_container.rect().bottomLeft())
         self.zoom_widget.move(pos)
@@ -289,10 +486,8 @@ class TimelineWidget(QWidget):
         self.zoom_widget.raise_()
 
     def hide_zoomed_markers(self):
-        if self.zoom_widget:
+        if self.zoom_widget is not None:
             self.zoom_widget.hide()
-            self.zoom_widget.deleteLater()
-            self.zoom_widget = None
 
     def set_actions(self, actions_data):
         self.actions_data = actions_data
@@ -316,37 +511,30 @@ class TimelineWidget(QWidget):
             # If no type is selected, display nothing
             self.filtered_actions = []
 
-        # Nettoyage
-        for marker in self.action_markers:
-            marker.deleteLater()
-        self.action_markers.clear()
-        for child in self.markers_container.children():
-            if isinstance(child, QWidget):
-                child.deleteLater()
-
-        # MODIFIED: Create markers only if there are filtered actions
-        if self.filtered_actions:
-            slider_width = max(1, self.markers_container.width())
-            for action in self.filtered_actions:
-                x_pos = round(action['frame'] * (slider_width - 1) / (self.n_frames - 1))
-                marker = ActionMarker(action, parent=self.markers_container)
-                marker.move(x_pos, 0)
-                marker.clicked.connect(self.handle_marker_click)
-                marker.show()
-                self.action_markers.append(marker)
+        # Sorted copy + first index per frame for O(1) zoom lookups on click
+        self._sorted_filtered = sorted(self.filtered_actions, key=lambda a: a['frame'])
+        self._frame_to_idx = {}
+        for i, a in enumerate(self._sorted_filtered):
+            self._frame_to_idx.setdefault(a['frame'], i)
+        self.markers_container.set_actions(self._sorted_filtered)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self.markers_container.setFixedWidth(self.slider.width())
+        # Only follow actual slider width changes (live resizes deliver many events)
+        slider_width = self.slider.width()
+        if slider_width == self._last_marker_width:
+            return
+        self._last_marker_width = slider_width
+        self.markers_container.setFixedWidth(slider_width)
         self.markers_container.move(0, 0)
         self.slider.setMinimum(0)
         self.slider.setMaximum(self.n_frames - 1)
-        self.update_markers()
 
     def handle_marker_click(self, frame):
         self.selected_frame = frame
         self.show_zoomed_markers(frame, max_actions=10)
-        self.update_markers()  # to redraw main bar with highlighting
+        # Redraw main bar with highlighting
+        self.markers_container.set_selected_frame(frame)
 
     def value(self):
         return self.slider.value()
@@ -370,81 +558,132 @@ class ZoomedMarkersWidget(QFrame):
         self.setFixedHeight(48)
         self.setMinimumWidth(220)
         self.setStyleSheet("background: rgba(40,40,40, 0.98); border: 2px solid #2196F3; border-radius: 8px;")
-        self.set_actions(actions, center_frame)
-        self.installEventFilter(self)
+        self._hover_index = None  # action under the mouse (tooltip shown for it)
         self.emoji_hitboxes = []
+        self._xs = []
+        self.cross_rect = QRect()
+        self.set_actions(actions, center_frame)
         self.selected_frame = center_frame
         self.n_frames = n_frames
+        self._emoji_font = _resolve_font("Apple Color Emoji" if sys.platform == "darwin" else "Segoe UI Emoji", 24)
+        self._sub_font = _resolve_font("Arial", 9)
+        # Static decorations rendered once and blitted on every paint
+        self._cross_pix = self._render_pixmap(19, self._draw_close_cross)
+        self._selection_pix = self._render_pixmap(38, self._draw_selection)
+
+    def _render_pixmap(self, size, draw):
+        """Render `draw(painter)` into a transparent `size` x `size` pixmap at screen resolution."""
+        dpr = self.devicePixelRatioF()
+        pix = QPixmap(int(size * dpr), int(size * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pix)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        draw(painter)
+        painter.end()
+        return pix
+
+    @staticmethod
+    def _draw_close_cross(painter):
+        """Draw the 18 px close button (box and diagonal cross) at the origin."""
+        cross_rect = QRect(0, 0, 18, 18)
+        painter.setPen(_CLOSE_PEN_COLOR)
+        painter.setBrush(_CLOSE_BRUSH)
+        painter.drawRect(cross_rect)
+        painter.setPen(_TEXT_COLOR)
+        painter.drawLine(
+            cross_rect.left() + 4, cross_rect.top() + 4,
+            cross_rect.right() - 4, cross_rect.bottom() - 4
+        )
+        painter.drawLine(
+            cross_rect.right() - 4, cross_rect.top() + 4,
+            cross_rect.left() + 4, cross_rect.bottom() - 4
+        )
+
+    @staticmethod
+    def _draw_selection(painter):
+        """Draw the 36 px selection box, offset by 1 px for its 2 px outline."""
+        painter.setBrush(_SELECTED_BRUSH)
+        painter.setPen(_SELECTED_PEN)
+        painter.drawRect(1, 1, 36, 36)
 
     def set_actions(self, actions, center_frame):
         self.actions = actions
         self.center_frame = center_frame
         self.selected_frame = center_frame
+        self._hover_index = None
+        self._layout_dirty = True
         self.update()
 
-    def eventFilter(self, obj, event):
-        # Handle focus loss to close automatically
-        if event.type() == QEvent.Type.WindowDeactivate:
-            # Optional: close automatically when losing focus
-            # self.closeRequested.emit()
-            pass
-        return super().eventFilter(obj, event)
+    def _relayout(self):
+        """Compute emoji x-positions, click hitboxes and the close button rect."""
+        width = self.width()
+        N = len(self.actions)
+        self._xs = [int((i+1) * (width / (N+1))) for i in range(N)]
+        self.emoji_hitboxes = [(x_pos-20, x_pos+20, a['frame']) for x_pos, a in zip(self._xs, self.actions)]
+        cross_size = 18
+        margin = 7
+        self.cross_rect = QRect(width - cross_size - margin, margin, cross_size, cross_size)
+        self._layout_dirty = False
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._relayout()
 
     def paintEvent(self, event):
+        if self._layout_dirty:
+            self._relayout()
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        width = self.width()
         
         # --- Drawing the close button ---
-        cross_size = 18
-        margin = 7
-        cross_rect = QRect(width - cross_size - margin, margin, cross_size, cross_size)
-        painter.setPen(QColor(255, 80, 80))
-        painter.setBrush(QColor(255, 80, 80, 100))
-        painter.drawRect(cross_rect)
-        painter.setPen(QColor(255, 255, 255))
-        painter.drawLine(
-            cross_rect.left() + 4, cross_rect.top() + 4,
-            cross_rect.right() - 4, cross_rect.bottom() - 4
-        )
-        painter.drawLine(
-            cross_rect.right() - 4, cross_rect.top() + 4,
-            cross_rect.left() + 4, cross_rect.bottom() - 4
-        )
-        self.cross_rect = cross_rect
+        painter.drawPixmap(self.cross_rect.topLeft(), self._cross_pix)
 
-        visible_actions = self.actions
-        N = len(visible_actions)
-        self.emoji_hitboxes = []
-        for i, a in enumerate(visible_actions):
-            x_pos = int((i+1) * (width / (N+1)))
-            emoji = a.get('emoji', '')
-            time = a.get('display_time', '')
-            team = a.get('team', '')
-            font = QFont("Apple Color Emoji" if sys.platform == "darwin" else "Segoe UI Emoji", 24)
-            painter.setFont(font)
-            
-            # --- Surbrillance ---
-            selected = (a['frame'] == self.selected_frame)
-            if selected:
-                painter.setBrush(QColor(33, 150, 243, 50))
-                painter.setPen(QPen(QColor(33, 150, 243), 2))
-                painter.drawRect(x_pos-18, 10, 36, 36)
-
-            painter.setPen(QColor(255,255,255,255))
-            painter.drawText(x_pos-12, 30, emoji)
-            mouse = self.mapFromGlobal(QCursor.pos())
-            if abs(mouse.x() - x_pos) < 24 and 0 < mouse.y() < self.height():
-                QToolTip.showText(self.mapToGlobal(mouse), f"{emoji} {a.get('label','')} - {time}\n{a.get('team','')}", self)
-            painter.setFont(QFont("Arial", 9))
-            painter.setPen(QColor(200,200,200,200))
-            painter.drawText(x_pos-20, 44, f"{time} {team}")
-            self.emoji_hitboxes.append((x_pos-20, x_pos+20, a['frame']))
+        # One pass per font: highlight, emojis, then the time/team captions
+        for x_pos, a in zip(self._xs, self.actions):
+            if a['frame'] == self.selected_frame:
+                painter.drawPixmap(x_pos-19, 9, self._selection_pix)
+
+        painter.setFont(self._emoji_font)
+        painter.setPen(_TEXT_COLOR)
+        for x_pos, a in zip(self._xs, self.actions):
+            painter.drawText(x_pos-12, 30, a.get('emoji', ''))
+
+        painter.setFont(self._sub_font)
+        painter.setPen(_SUBTITLE_COLOR)
+        for x_pos, a in zip(self._xs, self.actions):
+            painter.drawText(x_pos-20, 44, f"{a.get('display_time', '')} {a.get('team', '')}")
+
+    def mouseMoveEvent(self, event):
+        """Show the tooltip of the action under the mouse when it changes."""
+        x = event.position().x()
+        hover = None
+        for i, x_pos in enumerate(self._xs):
+            if abs(x - x_pos) < 24:
+                hover = i
+                break
+        if hover != self._hover_index:
+            self._hover_index = hover
+            if hover is None:
+                QToolTip.hideText()
+            else:
+                a = self.actions[hover]
+                QToolTip.showText(
+                    event.globalPosition().toPoint(),
+                    f"{a.get('emoji', '')} {a.get('label','')} - {a.get('display_time', '')}\n{a.get('team','')}",
+                    self,
+                )
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        self._hover_index = None
+        QToolTip.hideText()
+        super().leaveEvent(event)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             # Click on the close button?
-            if hasattr(self, "cross_rect") and self.cross_rect.contains(event.position().toPoint()):
+            if self.cross_rect.contains(event.position().toPoint()):
                 self.closeRequested.emit()
                 return
             x = int(event.position().x())
@@ -6,11 +6,20 @@ Associates arrows with players and action types (pass/run/dribble), then
 computes simulated player and ball positions over a chosen interval.
 """
 
+from functools import lru_cache
 import numpy as np
-import math
-from PyQt6.QtCore import QPointF
 from config import *
 
+# Realistic maximum player speed per action type (m/s); passes are not capped
+_MAX_ACTION_SPEEDS = {
+    'run': 8.0,      # fast run
+    'dribble': 4.0,  # dribbling
+    'pass': 0.0,
+}
+# Shared read-only placeholder for "no simulated positions"
+_EMPTY_POSITIONS = np.empty((0, 3))
+_EMPTY_POSITIONS.setflags(write=False)
+
 class TacticalSimulationManager:
     """Manage tactical associations and compute simulated trajectories.
 
@@ -33,16 +42,23 @@ class TacticalSimulationManager:
         self.away_ids = away_ids
         self.home_colors = home_colors
         self.away_colors = away_colors
+        # player_id -> (side, column index in the side's xy block)
+        self._player_slots = {pid: ("Home", i) for i, pid in enumerate(home_ids)}
+        self._player_slots.update({pid: ("Away", i) for i, pid in enumerate(away_ids)})
         
         # Tactical data
         self.tactical_arrows = []  # arrows with associated players
         self.ball_possession_chain = []  # pass chain
         self.player_associations = {}  # {arrow_id: player_id}
         self.pass_receivers = {}  # {arrow_id: receiver_player_id} for passes
+        self._pass_idx = None  # indices of pass arrows in tactical_arrows (lazy)
+        self._associated_ids = set()  # arrow_ids present in tactical_arrows
+        self._arrows_by_id = {}  # {arrow_id: tactical_arrow}
+        self._pending_pass_ids = []  # passes still waiting for a receiver (most recent last)
         
         # Simulated trajectories
-        self.simulated_player_positions = {}  # {player_id: [(x, y, frame), ...]}
-        self.simulated_ball_positions = []  # [(x, y, frame), ...]
+        self.simulated_player_positions = {}  # {player_id: (n, 3) array of (x, y, frame)}
+        self.simulated_ball_positions = _EMPTY_POSITIONS  # (n, 3) array of (x, y, frame)
         
     def associate_arrow_with_player(self, arrow, player_id, current_frame, xy_objects):
         """Associate a drawn arrow with a player at a given frame.
@@ -79,9 +95,13 @@ class TacticalSimulationManager:
         }
         
         self.tactical_arrows.append(tactical_arrow)
+        self._associated_ids.add(arrow_id)
+        self._arrows_by_id[arrow_id] = tactical_arrow
+        self._pass_idx = None
         
         # If it's a pass (solid), ask for receiver
         if tactical_arrow['action_type'] == 'pass':
+            self._pending_pass_ids.append(arrow_id)
             return "waiting_for_receiver"
         
         return "associated"
@@ -99,24 +119,23 @@ class TacticalSimulationManager:
         bool
             True if a pending pass was updated, False otherwise.
         """
-        # Find the most recent pass without a receiver
-        for tactical_arrow in reversed(self.tactical_arrows):
-            if (tactical_arrow['action_type'] == 'pass' and 
-                'receiver_id' not in tactical_arrow):
-                
-                arrow_id = tactical_arrow['arrow_id']
-                self.pass_receivers[arrow_id] = receiver_player_id
-                tactical_arrow['receiver_id'] = receiver_player_id
-                
-                # Add to possession chain
-                self.ball_possession_chain.append({
-                    'from_player': tactical_arrow['player_id'],
-                    'to_player': receiver_player_id,
-                    'arrow_id': arrow_id
-                })
-                
-                return True
-        return False
+        # Most recent pass without a receiver
+        if not self._pending_pass_ids:
+            return False
+        arrow_id = self._pending_pass_ids.pop()
+        tactical_arrow = self._arrows_by_id[arrow_id]
+        
+        self.pass_receivers[arrow_id] = receiver_player_id
+        tactical_arrow['receiver_id'] = receiver_player_id
+        
+        # Add to possession chain
+        self.ball_possession_chain.append({
+            'from_player': tactical_arrow['player_id'],
+            'to_player': receiver_player_id,
+            'arrow_id': arrow_id
+        })
+        
+        return True
     
     def get_action_type(self, arrow):
         """Infer action type from arrow style.
@@ -131,8 +150,8 @@ class TacticalSimulationManager:
         {'pass','run','dribble'}
             Inferred action type: solid=pass, dotted=run, zigzag=dribble.
         """
-        if hasattr(arrow, 'arrow_style'):
-            style = arrow.arrow_style
+        style = getattr(arrow, 'arrow_style', None)
+        if style is not None:
             if style == "dotted":
                 return 'run'  # Dotted = run
             elif style == "zigzag":
@@ -141,13 +160,12 @@ class TacticalSimulationManager:
                 return 'pass'  # Solid = pass
         
         # Fallback: inspect child items if style attribute is missing
-        if hasattr(arrow, 'childItems') and arrow.childItems():
-            for item in arrow.childItems():
-                if hasattr(item, 'pen'):
-                    pen = item.pen()
-                    if pen.style() == Qt.PenStyle.DashLine:
-                        return 'run'
-                    break
+        for item in arrow.childItems() if hasattr(arrow, 'childItems') else ():
+            pen = getattr(item, 'pen', None)
+            if pen is not None:
+                if pen().style() == Qt.PenStyle.DashLine:
+                    return 'run'
+                break
         
         # Default to pass (solid)
         return 'pass'
@@ -166,15 +184,11 @@ class TacticalSimulationManager:
             Polyline length.
         """
         if len(points) < 2:
-            return 0
-        
-        total_length = 0
-        for i in range(len(points) - 1):
-            dx = points[i+1].x() - points[i].x()
-            dy = points[i+1].y() - points[i].y()
-            total_length += math.sqrt(dx*dx + dy*dy)
+            return 0.0
         
-        return total_length
+        pts = np.fromiter((v for p in points for v in (p.x(), p.y())), dtype=np.float64, count=2 * len(points))
+        segments = np.diff(pts.reshape(-1, 2), axis=0)
+        return float(np.hypot(segments[:, 0], segments[:, 1]).sum())
     
     def calculate_simulated_trajectories(self, interval_seconds, current_frame, xy_objects, n_frames, get_frame_data_func):
         """Compute positions for players and ball over the simulation interval.
@@ -193,84 +207,92 @@ class TacticalSimulationManager:
             Function mapping global frame -> (half, half_idx, label).
         """
         self.simulated_player_positions.clear()
-        self.simulated_ball_positions.clear()
+        self.simulated_ball_positions = _EMPTY_POSITIONS
         
         if not self.tactical_arrows:
             return
         
+        # Frames are resolved repeatedly (per arrow, per step); memoize for this run
+        frame_data = lru_cache(maxsize=None)(get_frame_data_func)
+        
         total_frames = int(interval_seconds * FPS)
         ball_current_pos = None
         ball_holder = None
         
         # Get initial ball position
-        half, idx, _ = get_frame_data_func(current_frame)
+        half, idx, _ = frame_data(current_frame)
         try:
             ball_xy = xy_objects[half]["Ball"].xy[idx]
             if len(ball_xy) >= 2 and not np.isnan(ball_xy[0]):
-                ball_current_pos = QPointF(ball_xy[0], ball_xy[1])
+                ball_current_pos = (float(ball_xy[0]), float(ball_xy[1]))
                 # Determine who has the ball initially
-                ball_holder = self._find_closest_player_to_ball(ball_current_pos, current_frame, xy_objects, get_frame_data_func)
+                ball_holder = self._find_closest_player_to_ball(ball_current_pos, current_frame, xy_objects, frame_data)
         except (IndexError, KeyError):
             pass
         
         # Sort actions by order and timing
-        passes = [ta for ta in self.tactical_arrows if ta['action_type'] == 'pass']
-        other_actions = [ta for ta in self.tactical_arrows if ta['action_type'] in ['run', 'dribble']]
-        
-        # Calculate trajectories for each frame
-        for frame_offset in range(total_frames):
-            current_sim_frame = current_frame + frame_offset
-            progress = frame_offset / max(1, total_frames - 1)
-            
-            # Process player actions according to calculated speed
-            for tactical_arrow in self.tactical_arrows:
-                player_id = tactical_arrow['player_id']
-                action_type = tactical_arrow['action_type']
-                
-                # Calculate player position according to arrow and required speed
-                player_pos = self._calculate_player_position_with_speed(
-                    tactical_arrow, progress, interval_seconds, current_frame, xy_objects, get_frame_data_func
-                )
-                
-                if player_id not in self.simulated_player_positions:
-                    self.simulated_player_positions[player_id] = []
-                
-                self.simulated_player_positions[player_id].append((
-                    player_pos.x(), player_pos.y(), current_sim_frame
-                ))
-            
-            # Calculate ball position with pass speed
-            if ball_current_pos and ball_holder:
-                ball_pos = self._calculate_ball_position_with_speed(
-                    ball_current_pos, ball_holder, passes, progress, interval_seconds, 
-                    current_frame, xy_objects, get_frame_data_func
-                )
-                self.simulated_ball_positions.append((
-                    ball_pos.x(), ball_pos.y(), current_sim_frame
-                ))
+        pass_idx = self._pass_indices()
+        
+        # All frames of the window at once: progress (T,) and global frame numbers
+        offsets = np.arange(total_frames)
+        progress = offsets / max(1, total_frames - 1)
+        sim_frames = current_frame + offsets
+        
+        # Player positions along their arrows, one (T, 2) block per arrow
+        arrow_xy = [self._arrow_positions(ta, progress, interval_seconds) for ta in self.tactical_arrows]
+        per_player = {}
+        for tactical_arrow, xy in zip(self.tactical_arrows, arrow_xy):
+            per_player.setdefault(tactical_arrow['player_id'], []).append(xy)
+        # A player with several arrows gets one entry per arrow per frame (frame-major order)
+        player_xy = {
+            player_id: np.stack(blocks, axis=1).reshape(-1, 2)
+            for player_id, blocks in per_player.items()
+        }
+        for player_id, xy in player_xy.items():
+            positions = np.empty((len(xy), 3))
+            positions[:, :2] = xy
+            positions[:, 2] = np.repeat(sim_frames, len(per_player[player_id]))
+            self.simulated_player_positions[player_id] = positions
+        
+        # Ball position with pass speed
+        if ball_current_pos is not None and ball_holder and total_frames > 0:
+            ball_xy = self._ball_positions(
+                ball_current_pos, ball_holder, pass_idx, arrow_xy, per_player, player_xy,
+                progress, interval_seconds, current_frame, xy_objects, frame_data
+            )
+            positions = np.empty((total_frames, 3))
+            positions[:, :2] = ball_xy
+            positions[:, 2] = sim_frames
+            self.simulated_ball_positions = positions
+    
+    def _pass_indices(self):
+        """Return indices of pass arrows, rebuilt only after the arrows change.
+
+        Returns
+        -------
+        list[int]
+            Positions of 'pass' entries in `tactical_arrows`, in order.
+        """
+        if self._pass_idx is None:
+            self._pass_idx = [i for i, ta in enumerate(self.tactical_arrows) if ta['action_type'] == 'pass']
+        return self._pass_idx
     
-    def _calculate_player_position_with_speed(self, tactical_arrow, progress, interval_seconds, current_frame, xy_objects, get_frame_data_func):
-        """Position a player along the arrow, capped by plausible action speed.
+    def _arrow_positions(self, tactical_arrow, progress, interval_seconds):
+        """Position a player along the arrow for every progress value, capped by plausible action speed.
 
         Parameters
         ----------
         tactical_arrow : dict
             Metadata for an associated arrow (start/end, type, length).
-        progress : float
-            Normalized progress in [0, 1] within the simulation window.
+        progress : numpy.ndarray
+            Normalized progress values in [0, 1] within the simulation window.
         interval_seconds : float
             Duration of the simulation window (seconds).
-        current_frame : int
-            Global frame when the simulation starts.
-        xy_objects : dict
-            Positions structure (unused here).
-        get_frame_data_func : callable
-            Global frame -> (half, half_idx, label).
 
         Returns
         -------
-        PyQt5.QtCore.QPointF
-            Interpolated player position.
+        numpy.ndarray
+            (T, 2) interpolated player positions.
         """
         start_pos = tactical_arrow['start_pos']
         end_pos = tactical_arrow['end_pos']
@@ -279,48 +301,41 @@ class TacticalSimulationManager:
         # Calculate required speed (meters per second)
         required_speed = arrow_length / interval_seconds
         
-        # Realistic maximum speed according to action type
-        max_speeds = {
-            'run': 8.0,      # 8 m/s fast run
-            'dribble': 4.0,  # 4 m/s dribbling
-            'pass': 0.0      # Passes have no player speed limit
-        }
+        # Realistic maximum speed according to action type (passes have no player speed limit)
+        max_allowed_speed = _MAX_ACTION_SPEEDS.get(tactical_arrow['action_type'], 0.0)
         
-        action_type = tactical_arrow['action_type']
-        
-        if action_type in max_speeds and max_speeds[action_type] > 0:
-            # Limit speed if necessary
-            max_allowed_speed = max_speeds[action_type]
-            if required_speed > max_allowed_speed:
-                # Player doesn't reach the end in the allotted time
-                # He covers the distance he can at max speed
-                distance_covered = max_allowed_speed * interval_seconds * progress
-                total_distance = arrow_length
-                actual_progress = min(distance_covered / total_distance, 1.0)
-            else:
-                actual_progress = progress
+        if max_allowed_speed > 0 and required_speed > max_allowed_speed:
+            # Player doesn't reach the end in the allotted time:
+            # he covers the distance he can at max speed
+            actual_progress = np.minimum(max_allowed_speed * interval_seconds * progress / arrow_length, 1.0)
         else:
-            # For passes, use normal progress
             actual_progress = progress
         
         # Interpolation along the arrow
         x = start_pos.x() + actual_progress * (end_pos.x() - start_pos.x())
         y = start_pos.y() + actual_progress * (end_pos.y() - start_pos.y())
-        
-        return QPointF(x, y)
+        return np.column_stack((x, y))
     
-    def _calculate_ball_position_with_speed(self, initial_ball_pos, initial_holder, passes, progress, interval_seconds, current_frame, xy_objects, get_frame_data_func):
-        """Compute ball position given pass speed and receiver path.
+    def _ball_positions(self, initial_ball_pos, initial_holder, pass_idx, arrow_xy, per_player, player_xy,
+                        progress, interval_seconds, current_frame, xy_objects, get_frame_data_func):
+        """Compute ball positions over the window given pass speed and receiver path.
+
+        Simulated player samples are read as they existed when each frame was
+        produced: at frame f a player with k arrows has (f + 1) * k samples.
 
         Parameters
         ----------
-        initial_ball_pos : QPointF
+        initial_ball_pos : tuple[float, float]
         initial_holder : str
             Initial ball holder player ID.
-        passes : list[dict]
-            Tactical arrows marked as passes.
-        progress : float
-            Progress in [0, 1] of the overall simulation interval.
+        pass_idx : list[int]
+            Indices of the pass arrows in `tactical_arrows`.
+        arrow_xy : list[numpy.ndarray]
+            (T, 2) positions per tactical arrow (same order as `tactical_arrows`).
+        per_player, player_xy : dict
+            Arrow blocks per player and their frame-major (T * k, 2) stack.
+        progress : numpy.ndarray
+            Progress in [0, 1] of the overall simulation interval per frame.
         interval_seconds : float
         current_frame : int
         xy_objects : dict
@@ -328,112 +343,124 @@ class TacticalSimulationManager:
 
         Returns
         -------
-        PyQt5.QtCore.QPointF
-            Ball position at current progress.
+        numpy.ndarray
+            (T, 2) ball positions.
         """
-        if not passes:
-            # No pass, ball follows initial carrier
-            if initial_holder in self.simulated_player_positions:
-                positions = self.simulated_player_positions[initial_holder]
-                if positions:
-                    latest_pos = positions[-1]
-                    return QPointF(latest_pos[0], latest_pos[1])
-            return initial_ball_pos
-        
-        # Process passes in sequence according to their timing
-        current_pass = None
-        pass_start_time = 0.0
-        
-                    # For simplicity, process the first pass
-
-        first_pass = passes[0]
-        
-        if 'receiver_id' in first_pass:
-            pass_length = first_pass['length']
-            
-            # Realistic pass speed (15-25 m/s for a normal pass)
-            pass_speed = min(25.0, max(15.0, pass_length / 2.0))  # Adapted to distance
-            pass_duration = pass_length / pass_speed
-            
-            # Convert to proportion of total time
-            pass_duration_ratio = min(pass_duration / interval_seconds, 0.8)  # Max 80% of time
-            
-            if progress <= pass_duration_ratio:
-                # Pass in progress - interpolate between passer and receiver
-                pass_progress = progress / pass_duration_ratio
-                
-                # Passer position
-                passer_pos = self._calculate_player_position_with_speed(
-                    first_pass, progress, interval_seconds, current_frame, xy_objects, get_frame_data_func
-                )
-                
-                # Receiver position
-                receiver_pos = self._get_player_position_at_progress(
-                    first_pass['receiver_id'], progress, interval_seconds, current_frame, xy_objects, get_frame_data_func
-                )
-                
-                # Interpolate ball with slightly curved trajectory
-                x = passer_pos.x() + pass_progress * (receiver_pos.x() - passer_pos.x())
-                y = passer_pos.y() + pass_progress * (receiver_pos.y() - passer_pos.y())
-                
-                return QPointF(x, y)
-            else:
-                # Pass completed - ball follows receiver
-                receiver_pos = self._get_player_position_at_progress(
-                    first_pass['receiver_id'], progress, interval_seconds, current_frame, xy_objects, get_frame_data_func
-                )
-                return receiver_pos
+        n = len(progress)
+        # Ball that stays put: a read-only broadcast view, nothing is allocated
+        constant = np.broadcast_to(initial_ball_pos, (n, 2))
+        
+        if not pass_idx:
+            # No pass, ball follows initial carrier: its latest sample at each frame,
+            # i.e. every k-th row of its frame-major stack (a strided view)
+            if initial_holder in player_xy:
+                k = len(per_player[initial_holder])
+                return player_xy[initial_holder][k - 1::k]
+            return constant
+        
+        # For simplicity, process the first pass
+        first_pass = self.tactical_arrows[pass_idx[0]]
+        if 'receiver_id' not in first_pass:
+            return constant
+        
+        pass_length = first_pass['length']
+        # Realistic pass speed (15-25 m/s for a normal pass), adapted to distance
+        pass_speed = min(25.0, max(15.0, pass_length / 2.0))
+        pass_duration = pass_length / pass_speed
+        # Convert to proportion of total time (max 80% of time)
+        pass_duration_ratio = min(pass_duration / interval_seconds, 0.8)
+        
+        # Passer position along the pass arrow
+        passer_xy = arrow_xy[pass_idx[0]]
+        
+        # Receiver position: simulated if available, otherwise real
+        receiver_id = first_pass['receiver_id']
+        if receiver_id in player_xy:
+            k = len(per_player[receiver_id])
+            available = np.arange(1, n + 1) * k
+            target = np.minimum((progress * (available - 1)).astype(int), available - 1)
+            receiver_xy = player_xy[receiver_id][target]
+        else:
+            frames_to_check = current_frame + (progress * interval_seconds * FPS).astype(int)
+            receiver_xy = self._real_player_track(receiver_id, frames_to_check, xy_objects, get_frame_data_func)
         
-        return initial_ball_pos
+        # Pass in progress: interpolate between passer and receiver; afterwards follow receiver
+        in_flight = progress <= pass_duration_ratio
+        if pass_duration_ratio > 0:
+            pass_progress = (progress / pass_duration_ratio)[:, None]
+        else:
+            pass_progress = np.ones((n, 1))
+        flight_xy = passer_xy + pass_progress * (receiver_xy - passer_xy)
+        return np.where(in_flight[:, None], flight_xy, receiver_xy)
     
-    def _get_player_position_at_progress(self, player_id, progress, interval_seconds, current_frame, xy_objects, get_frame_data_func):
-        """Return simulated or real player position at a given progress ratio.
+    def _real_player_track(self, player_id, frames, xy_objects, get_frame_data_func):
+        """Return real player positions for many global frames at once.
+
+        Parameters
+        ----------
+        player_id : str
+        frames : numpy.ndarray
+            Global frame indices.
+        xy_objects : dict
+        get_frame_data_func : callable
 
         Returns
         -------
-        PyQt5.QtCore.QPointF
-            Player position.
+        numpy.ndarray
+            (len(frames), 2) positions; (0, 0) where unavailable.
         """
-        # First check if there's a simulated position
-        if player_id in self.simulated_player_positions:
-            positions = self.simulated_player_positions[player_id]
-            if positions:
-                # Take position corresponding to progress
-                target_index = int(progress * (len(positions) - 1))
-                target_index = min(target_index, len(positions) - 1)
-                latest_pos = positions[target_index]
-                return QPointF(latest_pos[0], latest_pos[1])
-        
-        # Otherwise, use real position
-        frame_to_check = current_frame + int(progress * interval_seconds * FPS)
-        return self._get_real_player_position(player_id, frame_to_check, xy_objects, get_frame_data_func)
+        track = np.zeros((len(frames), 2))
+        side, player_index = self._player_slots.get(player_id, (None, None))
+        if player_index is None:
+            return track
+        
+        lookups = [get_frame_data_func(int(f)) for f in frames]
+        halves = np.array([half for half, _, _ in lookups], dtype=object)
+        idxs = np.array([idx for _, idx, _ in lookups], dtype=int)
+        
+        # One fancy-indexed gather per half instead of a lookup per frame
+        for half in set(halves.tolist()):
+            try:
+                xy = xy_objects[half][side].xy
+            except KeyError:
+                continue
+            if 2*player_index+1 >= xy.shape[1]:
+                continue
+            rows = np.flatnonzero((halves == half) & (idxs < len(xy)))
+            cols = xy[idxs[rows], 2*player_index:2*player_index+2]
+            valid = ~np.isnan(cols).any(axis=1)
+            track[rows[valid]] = cols[valid]
+        return track
     
-    def _get_real_player_position(self, player_id, frame, xy_objects, get_frame_data_func):
-        """Return real player position at a given global frame index.
+    def _team_positions_array(self, frame, xy_objects, get_frame_data_func):
+        """Return all player IDs and their (x, y) positions at a global frame.
 
         Returns
         -------
-        PyQt5.QtCore.QPointF
-            Player position; (0, 0) if unavailable.
+        tuple[list[str], numpy.ndarray]
+            IDs (Home then Away) and a matching (N, 2) array; unavailable
+            positions are NaN.
         """
         half, idx, _ = get_frame_data_func(frame)
-        
-        # Determine player's team
-        side = "Home" if player_id in self.home_ids else "Away"
-        ids = self.home_ids if side == "Home" else self.away_ids
-        
-        try:
-            player_index = ids.index(player_id)
-            xy = xy_objects[half][side].xy[idx]
-            
-            if 2*player_index+1 < len(xy):
-                x, y = xy[2*player_index], xy[2*player_index+1]
-                if not np.isnan(x) and not np.isnan(y):
-                    return QPointF(x, y)
-        except (ValueError, IndexError, KeyError):
-            pass
-        
-        return QPointF(0, 0)  # Default position
+        ids = []
+        blocks = []
+        for side, side_ids in (("Home", self.home_ids), ("Away", self.away_ids)):
+            try:
+                xy = np.asarray(xy_objects[half][side].xy[idx], dtype=float)
+            except (IndexError, KeyError):
+                continue
+            n = min(len(side_ids), len(xy) // 2)
+            ids.extend(side_ids[:n])
+            blocks.append(xy[:2*n].reshape(-1, 2))
+        if not blocks:
+            return ids, np.empty((0, 2))
+        return ids, np.concatenate(blocks)
+    
+    def _squared_distances(self, x, y, frame, xy_objects, get_frame_data_func):
+        """Return player IDs and squared distances to (x, y) (inf where unknown)."""
+        ids, positions = self._team_positions_array(frame, xy_objects, get_frame_data_func)
+        d2 = (positions[:, 0] - x)**2 + (positions[:, 1] - y)**2
+        return ids, np.nan_to_num(d2, nan=np.inf)
     
     def _find_closest_player_to_ball(self, ball_pos, frame, xy_objects, get_frame_data_func):
         """Find the player closest to the ball at a frame.
@@ -443,22 +470,11 @@ class TacticalSimulationManager:
         str | None
             Player ID or None if not found.
         """
-        min_distance = float('inf')
-        closest_player = None
-        
-        for side, ids in [("Home", self.home_ids), ("Away", self.away_ids)]:
-            for player_id in ids:
-                player_pos = self._get_real_player_position(player_id, frame, xy_objects, get_frame_data_func)
-                distance = math.sqrt(
-                    (ball_pos.x() - player_pos.x())**2 + 
-                    (ball_pos.y() - player_pos.y())**2
-                )
-                
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_player = player_id
-        
-        return closest_player
+        ids, d2 = self._squared_distances(*ball_pos, frame, xy_objects, get_frame_data_func)
+        if not ids:
+            return None
+        i = int(np.argmin(d2))
+        return ids[i] if np.isfinite(d2[i]) else None
     
     def find_player_at_position(self, click_pos, current_frame, xy_objects, get_frame_data_func, max_distance=PLAYER_OUTER_RADIUS_BASE):
         """Find the nearest player to an arbitrary click within a threshold.
@@ -476,31 +492,24 @@ class TacticalSimulationManager:
         str | None
             Closest player ID within threshold, else None.
         """
-        min_distance = float('inf')
-        closest_player = None
-        
-        for side, ids in [("Home", self.home_ids), ("Away", self.away_ids)]:
-            for player_id in ids:
-                player_pos = self._get_real_player_position(player_id, current_frame, xy_objects, get_frame_data_func)
-                distance = math.sqrt(
-                    (click_pos.x() - player_pos.x())**2 + 
-                    (click_pos.y() - player_pos.y())**2
-                )
-                
-                if distance < min_distance and distance <= max_distance:
-                    min_distance = distance
-                    closest_player = player_id
-        
-        return closest_player
+        ids, d2 = self._squared_distances(click_pos.x(), click_pos.y(), current_frame, xy_objects, get_frame_data_func)
+        if not ids:
+            return None
+        i = int(np.argmin(d2))
+        return ids[i] if d2[i] <= max_distance**2 else None
     
     def clear_tactical_data(self):
         """Reset tactical associations and all simulated positions."""
         self.tactical_arrows.clear()
+        self._associated_ids.clear()
+        self._arrows_by_id.clear()
+        self._pending_pass_ids.clear()
+        self._pass_idx = None
         self.ball_possession_chain.clear()
         self.player_associations.clear()
         self.pass_receivers.clear()
         self.simulated_player_positions.clear()
-        self.simulated_ball_positions.clear()
+        self.simulated_ball_positions = _EMPTY_POSITIONS
     
     def get_simulated_trajectories(self):
         """Return simulated player and ball trajectories for rendering.
@@ -508,7 +517,8 @@ class TacticalSimulationManager:
         Returns
         -------
         dict
-            {'players': dict, 'ball': list}
+            {'players': dict, 'ball': numpy.ndarray}, each trajectory an
+            (n, 3) array of (x, y, frame) rows.
         """
         return {
             'players': self.simulated_player_positions,
@@ -523,15 +533,8 @@ class TacticalSimulationManager:
         list
             Arrow items not in the associated set.
         """
-        associated_arrow_ids = {ta['arrow_id'] for ta in self.tactical_arrows}
-        all_arrows = self.annotation_manager.arrows
-        
-        non_associated = []
-        for arrow in all_arrows:
-            if id(arrow) not in associated_arrow_ids:
-                non_associated.append(arrow)
-        
-        return non_associated
+        associated_ids = self._associated_ids
+        return [arrow for arrow in self.annotation_manager.arrows if id(arrow) not in associated_ids]
     
     def get_associated_arrows(self):
         """Return a copy of associated arrows with their tactical metadata.
@@ -555,6 +558,11 @@ class TacticalSimulationManager:
         
         # Remove from tactical_arrows
         self.tactical_arrows = [ta for ta in self.tactical_arrows if ta['arrow_id'] != arrow_id]
+        self._associated_ids.discard(arrow_id)
+        self._arrows_by_id.pop(arrow_id, None)
+        if arrow_id in self._pending_pass_ids:
+            self._pending_pass_ids.remove(arrow_id)
+        self._pass_idx = None
         
         # Remove associations
         if arrow_id in self.player_associations:
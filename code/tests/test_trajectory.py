@@ -0,0 +1,48 @@
+# test_trajectory.py
+"""Tests for the frame lookup tables cached by `TrajectoryManager`."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+pytest.importorskip("PyQt6.QtWidgets")
+
+from trajectory import TrajectoryManager
+from utils.frame_utils import FrameManager
+
+
+class CountingFrameManager(FrameManager):
+    """FrameManager that counts `get_frame_data` calls."""
+
+    calls = 0
+
+    def get_frame_data(self, frame_number):
+        CountingFrameManager.calls += 1
+        return super().get_frame_data(frame_number)
+
+
+def test_frame_lookup_built_once_for_bound_method():
+    fm = CountingFrameManager(30, 20, 50)
+    manager = TrajectoryManager(None, {}, {})
+    CountingFrameManager.calls = 0
+
+    names, codes, idxs = manager._frame_lookup(50, fm.get_frame_data)
+    manager._frame_lookup(50, fm.get_frame_data)
+
+    assert CountingFrameManager.calls == 50
+    assert names == ["firstHalf", "secondHalf"]
+    assert codes[29] == 0 and codes[30] == 1
+    assert idxs[30] == 0 and idxs[49] == 19
+
+
+def test_frame_lookup_rebuilt_when_frame_count_changes():
+    fm = CountingFrameManager(30, 20, 50)
+    manager = TrajectoryManager(None, {}, {})
+    CountingFrameManager.calls = 0
+
+    manager._frame_lookup(50, fm.get_frame_data)
+    manager._frame_lookup(40, fm.get_frame_data)
+
+    assert CountingFrameManager.calls == 90
@@ -8,8 +8,10 @@ Generates two modes:
 - BLACK & WHITE: grayscale pitch adapted to team brightness; distinct chroma
   hues for offside and arrow to pop out
 """
+from functools import lru_cache
 from typing import Dict
-from utils.color_utils import hex_to_lab, delta_e_lab, lch_to_hex, contrast_ratio, hex_to_lch, hex_to_rgb, relative_luminance
+import numpy as np
+from utils.color_utils import hex_to_lab, delta_e_lab_matrix, lch_to_hexes, contrast_ratio, hex_to_lch, hexes_to_lch, hex_to_rgb, relative_luminance
 from config import BALL_COLOR
 
 # Fallback: [grass, line, offside, arrow]
@@ -21,6 +23,42 @@ BW_GRASS_IF_DARK = "#E4E4E4"
 BW_LINE_IF_LIGHT = "#E4E4E4"
 BW_LINE_IF_DARK = "#292929"
 
+def _is_hex(color):
+    """Return True for a '#RRGGBB' string."""
+    return isinstance(color, str) and color.startswith("#") and len(color) == 7
+
+def _reference_labs(colors):
+    """Return the (R, 3) Lab array of the valid hex colors in `colors`."""
+    return np.array([hex_to_lab(c) for c in colors if _is_hex(c)]).reshape(-1, 3)
+
+@lru_cache(maxsize=64)
+def _hue_candidates(L_trials, C_trials, step):
+    """Return in-gamut hex candidates, with their LCH hue, for the given L/C trials and hue step.
+
+    The grid only depends on its arguments, so each palette is converted once
+    per process and reused by every later theme generation.
+
+    Parameters
+    ----------
+    L_trials, C_trials : tuple[float, ...]
+        Lightness and chroma values to try.
+    step : int
+        Hue step in degrees.
+
+    Returns
+    -------
+    tuple[tuple[str, float], ...]
+        (hex, hue) pairs in L, C, hue order; the hue is that of the rounded
+        hex color, not the requested `h`.
+    """
+    # Whole grid in one batch, L-major then C then hue
+    grid = np.array([(L, C, h) for L in L_trials for C in C_trials for h in range(0, 360, step)],
+                    dtype=float).reshape(-1, 3)
+    hexes = [c_hex for c_hex in lch_to_hexes(grid) if c_hex]
+    hues = hexes_to_lch(hexes)[:, 2].tolist()
+    return tuple(zip(hexes, hues))
+
+@lru_cache(maxsize=256)
 def is_light(hexcolor):
     """Return True if a hex color is considered light.
 
@@ -34,8 +72,9 @@ def is_light(hexcolor):
     bool
         True if simple luma heuristic > 0.7.
     """
-    r, g, b = int(hexcolor[1:3],16), int(hexcolor[3:5],16), int(hexcolor[5:7],16)
-    return (0.299*r + 0.587*g + 0.114*b)/255.0 > 0.7
+    v = int(hexcolor[1:7], 16)
+    # Integer luma: 0.7 * 255 * 1000 = 178500
+    return 299*((v >> 16) & 0xFF) + 587*((v >> 8) & 0xFF) + 114*(v & 0xFF) > 178500
 
 def majority_light(colors):
     """Return True if at least two colors in the list are light.
@@ -114,8 +153,10 @@ class ThemeManager:
             line  = CLASSIC_LINE
             forbidden = [grass, line, ball] + all_teams
             # Wider ranges to explore more vivid and dark/light options
+            forbidden_labs = _reference_labs(forbidden)
             offside = self._find_distinct_color(
                 forbidden,
+                forbidden_labs=forbidden_labs,
                 chroma=(70, 95),
                 luminance=(50, 75),
                 grass=grass,
@@ -124,6 +165,7 @@ class ThemeManager:
             )
             arrow   = self._find_distinct_color(
                 forbidden + [offside],
+                forbidden_labs=np.vstack([forbidden_labs, _reference_labs([offside])]),
                 chroma=(70, 95),
                 luminance=(45, 70),
                 grass=grass,
@@ -147,8 +189,10 @@ class ThemeManager:
                 line = BW_LINE_IF_DARK
             
             forbidden = [grass, line, ball] + all_teams
+            forbidden_labs = _reference_labs(forbidden)
             offside = self._find_distinct_color(
                 forbidden,
+                forbidden_labs=forbidden_labs,
                 chroma=(75, 95),
                 luminance=(65, 90),
                 grass=grass,
@@ -157,6 +201,7 @@ class ThemeManager:
             )
             arrow   = self._find_distinct_color(
                 forbidden + [offside],
+                forbidden_labs=np.vstack([forbidden_labs, _reference_labs([offside])]),
                 chroma=(75, 95),
                 luminance=(45, 70),
                 grass=grass,
@@ -178,7 +223,8 @@ class ThemeManager:
         luminance,
         grass: str | None = None,
         line: str | None = None,
-        de_threshold = None
+        de_threshold = None,
+        forbidden_labs: np.ndarray | None = None
     ) -> str:
         """Find a color that passes filters and maximizes contrast.
 
@@ -194,6 +240,9 @@ class ThemeManager:
             Pitch surface and line colors (used for contrast checks).
         de_threshold : float
             Minimum ΔE00 between candidate and references.
+        forbidden_labs : numpy.ndarray, optional
+            Precomputed (R, 3) Lab rows of `reference_colors`, as returned by
+            :func:`_reference_labs`; computed here when omitted.
 
         Returns
         -------
@@ -202,16 +251,20 @@ class ThemeManager:
 
         Notes
         -----
-        Filters applied:
-        1. ΔE > de_threshold: avoid similarity to references
+        Filters applied (cheapest first):
+        1. min hue difference > 60°: avoid similar color families
         2. min contrast ratio > 1.2: ensure visibility
-        3. min hue difference > 60°: avoid similar color families
+        3. ΔE > de_threshold: avoid similarity to references (only checked
+           for candidates that would beat the current best score)
 
         Score = min(contrast) + 0.2 * mean(contrast)
         """
         # Normalize reference list to valid hex strings
-        refs = [c for c in reference_colors if isinstance(c, str) and c.startswith("#") and len(c) == 7]
-        forbidden_labs = [hex_to_lab(c) for c in refs]
+        refs = [c for c in reference_colors if _is_hex(c)]
+        # References are fixed for the whole search: stack Lab once, hues once
+        if forbidden_labs is None:
+            forbidden_labs = _reference_labs(refs)
+        ref_hues = [hex_to_lch(c)[2] for c in refs]
 
         best = None
         best_score = -1.0
@@ -233,32 +286,30 @@ class ThemeManager:
         # Prepare L/C trials from either fixed value or (min,max) interval
         if isinstance(luminance, tuple):
             lmin, lmax = luminance
-            L_trials = [lmin, (lmin + lmax) / 2.0, lmax]
+            L_trials = (lmin, (lmin + lmax) / 2.0, lmax)
         else:
-            L_trials = [float(luminance)]
+            L_trials = (float(luminance),)
         if isinstance(chroma, tuple):
             cmin, cmax = chroma
-            C_trials = [cmin, (cmin + cmax) / 2.0, cmax]
+            C_trials = (cmin, (cmin + cmax) / 2.0, cmax)
         else:
-            C_trials = [float(chroma)]
+            C_trials = (float(chroma),)
 
         for step in [53, 31, 19, 11, 7]:
-            candidates = []
-            for L in L_trials:
-                for C in C_trials:
-                    for h in range(0, 360, step):
-                        c_hex = lch_to_hex(L, C, h)
-                        if c_hex:
-                            candidates.append(c_hex)
-            candidates = [c for c in candidates if c]
-            for c in candidates:
-                # ΔE filter against all references
-                c_lab = hex_to_lab(c)
-                min_de = min(delta_e_lab(c_lab, lab) for lab in forbidden_labs) if forbidden_labs else 1e9
-                if min_de <= de_threshold:
+            for c, c_hue in _hue_candidates(L_trials, C_trials, step):
+                # Filters run cheapest first; ΔE (the costly one) only for a potential new best
+                # Step 1: Hue difference filter - reject as soon as one forbidden hue is too close
+                too_close = False
+                for ref_hue in ref_hues:
+                    hue_diff = abs(c_hue - ref_hue)
+                    hue_diff = min(hue_diff, 360 - hue_diff)  # handle wrap-around
+                    if hue_diff < 60:  # minimum 60° hue separation
+                        too_close = True
+                        break
+                if too_close:
                     continue
                 
-                # Step 1: Contrast filter - check if minimum contrast is acceptable
+                # Step 2: Contrast filter - check if minimum contrast is acceptable
                 contrasts = []
                 if grass:
                     contrasts.append(contrast_ratio(c, grass))
@@ -280,28 +331,17 @@ class ThemeManager:
                 if min_cr < 1.2:  # relaxed threshold for visibility
                     continue
                 
-                # Step 2: Hue difference filter - check if hue is sufficiently different
-                c_lch = hex_to_lch(c)
-                c_hue = c_lch[2]
-                min_hue_diff = 360.0
-                for ref_hex in refs:
-                    ref_lch = hex_to_lch(ref_hex)
-                    ref_hue = ref_lch[2]
-                    hue_diff = abs(c_hue - ref_hue)
-                    hue_diff = min(hue_diff, 360 - hue_diff)  # handle wrap-around
-                    min_hue_diff = min(min_hue_diff, hue_diff)
+                # Score based on contrast quality (higher is better)
+                score = min_cr + 0.2 * avg_cr
+                if score <= best_score:
+                    continue
                 
-                # Reject if hue is too similar to any forbidden color
-                if min_hue_diff < 60:  # minimum 60° hue separation
+                # Step 3: ΔE filter against all references
+                if len(forbidden_labs) and delta_e_lab_matrix(hex_to_lab(c), forbidden_labs).min() <= de_threshold:
                     continue
                 
-                # If we reach here, the color passes both filters
-                # Score based on contrast quality (higher is better)
-                score = min_cr + 0.2 * avg_cr 
-                if score > best_score:
-                    best_score = score
-                    best = c
-
+                best_score = score
+                best = c
 
             if best is not None:
                 return best
@@ -6,12 +6,107 @@ Trajectory computation and rendering for players and ball.
 with temporal fading so upcoming segments are more visible than distant ones.
 """
 
-from PyQt6.QtGui import QPen, QColor, QBrush
+from PyQt6.QtGui import QPen, QColor, QPainterPath
+from PyQt6.QtWidgets import QGraphicsItem, QGraphicsItemGroup, QGraphicsPathItem, QGraphicsEllipseItem
 from PyQt6.QtCore import Qt
-from collections import deque
 import numpy as np
 from config import *
 
+_DASH_PATTERN = [1.0, 4.0]  # fine dotted trail: 1 unit dash, 4 units gap
+
+def _trajectory_arrays(xy, frames):
+    """Pack a trajectory as struct-of-arrays.
+
+    Parameters
+    ----------
+    xy : array-like
+        (N, 2) positions.
+    frames : array-like
+        (N,) global frame of each position.
+
+    Returns
+    -------
+    dict
+        {'xy': (N, 2) float32 array, 'frame': (N,) int32 array}.
+    """
+    return {'xy': np.asarray(xy, dtype=np.float32), 'frame': np.asarray(frames, dtype=np.int32)}
+
+def _segment_alphas(frames, current_frame, fade_frames, min_alpha, fade_span, default_alpha):
+    """Select the segments still ahead of `current_frame` and their fading alpha.
+
+    Segment i runs from sample i to sample i + 1 and is dated by its start frame.
+
+    Parameters
+    ----------
+    frames : numpy.ndarray
+        (N,) frame of each sample, non-decreasing.
+    current_frame : int or None
+        Playback frame; None keeps every segment at `default_alpha`.
+    fade_frames : int
+        Frames over which the alpha fades from 1.0 down to `min_alpha`; if
+        not positive, kept segments use `default_alpha`.
+    min_alpha, fade_span : float
+        Alpha is max(min_alpha, 1 - distance * fade_span).
+    default_alpha : float
+        Alpha used when `current_frame` is None or there is no fade window.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        Indices of the segments to draw and their alpha.
+    """
+    start_frames = frames[:-1]
+    if current_frame is None:
+        return np.arange(len(start_frames)), np.full(len(start_frames), default_alpha)
+    # Sample frames are non-decreasing: the visible segments are a suffix
+    segments = np.arange(np.searchsorted(start_frames, current_frame, side='left'), len(start_frames))
+    if fade_frames <= 0:
+        return segments, np.full(len(segments), default_alpha)
+    distance_factor = (start_frames[segments] - current_frame) / fade_frames
+    return segments, np.maximum(min_alpha, 1.0 - distance_factor * fade_span)
+
+def _alpha_runs(segments, alphas, levels):
+    """Group consecutive segments whose alpha rounds to the same level.
+
+    Parameters
+    ----------
+    segments : numpy.ndarray
+        Increasing indices of consecutive segments (segment i joins samples i and i + 1).
+    alphas : numpy.ndarray
+        Alpha of each segment.
+    levels : int
+        Number of alpha steps in [0, 1].
+
+    Returns
+    -------
+    list[tuple[int, int, float]]
+        (first sample, last sample, rounded alpha) for each run.
+    """
+    quantized = np.round(alphas * levels) / levels
+    breaks = np.flatnonzero(np.diff(quantized)) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [len(segments)])) - 1
+    return [
+        (first, last + 1, alpha)
+        for first, last, alpha in zip(segments[starts].tolist(), segments[ends].tolist(), quantized[starts].tolist())
+    ]
+
+def _polyline_path(xy):
+    """Return an open QPainterPath through the (N, 2) points."""
+    path = QPainterPath()
+    path.moveTo(*xy[0])
+    for x, y in xy[1:].tolist():
+        path.lineTo(x, y)
+    return path
+
+def _alpha8(alpha):
+    """Return the 8-bit alpha Qt stores for `QColor.setAlphaF(alpha)`.
+
+    Qt rounds in single precision to 16 bits, then down to 8 bits.
+    """
+    alpha16 = int(np.float32(min(1.0, max(0.0, alpha))) * np.float32(65535) + np.float32(0.5))
+    return (alpha16 + 128) // 257
+
 class TrajectoryManager:
     """Manage drawing of future and simulated trajectories for players/ball.
 
@@ -29,18 +124,153 @@ class TrajectoryManager:
         self.future_trajectories = {}
         self.cached_frame = None  # Cache to avoid recomputing
         self.cached_interval = None
+        self._cache_token = None  # identity of the data the cached trajectories came from
         self.home_colors = home_colors
         self.away_colors = away_colors
         self.simulated_trajectories = {}  # Tactical simulated trajectories
+        self._pen_cache = {}  # (color, 8-bit alpha, width, style) -> QPen
+        self._future_trail_group = None  # persistent group holding the future player trails
+        self._future_trail_items = []  # path items in that group, reused across rebuilds
+        self._future_trail_signature = None  # what the group currently shows
+        self._frame_index = None  # (n_frames, func, half names, half code per frame, half index per frame)
         
     def clear_trails(self):
         """Clear cached and drawn trajectories from the scene."""
         self.player_trails.clear()
         self.future_trajectories.clear()
         self.simulated_trajectories.clear()
+        self._pen_cache.clear()
+        self._clear_future_trail_group()
         self.cached_frame = None
         self.cached_interval = None
+        self._cache_token = None
+    
+    def invalidate_future(self):
+        """Force the next `calculate_future_trajectories` call to recompute.
+
+        Use when positions or rosters are modified in place, which the cache
+        cannot detect from object identity alone.
+        """
+        self._cache_token = None
         
+    def _cached_pen(self, base_color, alpha, width, style):
+        """Return a round-capped pen for a segment, reused across segments and frames.
+
+        Alpha is keyed at the 8-bit resolution the drawn color ends up with
+        and the pen color is built from that key, so every segment sharing a
+        pen has exactly the same color. QColors are only created on a miss,
+        so no per-color alpha lookup table is needed.
+
+        Parameters
+        ----------
+        base_color : str
+            Hex color of the trajectory.
+        alpha : float
+            Opacity in [0, 1].
+        width : float
+            Pen width.
+        style : Qt.PenStyle
+            Line style; CustomDashLine uses the fine `_DASH_PATTERN`.
+
+        Returns
+        -------
+        QPen
+        """
+        alpha8 = _alpha8(alpha)
+        key = (base_color, alpha8, width, style)
+        pen = self._pen_cache.get(key)
+        if pen is None:
+            color = QColor(base_color)
+            color.setAlpha(alpha8)
+            pen = QPen(color, width)
+            pen.setStyle(style)
+            if style == Qt.PenStyle.CustomDashLine:
+                pen.setDashPattern(_DASH_PATTERN)
+            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            self._pen_cache[key] = pen
+        return pen
+    
+    def _clear_future_trail_group(self):
+        """Drop the cached future player trail items."""
+        for item in self._future_trail_items:
+            self.pitch_widget.scene.removeItem(item)
+        self._future_trail_items.clear()
+        self._future_trail_signature = None
+    
+    def _new_trail_group(self):
+        """Create the persistent group for future player trails."""
+        group = QGraphicsItemGroup()
+        group.setZValue(8)
+        self._future_trail_group = group
+        return group
+    
+    def _add_trail_paths(self, xy, runs, base_color, width, style, z):
+        """Add one path item per run of equal alpha to the frame's dynamic items.
+
+        Parameters
+        ----------
+        xy : numpy.ndarray
+            (N, 2) trail samples.
+        runs : list[tuple[int, int, float]]
+            Output of `_alpha_runs`.
+        base_color : str
+            Hex color of the trail.
+        width : float
+            Pen width in scene units.
+        style : Qt.PenStyle
+            Line style.
+        z : float
+            Z value of the items.
+        """
+        for first, last, alpha in runs:
+            path = self.pitch_widget.scene.addPath(_polyline_path(xy[first:last + 1]),
+                                                   self._cached_pen(base_color, alpha, width, style))
+            path.setZValue(z)
+            self.pitch_widget.dynamic_items.append(path)
+
+    def _final_ball_marker(self, name, x, y, radius, color, width, z):
+        """Show the persistent ring marking where a ball trajectory ends.
+
+        The ring is moved rather than rebuilt each frame; the pitch hides it
+        again on the next clear unless it is drawn once more.
+        """
+        ring = self.pitch_widget.persistent_item(("trajectory", name), QGraphicsEllipseItem)
+        ring.setRect(x - radius, y - radius, radius * 2, radius * 2)
+        ring.setPen(self._cached_pen(color, 1.0, width, Qt.PenStyle.SolidLine))
+        ring.setZValue(z)
+        return ring
+
+    def _frame_lookup(self, n_frames, get_frame_data_func):
+        """Return the global frame -> (half, half index) tables, built once per dataset.
+
+        Parameters
+        ----------
+        n_frames : int
+            Total number of frames in the dataset.
+        get_frame_data_func : callable
+            Function mapping global frame -> (half, half_idx, label).
+
+        Returns
+        -------
+        tuple[list[str], numpy.ndarray, numpy.ndarray]
+            Half names, (n_frames,) int8 code into those names and
+            (n_frames,) int32 half-relative index.
+        """
+        index = self._frame_index
+        # Callers pass a fresh bound method each time: compare by equality, not identity
+        if index is None or index[0] != n_frames or index[1] != get_frame_data_func:
+            names = []
+            codes = np.empty(n_frames, dtype=np.int8)
+            idxs = np.empty(n_frames, dtype=np.int32)
+            for frame in range(n_frames):
+                half, idx, _ = get_frame_data_func(frame)
+                if half not in names:
+                    names.append(half)
+                codes[frame] = names.index(half)
+                idxs[frame] = idx
+            index = self._frame_index = (n_frames, get_frame_data_func, names, codes, idxs)
+        return index[2:]
+
     def calculate_future_trajectories(self, current_frame, interval_seconds, xy_objects, 
                                     home_ids, away_ids, n_frames, get_frame_data_func):
         """Compute future positions for players/ball for the given interval.
@@ -63,11 +293,14 @@ class TrajectoryManager:
         Notes
         -----
         Uses a sampling step (``CONFIG.TRAJECTORY_SAMPLE_RATE``) and caches
-        results for the same (frame, interval) pair to avoid recomputation.
+        results for the same (frame, interval) pair and the same data objects
+        to avoid recomputation.
         """
-        # Optimization: cache to avoid recomputing for the same (frame, interval)
+        # Optimization: cache to avoid recomputing for the same (frame, interval) and data
+        cache_token = (id(xy_objects), id(home_ids), id(away_ids), n_frames)
         if (self.cached_frame == current_frame and 
             self.cached_interval == interval_seconds and 
+            self._cache_token == cache_token and
             self.future_trajectories):
             return
         
@@ -76,43 +309,53 @@ class TrajectoryManager:
         
         self.future_trajectories = {
             'players': {'Home': {}, 'Away': {}},
-            'ball': []
+            'ball': _trajectory_arrays(np.empty((0, 2)), np.empty(0))
         }
         
         # Optimization: sample to reduce the number of points drawn
         sample_step = TRAJECTORY_SAMPLE_RATE
         
-        for frame in range(current_frame, end_frame + 1, sample_step):
-            half, idx, _ = get_frame_data_func(frame)
-            progress = (frame - current_frame) / max(1, future_frames)
-            
-            # Players
-            for side, ids in [("Home", home_ids), ("Away", away_ids)]:
+        # Frames increase, so each half is one contiguous run of rows shared by
+        # the home, away and ball gathers
+        frames = np.arange(current_frame, end_frame + 1, sample_step)
+        half_names, half_codes, half_idxs = self._frame_lookup(n_frames, get_frame_data_func)
+        codes = half_codes[frames]
+        idxs = half_idxs[frames]
+        bounds = np.concatenate(([0], np.flatnonzero(np.diff(codes)) + 1, [len(frames)])).tolist()
+        runs = [(half_names[codes[start]], slice(start, stop)) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+        
+        def gather(obj_key, n_objects):
+            """(F, n_objects, 2) float32 positions for every sampled frame; NaN where unavailable."""
+            out = np.full((len(frames), n_objects, 2), np.nan, dtype=np.float32)
+            for half, rows in runs:
                 try:
-                    xy = xy_objects[half][side].xy[idx]
-                    for i, pid in enumerate(ids):
-                        if 2*i+1 < len(xy):  # Bounds check
-                            x, y = xy[2*i], xy[2*i+1]
-                            if not np.isnan(x) and not np.isnan(y):
-                                if pid not in self.future_trajectories['players'][side]:
-                                    self.future_trajectories['players'][side][pid] = []
-                                # Also store the frame for comparison against current_frame
-                                self.future_trajectories['players'][side][pid].append((x, y, progress, frame))
-                except (IndexError, KeyError):
+                    slab = xy_objects[half][obj_key].xy
+                except KeyError:
                     continue
-            
-            # Ball
-            try:
-                ball_xy = xy_objects[half]["Ball"].xy[idx]
-                if len(ball_xy) >= 2 and not np.isnan(ball_xy[0]):
-                    # Also store the frame for the ball
-                    self.future_trajectories['ball'].append((ball_xy[0], ball_xy[1], progress, frame))
-            except (IndexError, KeyError):
-                continue
+                run_idxs = idxs[rows]
+                in_range = run_idxs < len(slab)
+                n = min(n_objects, slab.shape[1] // 2)  # Bounds check
+                out[rows][in_range, :n] = slab[run_idxs[in_range], :2*n].reshape(-1, n, 2)
+            return out
+        
+        # Players: keep the samples where both coordinates are known
+        for side, ids in [("Home", home_ids), ("Away", away_ids)]:
+            xy = gather(side, len(ids))
+            valid = ~np.isnan(xy).any(axis=2)
+            for i, pid in enumerate(ids):
+                rows = valid[:, i]
+                if rows.any():
+                    self.future_trajectories['players'][side][pid] = _trajectory_arrays(xy[rows, i], frames[rows])
+        
+        # Ball
+        ball_xy = gather("Ball", 1)[:, 0]
+        rows = ~np.isnan(ball_xy[:, 0])
+        self.future_trajectories['ball'] = _trajectory_arrays(ball_xy[rows], frames[rows])
         
         # Update cache
         self.cached_frame = current_frame
         self.cached_interval = interval_seconds
+        self._cache_token = cache_token
     
     def draw_future_trajectories(self, show_players=True, show_ball=True, current_frame=None, 
                                loop_start=None, loop_end=None, interval_seconds=10.0, ball_color=BALL_COLOR):
@@ -137,103 +380,71 @@ class TrajectoryManager:
         fade_frames_ball = int(interval_seconds * FPS)     # same for the ball
         
         if show_players:
+            # Runs of equal (stepped) alpha per player; they only change when the
+            # playback crosses a sample or a fade step
+            trails = []
             for side, players in self.future_trajectories.get('players', {}).items():
-                for pid, positions in players.items():
+                for pid, trajectory in players.items():
                     base_color = self.home_colors[pid][0] if side == "Home" else self.away_colors[pid][0]
-                    if len(positions) > 1:
-                        sampled_positions = positions[::2]
+                    if len(trajectory['frame']) > 1:
+                        xy = trajectory['xy'][::2]
+                        frames = trajectory['frame'][::2]
                         
-                        for i in range(len(sampled_positions) - 1):
-                            x1, y1, p1, frame1 = sampled_positions[i]
-                            x2, y2, p2, frame2 = sampled_positions[i+1]
-                            
-                            # Draw only if this segment hasn't been passed yet
-                            if current_frame is not None and current_frame > frame1:
-                                continue
-                            
-                            # Inverted alpha logic
-                            color = QColor(base_color)
-                            
-                            if current_frame is not None:
-                                frames_until_segment = frame1 - current_frame
-                                
-                                # Closer segments are more opaque (~1.0)
-                                # Farther segments are more transparent (~0.2)
-                                distance_factor = frames_until_segment / fade_frames_players
-                                # Inverted mapping: near -> opaque, far -> transparent
-                                final_alpha = max(0.2, 1.0 - distance_factor * 0.8)
-                            else:
-                                final_alpha = 0.8
-                            
-                            color.setAlphaF(final_alpha)
-                            
-                            # Very thin dashed line
-                            pen = QPen(color, CONFIG.TRAJECTORY_PLAYER_LINE_WIDTH)
-                            pen.setStyle(Qt.PenStyle.CustomDashLine)
-                            pen.setDashPattern([1, 4])
-                            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-                            
-                            line = self.pitch_widget.scene.addLine(x1, y1, x2, y2, pen)
-                            line.setZValue(8)
-                            self.pitch_widget.dynamic_items.append(line)
+                        # Only segments not passed yet; closer ones more opaque (~1.0), farther ~0.2
+                        segments, alphas = _segment_alphas(frames, current_frame, fade_frames_players, 0.2, 0.8, 0.8)
+                        if len(segments):
+                            trails.append((base_color, xy, _alpha_runs(segments, alphas, TRAJECTORY_ALPHA_LEVELS)))
+            
+            if trails:
+                width = CONFIG.TRAJECTORY_PLAYER_LINE_WIDTH
+                signature = (
+                    self._cache_token, self.cached_frame, self.cached_interval, width,
+                    tuple((base_color, tuple(runs)) for base_color, _, runs in trails),
+                )
+                group = self.pitch_widget.persistent_item(("trajectory", "future_players"), self._new_trail_group)
+                if signature != self._future_trail_signature:
+                    # Update the existing path items in place; only grow the pool when needed
+                    items = self._future_trail_items
+                    n_used = 0
+                    for base_color, xy, runs in trails:
+                        for first, last, final_alpha in runs:
+                            if n_used == len(items):
+                                item = QGraphicsPathItem()
+                                # Unchanged trails repaint from a device-resolution pixmap
+                                item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+                                group.addToGroup(item)
+                                items.append(item)
+                            item = items[n_used]
+                            # Very thin dashed line, one polyline per run
+                            item.setPath(_polyline_path(xy[first:last + 1]))
+                            item.setPen(self._cached_pen(base_color, final_alpha, width, Qt.PenStyle.CustomDashLine))
+                            item.setVisible(True)
+                            n_used += 1
+                    for item in items[n_used:]:
+                        item.setVisible(False)
+                    self._future_trail_signature = signature
         
         if show_ball:
-            ball_positions = self.future_trajectories.get('ball', [])
-            if len(ball_positions) > 1:
-                sampled_ball_positions = ball_positions[::2]
+            ball = self.future_trajectories.get('ball')
+            if ball is not None and len(ball['frame']) > 1:
+                xy = ball['xy'][::2]
+                frames = ball['frame'][::2]
                 
-                for i in range(len(sampled_ball_positions) - 1):
-                    x1, y1, p1, frame1 = sampled_ball_positions[i]
-                    x2, y2, p2, frame2 = sampled_ball_positions[i+1]
-                    
-                    # Same logic for the ball: only draw future segments
-                    if current_frame is not None and current_frame > frame1:
-                        continue
-                    
-                    # Same inverted alpha logic for the ball
-                    color = QColor(ball_color)
-                    
-                    if current_frame is not None:
-                        frames_until_segment = frame1 - current_frame
-                        
-                        # Closer segments are more opaque (~1.0)
-                        # Farther segments are more transparent (~0.3)
-                        distance_factor = frames_until_segment / fade_frames_ball
-                        # Inverted mapping: near -> opaque, far -> transparent
-                        final_alpha = max(0.3, 1.0 - distance_factor * 0.7)
-                    else:
-                        final_alpha = 0.9
-                    
-                    color.setAlphaF(final_alpha)
-                    
-                    pen = QPen(color, CONFIG.TRAJECTORY_BALL_LINE_WIDTH)
-                    pen.setStyle(TRAJECTORY_STYLE)
-                    pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-                    
-                    line = self.pitch_widget.scene.addLine(x1, y1, x2, y2, pen)
-                    line.setZValue(95)
-                    self.pitch_widget.dynamic_items.append(line)
+                # Same logic for the ball: only future segments, fading down to ~0.3
+                segments, alphas = _segment_alphas(frames, current_frame, fade_frames_ball, 0.3, 0.7, 0.9)
+                if len(segments):
+                    self._add_trail_paths(xy, _alpha_runs(segments, alphas, TRAJECTORY_ALPHA_LEVELS),
+                                          ball_color, CONFIG.TRAJECTORY_BALL_LINE_WIDTH, TRAJECTORY_STYLE, 95)
                 
                 # Final position - always fully opaque and visible until reached
-                if ball_positions:
-                    final_x, final_y, final_progress, final_frame = ball_positions[-1]
-                    
-                    # Draw while the final position hasn't been reached yet
-                    if current_frame is None or current_frame < final_frame:
-                        # Slightly larger radius and full circle
-                        final_radius = CONFIG.BALL_RADIUS * 1.2  # ~20% bigger than normal ball
-                        pen_color = QColor(ball_color)
-                        pen_color.setAlphaF(1.0)  # always fully opaque
-                        
-                        # Solid ring (not dashed) with a thin outline
-                        final_ball = self.pitch_widget.scene.addEllipse(
-                            final_x - final_radius, final_y - final_radius,
-                            final_radius * 2, final_radius * 2,
-                            QPen(pen_color, 0.4, Qt.PenStyle.SolidLine),
-                            QBrush(Qt.BrushStyle.NoBrush)
-                        )
-                        final_ball.setZValue(96)
-                        self.pitch_widget.dynamic_items.append(final_ball)
+                final_x, final_y = ball['xy'][-1]
+                final_frame = ball['frame'][-1]
+                
+                # Draw while the final position hasn't been reached yet
+                if current_frame is None or current_frame < final_frame:
+                    # Slightly larger (~20%) solid ring with a thin, fully opaque outline
+                    self._final_ball_marker("future_final_ball", final_x, final_y,
+                                            CONFIG.BALL_RADIUS * 1.2, ball_color, 0.4, 96)
 
     def draw_simulated_trajectories(self, simulated_data, current_frame, loop_start, loop_end, ball_color=BALL_COLOR):
         """Draw simulated trajectories on top of the real ones.
@@ -252,6 +463,9 @@ class TrajectoryManager:
         if not simulated_data:
             return
         
+        # Opacity fades over the loop, closer segments more opaque
+        total_frames = loop_end - loop_start if current_frame is not None else 0
+        
         # Draw simulated player trajectories
         players_data = simulated_data.get('players', {})
         for player_id, positions in players_data.items():
@@ -260,93 +474,29 @@ class TrajectoryManager:
                 side = "Home" if player_id in self.home_colors else "Away"
                 base_color = self.home_colors.get(player_id, ["#FF0000"])[0] if side == "Home" else self.away_colors.get(player_id, ["#0000FF"])[0]
                 
-                # Draw segments with progressive fading
-                for i in range(len(positions) - 1):
-                    x1, y1, frame1 = positions[i]
-                    x2, y2, frame2 = positions[i + 1]
-                    
-                    # Only draw future segments
-                    if current_frame is not None and current_frame > frame1:
-                        continue
-                    
-                    # Compute opacity based on temporal distance
-                    color = QColor(base_color)
-                    if current_frame is not None:
-                        frames_until_segment = frame1 - current_frame
-                        total_frames = loop_end - loop_start
-                        
-                        if total_frames > 0:
-                            distance_factor = frames_until_segment / total_frames
-                            # Closer -> more opaque
-                            final_alpha = max(0.4, 1.0 - distance_factor * 0.6)
-                        else:
-                            final_alpha = 0.9
-                    else:
-                        final_alpha = 0.9
-                    
-                    color.setAlphaF(final_alpha)
-                    
-                    # Thicker solid line for simulated path
-                    pen = QPen(color, CONFIG.TRAJECTORY_PLAYER_LINE_WIDTH * 2)
-                    pen.setStyle(Qt.PenStyle.SolidLine)
-                    pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-                    
-                    line = self.pitch_widget.scene.addLine(x1, y1, x2, y2, pen)
-                    line.setZValue(15)  # Above real trajectories
-                    self.pitch_widget.dynamic_items.append(line)
+                # Only future segments, alphas computed for all of them at once
+                segments, alphas = _segment_alphas(positions[:, 2], current_frame, total_frames, 0.4, 0.6, 0.9)
+                if len(segments):
+                    # Thicker solid line for simulated path, above real trajectories
+                    self._add_trail_paths(positions[:, :2], _alpha_runs(segments, alphas, TRAJECTORY_ALPHA_LEVELS),
+                                          base_color, CONFIG.TRAJECTORY_PLAYER_LINE_WIDTH * 2,
+                                          Qt.PenStyle.SolidLine, 15)
         
         # Draw simulated ball trajectory
         ball_positions = simulated_data.get('ball', [])
         if len(ball_positions) > 1:
-            for i in range(len(ball_positions) - 1):
-                x1, y1, frame1 = ball_positions[i]
-                x2, y2, frame2 = ball_positions[i + 1]
-                
-                # Only draw future segments
-                if current_frame is not None and current_frame > frame1:
-                    continue
-                
-                # Compute opacity for the ball
-                color = QColor(BALL_COLOR)
-                if current_frame is not None:
-                    frames_until_segment = frame1 - current_frame
-                    total_frames = loop_end - loop_start
-                    
-                    if total_frames > 0:
-                        distance_factor = frames_until_segment / total_frames
-                        # Closer -> more opaque
-                        final_alpha = max(0.5, 1.0 - distance_factor * 0.5)
-                    else:
-                        final_alpha = 1.0
-                else:
-                    final_alpha = 1.0
-                
-                color.setAlphaF(final_alpha)
-                
-                # Thicker line for the simulated ball
-                pen = QPen(color, CONFIG.TRAJECTORY_BALL_LINE_WIDTH * 2)
-                pen.setStyle(Qt.PenStyle.SolidLine)
-                pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-                
-                line = self.pitch_widget.scene.addLine(x1, y1, x2, y2, pen)
-                line.setZValue(98)  # Above real ball trajectories
-                self.pitch_widget.dynamic_items.append(line)
+            segments, alphas = _segment_alphas(ball_positions[:, 2], current_frame, total_frames, 0.5, 0.5, 1.0)
+            if len(segments):
+                # Thicker line for the simulated ball, one polyline per alpha step,
+                # above real ball trajectories
+                self._add_trail_paths(ball_positions[:, :2], _alpha_runs(segments, alphas, TRAJECTORY_ALPHA_LEVELS),
+                                      BALL_COLOR, CONFIG.TRAJECTORY_BALL_LINE_WIDTH * 2, Qt.PenStyle.SolidLine, 98)
             
             # Final simulated ball position
-            if ball_positions:
+            if len(ball_positions):
                 final_x, final_y, final_frame = ball_positions[-1]
                 
                 if current_frame is None or current_frame < final_frame:
-                    final_radius = CONFIG.BALL_RADIUS * 1.3
-                    pen_color = QColor(ball_color)
-                    pen_color.setAlphaF(1.0)
-                    
                     # Destination ring
-                    final_ball = self.pitch_widget.scene.addEllipse(
-                        final_x - final_radius, final_y - final_radius,
-                        final_radius * 2, final_radius * 2,
-                        QPen(pen_color, 0.6, Qt.PenStyle.SolidLine),
-                        QBrush(Qt.BrushStyle.NoBrush)
-                    )
-                    final_ball.setZValue(99)
-                    self.pitch_widget.dynamic_items.append(final_ball)
+                    self._final_ball_marker("simulated_final_ball", final_x, final_y,
+                                            CONFIG.BALL_RADIUS * 1.3, ball_color, 0.6, 99)
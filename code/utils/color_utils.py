@@ -5,21 +5,53 @@ Color utility functions for theme generation and accessibility checks.
 Includes helpers to:
 - Parse hex colors and convert to RGB
 - Compute relative luminance and WCAG contrast ratio
-- Convert between hex, Lab, and LCH color spaces
+- Convert between hex, Lab, and LCH color spaces (single colors or batches)
 - Compute Delta E (CIEDE2000) using colormath
 
 These utilities are used by `theme_manager.py` to ensure distinct and
 accessible colors for pitch, lines, offside, and arrows.
+
+Conversions and contrast checks are pure functions of hex strings and are
+memoized: themes keep asking about the same handful of colors.
 """
 import re
+from functools import lru_cache
 from typing import Tuple
+import numpy as np
 from colormath import color_diff_matrix
 from colormath.color_diff import _get_lab_color1_vector, _get_lab_color2_matrix
-from colormath.color_objects import sRGBColor, LabColor, LCHabColor
-from colormath.color_conversions import convert_color
+from colormath.color_objects import sRGBColor, LabColor
+from colormath.color_constants import ILLUMINANTS, CIE_E
+from colormath.chromatic_adaptation import _get_adaptation_matrix
 
 HEX_RE = re.compile(r'^#?([0-9a-fA-F]{6})$')
 
+# Same constants colormath's convert_color uses: sRGB converts through D65
+# XYZ, while a bare LCHabColor is D50 and is Bradford-adapted back to D65.
+_RGB_TO_XYZ = sRGBColor.conversion_matrices["rgb_to_xyz"]
+_XYZ_TO_RGB = sRGBColor.conversion_matrices["xyz_to_rgb"]
+_WHITE_D65 = np.array(ILLUMINANTS['2']['d65'])
+_WHITE_D50 = np.array(ILLUMINANTS['2']['d50'])
+_D50_TO_D65 = _get_adaptation_matrix('d50', 'd65', '2', 'bradford')
+
+def _rgb_to_lab(rgb):
+    """(N, 3) sRGB in [0, 1] -> (N, 3) Lab (D65)."""
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    xyz = np.maximum(linear @ _RGB_TO_XYZ.T, 0.0) / _WHITE_D65
+    f = np.where(xyz > CIE_E, xyz ** (1.0 / 3.0), 7.787 * xyz + 16.0 / 116.0)
+    return np.column_stack((116.0 * f[:, 1] - 16.0, 500.0 * (f[:, 0] - f[:, 1]), 200.0 * (f[:, 1] - f[:, 2])))
+
+def _lab_to_lch(lab):
+    """(N, 3) Lab -> (N, 3) LCHab, hue in (0, 360] degrees."""
+    h = np.arctan2(lab[:, 2], lab[:, 1])
+    h = np.where(h > 0, h / np.pi * 180, 360 - np.abs(h) / np.pi * 180)
+    return np.column_stack((lab[:, 0], np.hypot(lab[:, 1], lab[:, 2]), h))
+
+def _hexes_to_rgb(hexes):
+    """(N, 3) sRGB in [0, 1] for a sequence of hex strings."""
+    return np.array([hex_to_rgb(h) for h in hexes], dtype=float).reshape(-1, 3)
+
+@lru_cache(maxsize=1024)
 def hex_to_rgb(hexstr: str) -> Tuple[float, float, float]:
     """Convert a hex color string to normalized RGB tuple.
 
@@ -41,9 +73,10 @@ def hex_to_rgb(hexstr: str) -> Tuple[float, float, float]:
     m = HEX_RE.match(hexstr)
     if not m:
         raise ValueError(f"Invalid hex color: {hexstr}")
-    h = m.group(1)
-    return tuple(int(h[i:i+2], 16)/255.0 for i in (0, 2, 4))
+    v = int(m.group(1), 16)
+    return ((v >> 16) & 0xFF) / 255.0, ((v >> 8) & 0xFF) / 255.0, (v & 0xFF) / 255.0
 
+@lru_cache(maxsize=1024)
 def relative_luminance(rgb: Tuple[float, float, float]) -> float:
     """Compute relative luminance per WCAG for an sRGB triple.
 
@@ -62,6 +95,12 @@ def relative_luminance(rgb: Tuple[float, float, float]) -> float:
     Rl, Gl, Bl = (lin(c) for c in rgb)
     return 0.2126*Rl + 0.7152*Gl + 0.0722*Bl
 
+@lru_cache(maxsize=1024)
+def _hex_luminance(hexstr):
+    """Relative luminance of a hex color, one entry per color."""
+    return relative_luminance(hex_to_rgb(hexstr))
+
+@lru_cache(maxsize=4096)
 def contrast_ratio(c1: str, c2: str) -> float:
     """Compute the WCAG contrast ratio between two hex colors.
 
@@ -75,10 +114,11 @@ def contrast_ratio(c1: str, c2: str) -> float:
     float
         Contrast ratio in [1, 21].
     """
-    L1 = relative_luminance(hex_to_rgb(c1))
-    L2 = relative_luminance(hex_to_rgb(c2))
-    return (max(L1, L2) + 0.05) / (min(L1, L2) + 0.05)
+    L1, L2 = _hex_luminance(c1), _hex_luminance(c2)
+    hi, lo = (L1, L2) if L1 >= L2 else (L2, L1)
+    return (hi + 0.05) / (lo + 0.05)
 
+@lru_cache(maxsize=1024)
 def hex_to_lab(hexstr: str) -> Tuple[float, float, float]:
     """Convert a hex color to CIE Lab.
 
@@ -92,9 +132,22 @@ def hex_to_lab(hexstr: str) -> Tuple[float, float, float]:
     tuple[float, float, float]
         (L, a, b) triple.
     """
-    rgb = sRGBColor(*hex_to_rgb(hexstr), is_upscaled=False)
-    lab: LabColor = convert_color(rgb, LabColor)
-    return (lab.lab_l, lab.lab_a, lab.lab_b)
+    return tuple(_rgb_to_lab(_hexes_to_rgb((hexstr,)))[0].tolist())
+
+def hexes_to_lab(hexes) -> np.ndarray:
+    """Convert many hex colors to CIE Lab at once.
+
+    Parameters
+    ----------
+    hexes : sequence of str
+        Hex color strings.
+
+    Returns
+    -------
+    numpy.ndarray
+        (N, 3) array of (L, a, b) rows, matching :func:`hex_to_lab`.
+    """
+    return _rgb_to_lab(_hexes_to_rgb(hexes))
 
 def delta_e_lab(lab1, lab2) -> float:
     """Compute CIEDE2000 ΔE between two Lab colors.
@@ -140,6 +193,78 @@ def delta_e_cie2000_patched(color1, color2, Kl=1, Kc=1, Kh=1):
 
     return delta_e.item()
 
+def _delta_e_cie2000(lab1, lab2, Kl=1, Kc=1, Kh=1):
+    """CIEDE2000 between broadcastable (..., 3) Lab arrays.
+
+    Same formula, term for term, as colormath's `color_diff_matrix.delta_e_cie2000`,
+    which only takes one color against a matrix.
+    """
+    L1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    L2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+
+    avg_Lp = (L1 + L2) / 2.0
+    avg_C1_C2 = (np.hypot(a1, b1) + np.hypot(a2, b2)) / 2.0
+    G = 0.5 * (1 - np.sqrt(avg_C1_C2 ** 7.0 / (avg_C1_C2 ** 7.0 + 25.0 ** 7.0)))
+
+    a1p = (1.0 + G) * a1
+    a2p = (1.0 + G) * a2
+    C1p = np.sqrt(a1p ** 2 + b1 ** 2)
+    C2p = np.sqrt(a2p ** 2 + b2 ** 2)
+    avg_C1p_C2p = (C1p + C2p) / 2.0
+
+    h1p = np.degrees(np.arctan2(b1, a1p))
+    h1p = h1p + (h1p < 0) * 360
+    h2p = np.degrees(np.arctan2(b2, a2p))
+    h2p = h2p + (h2p < 0) * 360
+    avg_Hp = (((np.fabs(h1p - h2p) > 180) * 360) + h1p + h2p) / 2.0
+
+    T = (1 - 0.17 * np.cos(np.radians(avg_Hp - 30))
+         + 0.24 * np.cos(np.radians(2 * avg_Hp))
+         + 0.32 * np.cos(np.radians(3 * avg_Hp + 6))
+         - 0.2 * np.cos(np.radians(4 * avg_Hp - 63)))
+
+    diff_h2p_h1p = h2p - h1p
+    delta_hp = diff_h2p_h1p + (np.fabs(diff_h2p_h1p) > 180) * 360 - (h2p > h1p) * 720
+
+    delta_Lp = L2 - L1
+    delta_Cp = C2p - C1p
+    delta_Hp = 2 * np.sqrt(C2p * C1p) * np.sin(np.radians(delta_hp) / 2.0)
+
+    S_L = 1 + ((0.015 * (avg_Lp - 50) ** 2) / np.sqrt(20 + (avg_Lp - 50) ** 2.0))
+    S_C = 1 + 0.045 * avg_C1p_C2p
+    S_H = 1 + 0.015 * avg_C1p_C2p * T
+
+    delta_ro = 30 * np.exp(-(((avg_Hp - 275) / 25) ** 2.0))
+    R_C = np.sqrt(avg_C1p_C2p ** 7.0 / (avg_C1p_C2p ** 7.0 + 25.0 ** 7.0))
+    R_T = -2 * R_C * np.sin(2 * np.radians(delta_ro))
+
+    dL = delta_Lp / (S_L * Kl)
+    dC = delta_Cp / (S_C * Kc)
+    dH = delta_Hp / (S_H * Kh)
+    return np.sqrt(dL ** 2 + dC ** 2 + dH ** 2 + R_T * dC * dH)
+
+def delta_e_lab_matrix(lab, lab_matrix, Kl=1, Kc=1, Kh=1) -> np.ndarray:
+    """Compute CIEDE2000 ΔE between Lab colors and many others at once.
+
+    Parameters
+    ----------
+    lab : array-like
+        (3,) Lab color, or (N, 3) Lab colors.
+    lab_matrix : numpy.ndarray
+        (M, 3) array of Lab colors to compare against.
+    Kl, Kc, Kh : float, default 1
+        Weighting factors.
+
+    Returns
+    -------
+    numpy.ndarray
+        (M,) ΔE00 values for a single color, (N, M) for N colors; each entry
+        matches :func:`delta_e_lab` for that pair.
+    """
+    lab = np.asarray(lab, dtype=float)
+    return _delta_e_cie2000(lab[..., None, :], np.asarray(lab_matrix, dtype=float), Kl=Kl, Kc=Kc, Kh=Kh)
+
+@lru_cache(maxsize=1024)
 def hex_to_lch(hexstr: str) -> Tuple[float, float, float]:
     """Convert a hex color to CIE LCHab.
 
@@ -153,10 +278,22 @@ def hex_to_lch(hexstr: str) -> Tuple[float, float, float]:
     tuple[float, float, float]
         (L, C, H) triple.
     """
-    rgb = sRGBColor(*hex_to_rgb(hexstr), is_upscaled=False)
-    lab = convert_color(rgb, LabColor)
-    lch: LCHabColor = convert_color(lab, LCHabColor)
-    return (lch.lch_l, lch.lch_c, lch.lch_h)
+    return tuple(_lab_to_lch(_rgb_to_lab(_hexes_to_rgb((hexstr,))))[0].tolist())
+
+def hexes_to_lch(hexes) -> np.ndarray:
+    """Convert many hex colors to CIE LCHab at once.
+
+    Parameters
+    ----------
+    hexes : sequence of str
+        Hex color strings.
+
+    Returns
+    -------
+    numpy.ndarray
+        (N, 3) array of (L, C, H) rows, matching :func:`hex_to_lch`.
+    """
+    return _lab_to_lch(_rgb_to_lab(_hexes_to_rgb(hexes)))
 
 def lch_to_hex(l: float, c: float, h: float) -> str | None:
     """Convert LCHab to a hex string if in gamut; return None otherwise.
@@ -171,10 +308,31 @@ def lch_to_hex(l: float, c: float, h: float) -> str | None:
     str | None
         Hex color string or None if outside sRGB gamut.
     """
-    lch = LCHabColor(l, c, h)
-    rgb = convert_color(lch, sRGBColor)
-    hex_code = rgb.get_rgb_hex()
-    # Validity check
-    if isinstance(hex_code, str) and HEX_RE.fullmatch(hex_code):
-        return hex_code
-    return None
+    return lch_to_hexes(np.array([[l, c, h]], dtype=float))[0]
+
+def lch_to_hexes(lch) -> list:
+    """Convert many LCHab colors to hex strings at once.
+
+    Parameters
+    ----------
+    lch : array-like
+        (N, 3) LCHab rows (D50, like a bare colormath LCHabColor).
+
+    Returns
+    -------
+    list[str | None]
+        Hex color per row, None where the color is outside the sRGB gamut.
+    """
+    lch = np.asarray(lch, dtype=float).reshape(-1, 3)
+    hue = np.radians(lch[:, 2])
+    fy = (lch[:, 0] + 16.0) / 116.0
+    f = np.column_stack((np.cos(hue) * lch[:, 1] / 500.0 + fy, fy, fy - np.sin(hue) * lch[:, 1] / 200.0))
+    xyz = np.where(f ** 3 > CIE_E, f ** 3, (f - 16.0 / 116.0) / 7.787) * _WHITE_D50
+    # Linear channels are clamped at 0 (as colormath does), so only an
+    # overflow above 255 puts a color out of gamut
+    linear = np.maximum(xyz @ _D50_TO_D65.T @ _XYZ_TO_RGB.T, 0.0)
+    rgb = np.where(linear <= 0.0031308, linear * 12.92, 1.055 * linear ** (1 / 2.4) - 0.055)
+    rgb255 = np.floor(0.5 + rgb * 255).astype(int)
+    in_gamut = (rgb255 <= 255).all(axis=1)
+    return ['#%02x%02x%02x' % tuple(row) if ok else None
+            for row, ok in zip(rgb255.tolist(), in_gamut.tolist())]
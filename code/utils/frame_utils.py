@@ -6,16 +6,22 @@ This module provides helpers to:
 - Convert between global frame indices and half-relative indices
 - Convert between time (minutes/seconds) and frames
 - Compute interval bounds around a given frame
-- Navigate to the next/previous action by frame
+- Precompute the match clock label of every frame
+- Navigate to the next/previous action (or the k nearest ones) by frame
 - Inspect ball possession at a given frame or compute simple possession stats
 
 All time-to-frame conversions use the global FPS configured in `config.FPS`.
 """
 # frame_utils.py
 
+import heapq
+from operator import itemgetter
 import numpy as np
 from config import FPS
 
+# Possession code -> team; any other code (0, NaN) means no possession
+_POSSESSION_TEAMS = {1: "Home", 2: "Away"}
+
 
 class FrameManager:
     """Manage conversions and navigation between frames.
@@ -40,6 +46,7 @@ class FrameManager:
         self.n_frames_firstHalf = n_frames_firstHalf
         self.n_frames_secondHalf = n_frames_secondHalf
         self.n_frames_total = n_frames_total
+        self.clock_labels = None  # match clock string per global frame, see build_clock_labels
         
     def get_frame_data(self, frame_number):
         """Return (half, frame_idx, half_label) for a given global frame.
@@ -78,13 +85,37 @@ class FrameManager:
             
         return min(frame, self.n_frames_total - 1)
     
+    def build_clock_labels(self):
+        """Format the match clock of every frame once and keep it for lookups.
+
+        Returns
+        - list[str]: `format_match_time` output for each global frame.
+        """
+        # Imported here: data_processing pulls in floodlight and scipy
+        from data_processing import format_match_time_array
+        self.clock_labels = format_match_time_array(
+            np.arange(self.n_frames_total), self.n_frames_firstHalf, self.n_frames_secondHalf, fps=FPS
+        )
+        return self.clock_labels
+
+    def clock_label(self, frame_number):
+        """Return the match clock string ("MM:SS", or added time) for a global frame."""
+        if self.clock_labels is not None and 0 <= frame_number < len(self.clock_labels):
+            return self.clock_labels[frame_number]
+        from data_processing import format_match_time
+        return format_match_time(frame_number, self.n_frames_firstHalf, self.n_frames_secondHalf, fps=FPS)
+
     def frame_to_time(self, frame_number):
         """Convert a global frame index to (minutes, seconds, half).
 
         Returns
         - tuple[int, int, str]: (minutes, seconds, half)
         """
-        half, idx, _ = self.get_frame_data(frame_number)
+        # Same split as get_frame_data, without building the unused label
+        if frame_number < self.n_frames_firstHalf:
+            half, idx = "firstHalf", frame_number
+        else:
+            half, idx = "secondHalf", frame_number - self.n_frames_firstHalf
         
         total_seconds = idx / FPS
         minutes = int(total_seconds // 60)
@@ -100,9 +131,9 @@ class FrameManager:
         Returns
         - tuple[int, int]: (start_frame, end_frame)
         """
-        interval_frames = int(interval_seconds * FPS)
-        start = max(0, center_frame - interval_frames // 2)
-        end = min(self.n_frames_total - 1, center_frame + interval_frames // 2)
+        half_width = int(interval_seconds * FPS) // 2
+        start = max(0, center_frame - half_width)
+        end = min(self.n_frames_total - 1, center_frame + half_width)
         return start, end
     
     def jump_to_next_action(self, current_frame, actions, direction=1):
@@ -118,14 +149,31 @@ class FrameManager:
         Returns
         - int | None: The target action frame or None if not found.
         """
-        actions_sorted = sorted(actions, key=lambda x: x['frame'])
-        
+        # Only the nearest neighbour is needed: one linear pass, no sort
         if direction > 0:  # Next
-            next_actions = [a for a in actions_sorted if a['frame'] > current_frame]
-            return next_actions[0]['frame'] if next_actions else None
+            return min((a['frame'] for a in actions if a['frame'] > current_frame), default=None)
         else:  # Previous
-            prev_actions = [a for a in actions_sorted if a['frame'] < current_frame]
-            return prev_actions[-1]['frame'] if prev_actions else None
+            return max((a['frame'] for a in actions if a['frame'] < current_frame), default=None)
+
+    def nearest_actions(self, current_frame, actions, k=5, direction=1):
+        """Return the `k` actions closest to the current frame in one direction.
+
+        Parameters
+        - current_frame: int
+        - actions: list[dict]
+            List of actions, each with a 'frame' field.
+        - k: int
+            Maximum number of actions to return.
+        - direction: int
+            +1 for upcoming actions, -1 for previous ones.
+
+        Returns
+        - list[dict]: Up to `k` actions, nearest first.
+        """
+        # Bounded heap over the filtered actions: O(n log k), no full sort
+        if direction > 0:
+            return heapq.nsmallest(k, (a for a in actions if a['frame'] > current_frame), key=itemgetter('frame'))
+        return heapq.nlargest(k, (a for a in actions if a['frame'] < current_frame), key=itemgetter('frame'))
 
 
 class PossessionTracker:
@@ -149,8 +197,7 @@ class PossessionTracker:
         Returns
         - str | None: "Home", "Away", or None if no possession.
         """
-        poss_val = possession[half].code[frame_idx]
-        return {1: "Home", 2: "Away"}.get(poss_val, None)
+        return _POSSESSION_TEAMS.get(possession[half].code[frame_idx])
     
     @staticmethod
     def get_possession_stats(possession, half):
@@ -160,9 +207,15 @@ class PossessionTracker:
         - dict[str, float]: {"Home": pct, "Away": pct}
         """
         codes = possession[half].code
-        home_frames = np.sum(codes == 1)
-        away_frames = np.sum(codes == 2)
         total = len(codes)
+        try:
+            # Integer codes: one counting pass, no boolean temporaries
+            counts = np.bincount(codes, minlength=3)
+            home_frames, away_frames = counts[1], counts[2]
+        except (TypeError, ValueError):
+            # Float codes (possibly NaN) or negative sentinels
+            home_frames = np.count_nonzero(codes == 1)
+            away_frames = np.count_nonzero(codes == 2)
         
         return {
             "Home": (home_frames / total * 100) if total > 0 else 0,